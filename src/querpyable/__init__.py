@@ -1,5 +1,24 @@
 """A Python implementation of LINQ."""
 
-from querpyable.querpyable import Queryable
+from querpyable.aggregates import Fold
+from querpyable.async_queryable import AsyncOrderedQueryable, AsyncQueryable
+from querpyable.lookup import Lookup
+from querpyable.querpyable import ColumnarQueryable, OrderedQueryable, Queryable
+from querpyable.sketches import BloomFilter, CountMinSketch, HyperLogLog, SpaceSaving, TDigest
+from querpyable.vectorized import ArrayQueryable
 
-__all__ = ["Queryable"]
+__all__ = [
+    "ArrayQueryable",
+    "AsyncOrderedQueryable",
+    "AsyncQueryable",
+    "BloomFilter",
+    "ColumnarQueryable",
+    "CountMinSketch",
+    "Fold",
+    "HyperLogLog",
+    "Lookup",
+    "OrderedQueryable",
+    "Queryable",
+    "SpaceSaving",
+    "TDigest",
+]
@@ -0,0 +1,172 @@
+"""Computation of several aggregates in a single pass."""
+
+import math
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional, Union
+
+
+class Fold(NamedTuple):
+    """A user-supplied aggregate, folding the elements into an accumulator.
+
+    Attributes:
+        seed (Any): The initial value of the accumulator.
+        func (Callable[[Any, Any], Any]): A function combining the accumulator with the next
+            element.
+        result (Optional[Callable[[Any], Any]]): An optional function mapping the final value of
+            the accumulator to the result.
+    """
+
+    seed: Any
+    func: Callable[[Any, Any], Any]
+    result: Optional[Callable[[Any], Any]] = None
+
+
+Aggregate = Union[str, Fold, tuple[Any, ...]]
+"""The name of a built-in aggregate, or a fold given as a Fold or as a tuple of its fields."""
+
+BUILTINS = frozenset(
+    {"count", "sum", "min", "max", "mean", "variance", "stddev", "first", "last"},
+)
+"""The names of the built-in aggregates."""
+
+STATS = ("count", "sum", "min", "max", "mean", "variance", "stddev")
+"""The aggregates computed by `Queryable.stats`."""
+
+_STATE = {
+    "sum": ("total",),
+    "min": ("minimum",),
+    "max": ("maximum",),
+    "mean": ("total",),
+    "variance": ("mean", "m2"),
+    "stddev": ("mean", "m2"),
+    "first": ("first",),
+    "last": ("last",),
+}
+
+
+def aggregate_many(items: Iterable[Any], aggregates: Mapping[str, Aggregate]) -> dict[str, Any]:
+    """Computes several aggregates of the elements in a single pass.
+
+    The loop updating the requested aggregates is generated and compiled once per combination
+    of aggregates, so that no state is maintained for aggregates that are not requested. The
+    variance is computed with Welford's algorithm, which is numerically stable.
+
+    Args:
+        items (Iterable[Any]): The elements to aggregate.
+        aggregates (Mapping[str, Aggregate]): The aggregates to compute, by the name of their
+            result. Built-in aggregates are `"count"`, `"sum"`, `"min"`, `"max"`, `"mean"`,
+            `"variance"` and `"stddev"` (of a sample), `"first"` and `"last"`.
+
+    Returns:
+        dict[str, Any]: The result of each aggregate. Aggregates that are undefined for the
+            given number of elements, such as the minimum of no elements, are None, while folds
+            result in their seed.
+
+    Raises:
+        ValueError: If an aggregate is neither a built-in aggregate nor a fold.
+    """
+    builtins: set[str] = set()
+    folds: dict[str, Fold] = {}
+    for name, spec in aggregates.items():
+        if isinstance(spec, str) and spec in BUILTINS:
+            builtins.add(spec)
+        elif isinstance(spec, tuple):
+            folds[name] = spec if isinstance(spec, Fold) else Fold(*spec)
+        else:
+            msg = f"Unknown aggregate {spec!r}."
+            raise ValueError(msg)
+
+    state = frozenset(variable for spec in builtins for variable in _STATE.get(spec, ()))
+    loop = _compile(state, len(folds))
+    args = [arg for fold in folds.values() for arg in (fold.seed, fold.func)]
+    values, accumulators = loop(items, *args)
+    results = {
+        name: _fold(fold, accumulator)
+        for (name, fold), accumulator in zip(folds.items(), accumulators)
+    }
+    return {
+        name: results[name] if name in folds else _result(spec, values)
+        for name, spec in aggregates.items()
+    }
+
+
+def _result(spec: str, values: dict[str, Any]) -> Any:
+    """Derives the result of a built-in aggregate from the state of the loop."""
+    count = values["count"]
+    if spec == "count":
+        return count
+
+    if spec == "sum":
+        return values["total"]
+
+    if spec == "mean":
+        return values["total"] / count if count else None
+
+    if spec in ("variance", "stddev"):
+        if count < 2:  # noqa: PLR2004
+            return None
+
+        variance = values["m2"] / (count - 1)
+        return variance if spec == "variance" else math.sqrt(variance)
+
+    return values[{"min": "minimum", "max": "maximum"}.get(spec, spec)] if count else None
+
+
+def _fold(fold: Fold, accumulator: Any) -> Any:
+    """Derives the result of a fold from its final accumulator."""
+    return accumulator if fold.result is None else fold.result(accumulator)
+
+
+@lru_cache(maxsize=64)
+def _compile(state: frozenset[str], folds: int) -> Callable[..., Any]:
+    """Generates a function updating the given state variables and folds over the elements.
+
+    The first element initialises the state, so the loop over the remaining elements compares
+    without checking for a missing value. The generated function takes the elements followed by
+    the seed and function of every fold, and returns the state variables along with the final
+    accumulator of every fold.
+    """
+    params = "".join(f", s{index}, f{index}" for index in range(folds))
+    first: list[str] = ["count = 1"]
+    rest: list[str] = ["count += 1"]
+    if "total" in state:
+        first.append("total += x")
+        rest.append("total += x")
+    if "minimum" in state:
+        first.append("minimum = x")
+        rest.extend(["if x < minimum:", "    minimum = x"])
+    if "maximum" in state:
+        first.append("maximum = x")
+        rest.extend(["if x > maximum:", "    maximum = x"])
+    if "mean" in state:
+        first.extend(["mean = x", "m2 = 0"])
+        rest.extend(["delta = x - mean", "mean += delta / count", "m2 += delta * (x - mean)"])
+    if "first" in state:
+        first.append("first = x")
+    for index in range(folds):
+        first.append(f"a{index} = f{index}(a{index}, x)")
+        rest.append(f"a{index} = f{index}(a{index}, x)")
+
+    variables = ["count", *sorted(state)]
+    lines = [f"def aggregate(items{params}):"]
+    lines.append("    iterator = iter(items)")
+    lines.extend(f"    {variable} = None" for variable in variables)
+    lines.append("    count = 0")
+    if "total" in state:
+        lines.append("    total = 0")
+    lines.extend(f"    a{index} = s{index}" for index in range(folds))
+    lines.append("    for x in iterator:")
+    lines.extend(f"        {line}" for line in first)
+    lines.append("        break")
+    lines.append("    for x in iterator:")
+    lines.extend(f"        {line}" for line in rest)
+    if "last" in state:
+        lines.extend(["    if count:", "        last = x"])
+    values = ", ".join(f"{variable!r}: {variable}" for variable in variables)
+    accumulators = "".join(f"a{index}, " for index in range(folds))
+    lines.append(f"    return {{{values}}}, ({accumulators})")
+
+    namespace: dict[str, Any] = {}
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["aggregate"]
@@ -0,0 +1,685 @@
+"""A Python implementation of LINQ over asynchronous iterables."""
+
+import asyncio
+import inspect
+from collections import deque
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Sequence,
+)
+from operator import itemgetter
+from typing import Any, Optional, TypeVar, Union
+
+from querpyable.fields import KeySelector, compile_key
+from querpyable.lookup import Lookup
+from querpyable.pipeline import Descending, SortKeys
+
+T = TypeVar("T")
+U = TypeVar("U")
+V = TypeVar("V")
+
+Source = Union[AsyncIterable[T], Iterable[T]]
+
+_MISSING: Any = object()
+
+_first = itemgetter(0)
+_second = itemgetter(1)
+
+
+class AsyncQueryable(AsyncIterable[T]):
+    """A queryable sequence of elements produced asynchronously.
+
+    The operators mirror those of `Queryable`, but consume an asynchronous (or synchronous)
+    iterable and accept both plain callables and coroutine functions as predicates, selectors,
+    key selectors and accumulators. `where` and `select` can await several calls at once, up
+    to a configurable concurrency limit, while preserving the order of the elements. Terminal
+    operators are coroutines.
+
+    Only a subset of the operators of `Queryable` is available: `where`, `select`,
+    `select_many`, `of_type`, `skip`, `take`, `distinct`, `concat`, `reverse`, `order_by`,
+    `order_by_descending`, `then_by`, `then_by_descending`, `group_by` and `join`, along with
+    the `to_list`, `to_dictionary`, `first`, `first_or_default`, `any`, `all`, `count`, `sum`,
+    `min`, `max` and `aggregate` terminals. Operators that rely on the synchronous query
+    planner, such as the set operators, windows, parallel execution, approximate aggregates
+    and file sinks, are not. `reverse`, `order_by`, `group_by` and the inner side of `join`
+    buffer their input, the other operators stream it.
+    """
+
+    def __init__(self, collection: Source[T]) -> None:
+        """Initializes an AsyncQueryable object.
+
+        Args:
+            collection (Union[AsyncIterable[T], Iterable[T]]): The collection to be queried.
+
+        Example:
+            ```python
+            async def numbers():
+                for n in range(5):
+                    yield n
+
+            queryable_data = AsyncQueryable(numbers())
+            ```
+        """
+        self.collection = collection
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        """Returns an asynchronous iterator over the elements."""
+        if isinstance(self.collection, AsyncIterable):
+            return self.collection.__aiter__()
+
+        return _iterate(self.collection)
+
+    def _derive(self, factory: Callable[[], AsyncIterator[Any]]) -> "AsyncQueryable[Any]":
+        """Returns a new AsyncQueryable that invokes the given factory each time it is iterated."""
+        return AsyncQueryable(_Deferred(factory))
+
+    def where(
+        self,
+        predicate: Callable[[T], Union[bool, Awaitable[bool]]],
+        concurrency: int = 1,
+    ) -> "AsyncQueryable[T]":
+        """Filters the elements of the AsyncQueryable based on a given predicate.
+
+        Args:
+            predicate (Callable[[T], Union[bool, Awaitable[bool]]]): A function, or coroutine
+                function, indicating whether an element should be included in the result.
+            concurrency (int): The maximum number of predicate calls awaited at once.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable containing the elements satisfying the predicate.
+
+        Example:
+            ```python
+            async def is_valid(n):
+                await asyncio.sleep(0.1)
+                return n % 2 == 0
+
+            result = await AsyncQueryable(range(5)).where(is_valid, concurrency=5).to_list()
+            print(result)  # Output: [0, 2, 4]
+            ```
+        """
+
+        async def test(item: T) -> tuple[T, bool]:
+            return item, await _call(predicate, item)
+
+        async def _() -> AsyncIterator[T]:
+            async for item, keep in _map(self, test, concurrency):
+                if keep:
+                    yield item
+
+        return self._derive(_)
+
+    def select(
+        self,
+        selector: Callable[[T], Union[U, Awaitable[U]]],
+        concurrency: int = 1,
+    ) -> "AsyncQueryable[U]":
+        """Projects each element of the AsyncQueryable using the provided selector function.
+
+        Args:
+            selector (Callable[[T], Union[U, Awaitable[U]]]): A function, or coroutine function,
+                that maps elements of the AsyncQueryable to a new value.
+            concurrency (int): The maximum number of selector calls awaited at once.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable containing the projected elements, in order.
+
+        Example:
+            ```python
+            async def fetch(key):
+                await asyncio.sleep(0.1)
+                return key.upper()
+
+            result = await AsyncQueryable(["a", "b"]).select(fetch, concurrency=2).to_list()
+            print(result)  # Output: ['A', 'B']
+            ```
+        """
+        return self._derive(lambda: _map(self, lambda item: _call(selector, item), concurrency))
+
+    def select_many(
+        self,
+        selector: Callable[[T], Union[Source[U], Awaitable[Source[U]]]],
+    ) -> "AsyncQueryable[U]":
+        """Projects each element to an iterable and flattens the resulting sequences.
+
+        Args:
+            selector (Callable[[T], Union[Source[U], Awaitable[Source[U]]]]): A function, or
+                coroutine function, that transforms each element into a synchronous or
+                asynchronous iterable.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable containing the flattened sequence.
+
+        Example:
+            ```python
+            result = await AsyncQueryable([[1, 2], [3]]).select_many(lambda x: x).to_list()
+            print(result)  # Output: [1, 2, 3]
+            ```
+        """
+
+        async def _() -> AsyncIterator[U]:
+            async for item in self:
+                async for element in AsyncQueryable(await _call(selector, item)):
+                    yield element
+
+        return self._derive(_)
+
+    def of_type(self, type_filter: type[U]) -> "AsyncQueryable[U]":
+        """Filters the elements of the AsyncQueryable to include only items of a specific type.
+
+        Args:
+            type_filter (type): The type to filter the elements by.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable containing only elements of the specified type.
+        """
+        return self.where(lambda item: isinstance(item, type_filter))
+
+    def skip(self, count: int) -> "AsyncQueryable[T]":
+        """Skips the specified number of elements from the beginning of the AsyncQueryable.
+
+        Args:
+            count (int): The number of elements to skip.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable containing the remaining elements.
+        """
+
+        async def _() -> AsyncIterator[T]:
+            index = 0
+            async for item in self:
+                if index >= count:
+                    yield item
+                index += 1
+
+        return self._derive(_)
+
+    def take(self, count: int) -> "AsyncQueryable[T]":
+        """Returns the first `count` elements of the AsyncQueryable.
+
+        No element is pulled from the source once `count` elements have been produced.
+
+        Args:
+            count (int): The number of elements to take.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable containing the first `count` elements.
+        """
+
+        async def _() -> AsyncIterator[T]:
+            if count <= 0:
+                return
+
+            taken = 0
+            async for item in self:
+                yield item
+                taken += 1
+                if taken >= count:
+                    return
+
+        return self._derive(_)
+
+    def distinct(self) -> "AsyncQueryable[T]":
+        """Returns a new AsyncQueryable containing the distinct elements, in order.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable with distinct elements.
+        """
+
+        async def _() -> AsyncIterator[T]:
+            seen = set()
+            async for item in self:
+                if item not in seen:
+                    seen.add(item)
+                    yield item
+
+        return self._derive(_)
+
+    def concat(self, other: Source[T]) -> "AsyncQueryable[T]":
+        """Concatenates the elements of the AsyncQueryable with those of another iterable.
+
+        Args:
+            other (Union[AsyncIterable[T], Iterable[T]]): The elements to append.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable containing the concatenated elements.
+        """
+
+        async def _() -> AsyncIterator[T]:
+            async for item in self:
+                yield item
+
+            async for item in AsyncQueryable(other):
+                yield item
+
+        return self._derive(_)
+
+    def reverse(self) -> "AsyncQueryable[T]":
+        """Inverts the order of the elements of the AsyncQueryable.
+
+        The elements are buffered until the source is exhausted.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable containing the elements in reverse order.
+        """
+
+        async def _() -> AsyncIterator[T]:
+            for item in reversed(await self.to_list()):
+                yield item
+
+        return self._derive(_)
+
+    def order_by(self, key_selector: KeySelector) -> "AsyncOrderedQueryable[T]":
+        """Orders the elements of the AsyncQueryable based on a key selector.
+
+        The sort is stable, and the elements are buffered until the source is exhausted.
+
+        Args:
+            key_selector (KeySelector): A function, or coroutine function, extracting the sort
+                key of each element, or a field specification, as in `Queryable.order_by`.
+
+        Returns:
+            AsyncOrderedQueryable: A new AsyncOrderedQueryable containing the sorted elements,
+                which can be further ordered using `then_by`.
+
+        Example:
+            ```python
+            result = await AsyncQueryable([(1, "b"), (0, "a")]).order_by("[0]").to_list()
+            print(result)  # Output: [(0, 'a'), (1, 'b')]
+            ```
+        """
+        return AsyncOrderedQueryable(self, ((key_selector, False),))
+
+    def order_by_descending(self, key_selector: KeySelector) -> "AsyncOrderedQueryable[T]":
+        """Orders the elements of the AsyncQueryable in descending order of a key.
+
+        Args:
+            key_selector (KeySelector): A function, or coroutine function, extracting the sort
+                key of each element, or a field specification, as in `Queryable.order_by`.
+
+        Returns:
+            AsyncOrderedQueryable: A new AsyncOrderedQueryable containing the sorted elements,
+                which can be further ordered using `then_by`.
+        """
+        return AsyncOrderedQueryable(self, ((key_selector, True),))
+
+    def group_by(
+        self,
+        key_selector: KeySelector,
+        element_selector: Optional[KeySelector] = None,
+    ) -> "AsyncQueryable[tuple[Any, Sequence[Any]]]":
+        """Groups the elements of the AsyncQueryable by a key.
+
+        Args:
+            key_selector (KeySelector): A function, or coroutine function, extracting the key of
+                each element, or a field specification, as in `Queryable.order_by`.
+            element_selector (Optional[KeySelector]): An optional function, coroutine function
+                or field specification mapping each element to the value stored in its group.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable of (key, elements) pairs, in the order the keys
+                are first encountered, with the elements of each group in their original order.
+
+        Example:
+            ```python
+            words = AsyncQueryable(["apple", "banana", "avocado"])
+            result = await words.group_by(lambda word: word[0], len).to_list()
+            print(result)  # Output: [('a', [5, 7]), ('b', [6])]
+            ```
+        """
+
+        async def _() -> AsyncIterator[tuple[Any, Sequence[Any]]]:
+            key = compile_key(key_selector)
+            element = _identity if element_selector is None else compile_key(element_selector)
+            pairs = [(await _call(key, item), await _call(element, item)) async for item in self]
+            for group in Lookup.build(pairs, _first, _second).items():
+                yield group
+
+        return self._derive(_)
+
+    def join(
+        self,
+        inner: Source[U],
+        outer_key_selector: KeySelector,
+        inner_key_selector: KeySelector,
+        result_selector: Callable[[T, U], Union[V, Awaitable[V]]],
+    ) -> "AsyncQueryable[V]":
+        """Joins the elements with those of another iterable sharing the same key.
+
+        The inner iterable is buffered in a hash lookup, while the elements of the
+        AsyncQueryable are streamed, so that the results follow their order.
+
+        Args:
+            inner (Union[AsyncIterable[U], Iterable[U]]): The inner iterable to join with.
+            outer_key_selector (KeySelector): A function, coroutine function or field
+                specification extracting the key of each element of the AsyncQueryable.
+            inner_key_selector (KeySelector): A function, coroutine function or field
+                specification extracting the key of each inner element.
+            result_selector (Callable[[T, U], Union[V, Awaitable[V]]]): A function, or coroutine
+                function, combining each pair of matching elements.
+
+        Returns:
+            AsyncQueryable: A new AsyncQueryable containing the combined pairs.
+
+        Example:
+            ```python
+            users = AsyncQueryable([(1, "Alice"), (2, "Bob")])
+            orders = [(1, "book"), (1, "pen")]
+            result = await users.join(orders, "[0]", "[0]", lambda u, o: (u[1], o[1])).to_list()
+            print(result)  # Output: [('Alice', 'book'), ('Alice', 'pen')]
+            ```
+        """
+
+        async def _() -> AsyncIterator[V]:
+            inner_key = compile_key(inner_key_selector)
+            pairs = [(await _call(inner_key, item), item) async for item in AsyncQueryable(inner)]
+            lookup = Lookup.build(pairs, _first, _second)
+            outer_key = compile_key(outer_key_selector)
+            async for item in self:
+                for match in lookup[await _call(outer_key, item)]:
+                    yield await _call(result_selector, item, match)
+
+        return self._derive(_)
+
+    async def to_list(self) -> list[T]:
+        """Converts the AsyncQueryable to a list.
+
+        Returns:
+            list[T]: A list containing all elements of the AsyncQueryable.
+        """
+        return [item async for item in self]
+
+    async def to_dictionary(
+        self,
+        key_selector: KeySelector,
+        value_selector: Optional[KeySelector] = None,
+    ) -> dict[Any, Any]:
+        """Converts the AsyncQueryable to a dictionary using key and optional value selectors.
+
+        Args:
+            key_selector (KeySelector): A function, coroutine function or field specification
+                extracting the key of each element.
+            value_selector (Optional[KeySelector]): An optional function, coroutine function or
+                field specification extracting the value of each element.
+
+        Returns:
+            dict[Any, Any]: A dictionary mapping the key of each element to its value, the last
+                element of each key taking precedence.
+        """
+        key = compile_key(key_selector)
+        value = _identity if value_selector is None else compile_key(value_selector)
+        return {await _call(key, item): await _call(value, item) async for item in self}
+
+    async def first(self, predicate: Optional[Callable[[T], Any]] = None) -> T:
+        """Returns the first element satisfying the optional predicate.
+
+        Args:
+            predicate (Optional[Callable[[T], Any]]): The optional predicate, which may be a
+                coroutine function.
+
+        Returns:
+            T: The first element satisfying the predicate.
+
+        Raises:
+            ValueError: If the sequence is empty or no element satisfies the predicate.
+        """
+        result = await self.first_or_default(predicate, _MISSING)
+        if result is _MISSING:
+            msg = (
+                "Sequence contains no elements."
+                if predicate is None
+                else "Sequence contains no matching element."
+            )
+            raise ValueError(msg)
+
+        return result
+
+    async def first_or_default(
+        self,
+        predicate: Optional[Callable[[T], Any]] = None,
+        default: Optional[T] = None,
+    ) -> Optional[T]:
+        """Returns the first element satisfying the optional predicate, or a default value.
+
+        Args:
+            predicate (Optional[Callable[[T], Any]]): The optional predicate, which may be a
+                coroutine function.
+            default (Optional[T]): The value to return if no element satisfies the predicate.
+
+        Returns:
+            T: The first element satisfying the predicate, or the default value.
+        """
+        async for item in self:
+            if predicate is None or await _call(predicate, item):
+                return item
+
+        return default
+
+    async def any(self, predicate: Optional[Callable[[T], Any]] = None) -> bool:
+        """Determines whether any element satisfies the optional predicate.
+
+        Args:
+            predicate (Optional[Callable[[T], Any]]): The optional predicate, which may be a
+                coroutine function.
+
+        Returns:
+            bool: True if any element satisfies the predicate, False otherwise.
+        """
+        async for item in self:
+            if await _call(predicate, item) if predicate is not None else item:
+                return True
+
+        return False
+
+    async def all(self, predicate: Callable[[T], Any]) -> bool:
+        """Determines whether all elements satisfy a given predicate.
+
+        Args:
+            predicate (Callable[[T], Any]): The predicate, which may be a coroutine function.
+
+        Returns:
+            bool: True if all elements satisfy the predicate, False otherwise.
+        """
+        async for item in self:
+            if not await _call(predicate, item):
+                return False
+
+        return True
+
+    async def count(self, predicate: Optional[Callable[[T], Any]] = None) -> int:
+        """Counts the elements satisfying the optional predicate.
+
+        Args:
+            predicate (Optional[Callable[[T], Any]]): The optional predicate, which may be a
+                coroutine function.
+
+        Returns:
+            int: The number of elements satisfying the predicate.
+        """
+        count = 0
+        async for item in self:
+            if predicate is None or await _call(predicate, item):
+                count += 1
+
+        return count
+
+    async def sum(self) -> Any:
+        """Calculates the sum of all elements.
+
+        Returns:
+            Any: The sum of all elements.
+        """
+        total = 0
+        async for item in self:
+            total += item
+
+        return total
+
+    async def min(self) -> T:
+        """Finds the minimum element.
+
+        Returns:
+            T: The minimum element.
+        """
+        return min(await self.to_list())
+
+    async def max(self) -> T:
+        """Finds the maximum element.
+
+        Returns:
+            T: The maximum element.
+        """
+        return max(await self.to_list())
+
+    async def aggregate(self, func: Callable[[T, T], Union[T, Awaitable[T]]]) -> T:
+        """Aggregates the elements using a specified binary function.
+
+        Args:
+            func (Callable[[T, T], Union[T, Awaitable[T]]]): A binary function, or coroutine
+                function, combining the accumulated result with the next element.
+
+        Returns:
+            T: The result of aggregating the elements.
+
+        Raises:
+            ValueError: If the sequence is empty and cannot be aggregated.
+        """
+        result: Any = _MISSING
+        async for item in self:
+            result = item if result is _MISSING else await _call(func, result, item)
+
+        if result is _MISSING:
+            msg = "Sequence contains no elements."
+            raise ValueError(msg)
+
+        return result
+
+
+class AsyncOrderedQueryable(AsyncQueryable[T]):
+    """An AsyncQueryable whose elements are sorted by one or more keys.
+
+    The keys added by `then_by` and `then_by_descending` are accumulated and the elements are
+    sorted exactly once, when the AsyncOrderedQueryable is iterated.
+    """
+
+    def __init__(self, source: AsyncQueryable[T], keys: SortKeys) -> None:
+        """Initializes an AsyncOrderedQueryable object.
+
+        Args:
+            source (AsyncQueryable[T]): The elements to sort.
+            keys (SortKeys): The key selectors along with whether each one is descending.
+        """
+        super().__init__(_Deferred(self._sort))
+        self.source = source
+        self.keys = keys
+
+    def then_by(self, key_selector: KeySelector) -> "AsyncOrderedQueryable[T]":
+        """Performs a subsequent ordering of the elements in ascending order.
+
+        Args:
+            key_selector (KeySelector): A function, coroutine function or field specification
+                extracting the key breaking the ties of the existing keys.
+
+        Returns:
+            AsyncOrderedQueryable: A new AsyncOrderedQueryable sorted by the additional key.
+        """
+        return AsyncOrderedQueryable(self.source, (*self.keys, (key_selector, False)))
+
+    def then_by_descending(self, key_selector: KeySelector) -> "AsyncOrderedQueryable[T]":
+        """Performs a subsequent ordering of the elements in descending order.
+
+        Args:
+            key_selector (KeySelector): A function, coroutine function or field specification
+                extracting the key breaking the ties of the existing keys.
+
+        Returns:
+            AsyncOrderedQueryable: A new AsyncOrderedQueryable sorted by the additional key.
+        """
+        return AsyncOrderedQueryable(self.source, (*self.keys, (key_selector, True)))
+
+    async def _sort(self) -> AsyncIterator[T]:
+        """Sorts the elements in a single stable sort, computing their keys once.
+
+        The keys are compared as a tuple, in reverse if they are all descending. Otherwise,
+        descending keys are wrapped in `Descending` so that an ascending sort honours every
+        direction.
+        """
+        selectors = [(compile_key(key), descending) for key, descending in self.keys]
+        directions = {descending for _, descending in self.keys}
+        mixed = len(directions) > 1
+        rows: list[tuple[tuple[Any, ...], T]] = []
+        async for item in self.source:
+            key: list[Any] = []
+            for selector, descending in selectors:
+                value = await _call(selector, item)
+                key.append(Descending(value) if mixed and descending else value)
+
+            rows.append((tuple(key), item))
+
+        rows.sort(key=itemgetter(0), reverse=not mixed and directions == {True})
+        for _, item in rows:
+            yield item
+
+
+class _Deferred(AsyncIterable[T]):
+    """An asynchronous iterable creating a new iterator from a factory each time it is iterated."""
+
+    def __init__(self, factory: Callable[[], AsyncIterator[T]]) -> None:
+        self.factory = factory
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.factory()
+
+
+async def _iterate(items: Iterable[T]) -> AsyncIterator[T]:
+    """Adapts a synchronous iterable to the asynchronous iteration protocol."""
+    for item in items:
+        yield item
+
+
+def _identity(item: T) -> T:
+    """Returns the element itself, as the default element and value selector."""
+    return item
+
+
+async def _call(function: Callable[..., Any], *args: Any) -> Any:
+    """Calls a function, awaiting its result if it is awaitable."""
+    result = function(*args)
+    if inspect.isawaitable(result):
+        return await result
+
+    return result
+
+
+async def _map(
+    items: AsyncIterable[T],
+    function: Callable[[T], Awaitable[U]],
+    concurrency: int,
+) -> AsyncIterator[U]:
+    """Awaits a coroutine function for each element, running up to `concurrency` at once.
+
+    The results are produced in the order of the elements, and the calls still pending are
+    cancelled if the iterator is closed early.
+    """
+    if concurrency <= 1:
+        async for item in items:
+            yield await function(item)
+
+        return
+
+    pending: deque[asyncio.Future[U]] = deque()
+    try:
+        async for item in items:
+            pending.append(asyncio.ensure_future(function(item)))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
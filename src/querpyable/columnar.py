@@ -0,0 +1,166 @@
+"""Column-oriented storage of records."""
+
+import dataclasses
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any, Optional
+
+Factory = Callable[..., Any]
+"""A callable building a record from its fields, passed as keyword arguments."""
+
+
+class Table:
+    """A set of records stored as one column per field.
+
+    Integer and floating point columns are packed into arrays of machine values, which take a
+    fraction of the memory of the equivalent Python objects. Records are only built again,
+    through the factory, when they are read.
+
+    Example:
+        ```python
+        table = Table.from_records([{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}])
+
+        print(table.columns["age"])  # Output: array('q', [30, 25])
+        print(table.row(1))  # Output: {'name': 'Bob', 'age': 25}
+        ```
+    """
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]], factory: Factory = dict) -> None:
+        """Initializes a Table.
+
+        Args:
+            columns (Mapping[str, Sequence[Any]]): The values of each field, in record order.
+            factory (Callable[..., Any]): The callable building a record from its fields.
+
+        Raises:
+            ValueError: If the columns differ in length.
+        """
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            msg = "All columns must have the same length."
+            raise ValueError(msg)
+
+        self.columns = dict(columns)
+        self.factory = factory
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Any],
+        fields: Optional[Sequence[str]] = None,
+    ) -> "Table":
+        """Builds a Table in a single pass over the given records.
+
+        Records may be mappings, dataclass instances, named tuples or plain objects. Unless the
+        fields are specified, every field encountered is stored, and records lacking it hold
+        None. Dataclass instances and named tuples are built again with their own type, and
+        any other record as a dictionary.
+
+        Args:
+            records (Iterable[Any]): The records to store.
+            fields (Optional[Sequence[str]]): The names of the fields to store.
+
+        Returns:
+            Table: A Table holding the fields of the records.
+        """
+        columns: dict[str, list[Any]] = {name: [] for name in fields or ()}
+        factory: Optional[Factory] = None
+        count = 0
+        for record in records:
+            if factory is None:
+                factory = _factory(record)
+
+            values = _values(record, fields)
+            for name, value in values.items():
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = [None] * count
+
+                column.append(value)
+
+            count += 1
+            for column in columns.values():
+                if len(column) < count:
+                    column.append(None)
+
+        compact = {name: _compact(column) for name, column in columns.items()}
+        return cls(compact, dict if factory is None or fields is not None else factory)
+
+    def __len__(self) -> int:
+        """Returns the number of records."""
+        return self._length
+
+    def row(self, index: int) -> Any:
+        """Builds the record at the given index.
+
+        Args:
+            index (int): The index of the record.
+
+        Returns:
+            Any: The record, built by the factory.
+        """
+        return self.factory(**{name: column[index] for name, column in self.columns.items()})
+
+    def rows(self, indices: Iterable[int]) -> Iterator[Any]:
+        """Builds the records at the given indices, gathering one column at a time.
+
+        Args:
+            indices (Iterable[int]): The indices of the records.
+
+        Yields:
+            Any: Each record, built by the factory.
+        """
+        indices = indices if isinstance(indices, Sequence) else list(indices)
+        names = tuple(self.columns)
+        values = zip(*(map(column.__getitem__, indices) for column in self.columns.values()))
+        if self.factory is dict:
+            for row in values:
+                yield dict(zip(names, row))
+
+            return
+
+        for row in values:
+            yield self.factory(**dict(zip(names, row)))
+
+
+def _factory(record: Any) -> Factory:
+    """Returns the callable building records like the given one from their fields."""
+    if dataclasses.is_dataclass(record) or hasattr(record, "_fields"):
+        return type(record)
+
+    return dict
+
+
+def _values(record: Any, fields: Optional[Sequence[str]]) -> Mapping[str, Any]:
+    """Returns the fields of a record by name."""
+    if isinstance(record, Mapping):
+        return record if fields is None else {name: record.get(name) for name in fields}
+
+    if fields is not None:
+        return {name: getattr(record, name, None) for name in fields}
+
+    if dataclasses.is_dataclass(record):
+        return {field.name: getattr(record, field.name) for field in dataclasses.fields(record)}
+
+    if hasattr(record, "_asdict"):
+        return record._asdict()
+
+    return vars(record)
+
+
+def _compact(values: list[Any]) -> Sequence[Any]:
+    """Packs a column of integers or floats into an array, leaving any other column as is."""
+    if not values:
+        return values
+
+    if all(type(value) is int for value in values):
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+
+    if all(type(value) is float for value in values):
+        return array("d", values)
+
+    return values
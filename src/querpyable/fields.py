@@ -0,0 +1,166 @@
+"""Field specifications compiled to key selectors."""
+
+import re
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, Union
+
+Field = Union[str, tuple[str, ...]]
+"""The path of a field, such as `"age"`, `"address.city"` or `'["key"]'`, or a tuple of paths."""
+
+KeySelector = Union[Field, Callable[[Any], Any]]
+"""A function extracting a key from each element, or the specification of a field."""
+
+_SEGMENT = re.compile(
+    r"""(?P<dot>\.)?(?P<name>[A-Za-z_]\w*)"""
+    r"""|\[\s*(?:(?P<index>-?\d+)|'(?P<single>[^']*)'|"(?P<double>[^"]*)")\s*\]"""
+)
+
+
+def compile_key(key: KeySelector) -> Callable[[Any], Any]:
+    """Returns the function extracting the given key from an element.
+
+    Functions are returned as is, while field specifications are compiled to `attrgetter` and
+    `itemgetter` chains, which run without calling back into Python code. A path is made of
+    attribute names separated by dots and of item accesses in brackets, such as `'["key"]'`,
+    `"[0]"` or `'orders[0]["total"]'`. A tuple of paths selects a tuple of values.
+
+    Args:
+        key (Union[str, tuple[str, ...], Callable[[Any], Any]]): The key selector or field
+            specification.
+
+    Returns:
+        Callable[[Any], Any]: The key selector.
+
+    Raises:
+        ValueError: If the field specification is malformed.
+
+    Example:
+        ```python
+        get = compile_key(("name", 'address["city"]'))
+        print(get(person))  # Output: ('Alice', 'Athens')
+        ```
+    """
+    if callable(key):
+        return key
+
+    return _compile(key)
+
+
+def is_field(key: KeySelector) -> bool:
+    """Determines whether a key selector is a field specification rather than a function."""
+    return isinstance(key, (str, tuple))
+
+
+def freeze(value: Any) -> Hashable:
+    """Converts a value to a hashable value, so that unhashable rows can be compared in sets.
+
+    Hashable values are returned as is, without copying. Otherwise, mappings are converted to
+    frozensets of their items, sets to frozensets and other iterables, such as lists, to tuples,
+    recursively. Equal values are converted to equal values, although a list and a tuple of the
+    same elements, for instance, become equal.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Hashable: The value, or a hashable equivalent of it.
+
+    Raises:
+        TypeError: If the value is neither hashable nor a collection.
+
+    Example:
+        ```python
+        print(freeze({"tags": ["a", "b"]}))  # Output: frozenset({('tags', ('a', 'b'))})
+        ```
+    """
+    if isinstance(value, dict):
+        try:
+            return frozenset(value.items())
+        except TypeError:
+            return frozenset((key, freeze(item)) for key, item in value.items())
+
+    try:
+        hash(value)
+    except TypeError:
+        pass
+    else:
+        return value
+
+    if isinstance(value, Mapping):
+        return frozenset((key, freeze(item)) for key, item in value.items())
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+
+    if isinstance(value, Iterable):
+        return tuple(freeze(item) for item in value)
+
+    msg = f"unhashable type: '{type(value).__name__}'"
+    raise TypeError(msg)
+
+
+@lru_cache(maxsize=None)
+def _compile(field: Field) -> Callable[[Any], Any]:
+    """Compiles a field specification to a chain of `attrgetter` and `itemgetter` calls."""
+    if isinstance(field, str):
+        return _chain([_getter(kind, path) for kind, path in _parse(field)])
+
+    paths = [_parse(path) for path in field]
+    if len(paths) > 1 and all(len(path) == 1 for path in paths):
+        kinds = {kind for ((kind, _),) in paths}
+        if kinds == {"attribute"}:
+            return attrgetter(*(name for ((_, name),) in paths))
+
+        if kinds == {"item"}:
+            return itemgetter(*(key for ((_, key),) in paths))
+
+    getters = [_compile(path) for path in field]
+    return lambda item: tuple(getter(item) for getter in getters)
+
+
+def _parse(path: str) -> list[tuple[str, Any]]:
+    """Splits a path into attribute and item accesses, merging consecutive attributes into a
+    single dotted name.
+    """
+    segments: list[tuple[str, Any]] = []
+    position = 0
+    for match in _SEGMENT.finditer(path):
+        dot, name = match.group("dot"), match.group("name")
+        if match.start() != position or (name is not None and bool(dot) != (position > 0)):
+            break
+
+        position = match.end()
+        if name is None:
+            index, single, double = match.group("index", "single", "double")
+            segments.append(("item", int(index) if index is not None else single or double or ""))
+        elif segments and segments[-1][0] == "attribute":
+            segments[-1] = ("attribute", f"{segments[-1][1]}.{name}")
+        else:
+            segments.append(("attribute", name))
+
+    if not segments or position != len(path):
+        msg = f"Invalid field specification '{path}'."
+        raise ValueError(msg)
+
+    return segments
+
+
+def _getter(kind: str, path: Any) -> Callable[[Any], Any]:
+    """Returns the getter of a single attribute path or item access."""
+    return attrgetter(path) if kind == "attribute" else itemgetter(path)
+
+
+def _chain(getters: list[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Composes getters, applying them from left to right."""
+    if len(getters) == 1:
+        return getters[0]
+
+    def get(item: Any) -> Any:
+        for getter in getters:
+            item = getter(item)
+
+        return item
+
+    return get
@@ -0,0 +1,186 @@
+"""Join strategies pairing each outer element with the inner elements sharing its key."""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import islice
+from operator import itemgetter
+from typing import Any, TypeVar
+
+from querpyable.lookup import Lookup
+from querpyable.spill import SpillFile
+
+T = TypeVar("T")
+U = TypeVar("U")
+K = TypeVar("K")
+
+SPILL_PARTITIONS = 32
+"""The number of partitions the inputs of a hash join are split into once they are spilled."""
+
+_MISSING = object()
+
+_MASK = (1 << 64) - 1
+
+_key = itemgetter(0)
+_value = itemgetter(1)
+
+
+def merge_join(
+    outer: Iterable[T],
+    inner: Iterable[U],
+    outer_key_selector: Callable[[T], K],
+    inner_key_selector: Callable[[U], K],
+) -> Iterator[tuple[T, Sequence[U]]]:
+    """Pairs the elements of two inputs sorted in ascending order of their keys.
+
+    Both inputs are consumed in a single, streaming pass. Only the current run of inner
+    elements sharing a key is held in memory, and the first pair is produced without reading
+    either input any further than needed.
+
+    Args:
+        outer (Iterable[T]): The outer elements, sorted by key.
+        inner (Iterable[U]): The inner elements, sorted by key.
+        outer_key_selector (Callable[[T], K]): The key selector for the outer elements.
+        inner_key_selector (Callable[[U], K]): The key selector for the inner elements.
+
+    Yields:
+        tuple[T, Sequence[U]]: Each outer element, in order, along with its matching inner
+            elements.
+    """
+    iterator = iter(inner)
+    pending: Any = next(iterator, _MISSING)
+    pending_key: Any = _MISSING if pending is _MISSING else inner_key_selector(pending)
+    group_key: Any = _MISSING
+    group: list[U] = []
+
+    for item in outer:
+        key = outer_key_selector(item)
+        if group_key is _MISSING or group_key != key:
+            while pending is not _MISSING and pending_key < key:
+                pending = next(iterator, _MISSING)
+                pending_key = _MISSING if pending is _MISSING else inner_key_selector(pending)
+
+            group_key, group = key, []
+            while pending is not _MISSING and pending_key == key:
+                group.append(pending)
+                pending = next(iterator, _MISSING)
+                pending_key = _MISSING if pending is _MISSING else inner_key_selector(pending)
+
+        yield item, group
+
+
+def partitioned_hash_join(
+    outer: Iterable[T],
+    inner: Iterable[U],
+    outer_key_selector: Callable[[T], K],
+    inner_key_selector: Callable[[U], K],
+    memory_budget: int,
+) -> Iterator[tuple[T, Sequence[U]]]:
+    """Pairs the elements of two inputs through a hash lookup that spills to disk.
+
+    The lookup is built in memory as long as the inner input holds at most `memory_budget`
+    elements, in which case the outer input is streamed and the pairs are produced in outer
+    order. Otherwise both inputs are partitioned by the hash of their keys into temporary
+    files, and each partition is joined separately, so that only a single inner partition is
+    held in memory at a time. Partitions holding more than `memory_budget` inner elements are
+    partitioned again, with a different hash, until they fit, unless their keys are all equal
+    or share a hash, so that no partitioning can split them. The pairs are then grouped by
+    partition rather than produced in outer order. Keys and elements must be picklable to be
+    spilled.
+
+    Args:
+        outer (Iterable[T]): The outer elements.
+        inner (Iterable[U]): The inner elements.
+        outer_key_selector (Callable[[T], K]): The key selector for the outer elements.
+        inner_key_selector (Callable[[U], K]): The key selector for the inner elements.
+        memory_budget (int): The maximum number of inner elements held in memory.
+
+    Yields:
+        tuple[T, Sequence[U]]: Each outer element along with its matching inner elements.
+
+    Raises:
+        ValueError: If the memory budget is not positive.
+    """
+    if memory_budget <= 0:
+        msg = "The memory budget must be positive."
+        raise ValueError(msg)
+
+    iterator = iter(inner)
+    buffered = [(inner_key_selector(item), item) for item in islice(iterator, memory_budget)]
+    extra = next(iterator, _MISSING)
+    if extra is _MISSING:
+        lookup = Lookup.build(buffered, _key, _value)
+        for item in outer:
+            yield item, lookup[outer_key_selector(item)]
+
+        return
+
+    buffered.append((inner_key_selector(extra), extra))
+    inner_partitions = _partition(buffered, 0)
+    del buffered, extra
+    _spill(((inner_key_selector(element), element) for element in iterator), inner_partitions, 0)
+    outer_partitions = _partition(((outer_key_selector(item), item) for item in outer), 0)
+    size = sum(map(len, inner_partitions))
+    yield from _join_partitions(inner_partitions, outer_partitions, memory_budget, 0, size)
+
+
+def _join_partitions(
+    inner_partitions: list[SpillFile],
+    outer_partitions: list[SpillFile],
+    memory_budget: int,
+    seed: int,
+    size: int,
+) -> Iterator[tuple[Any, Sequence[Any]]]:
+    """Joins spilled partitions pairwise, partitioning again, with the next hash seed, those
+    whose inner side does not fit within the memory budget.
+
+    A partition holding all of the `size` inner elements it was split from is joined in memory
+    regardless, as its keys are all equal or share a hash, so that no partitioning splits them.
+    """
+    try:
+        for inner_partition, outer_partition in zip(inner_partitions, outer_partitions):
+            length = len(inner_partition)
+            if memory_budget < length < size:
+                inner_parts = _partition(inner_partition, seed + 1)
+                inner_partition.close()
+                outer_parts = _partition(outer_partition, seed + 1)
+                outer_partition.close()
+                yield from _join_partitions(
+                    inner_parts, outer_parts, memory_budget, seed + 1, length
+                )
+                continue
+
+            lookup = Lookup.build(inner_partition, _key, _value)
+            inner_partition.close()
+            for key, item in outer_partition:
+                yield item, lookup[key]
+
+            del lookup
+            outer_partition.close()
+    finally:
+        for partition in (*inner_partitions, *outer_partitions):
+            partition.close()
+
+
+def _partition(pairs: Iterable[tuple[Any, Any]], seed: int) -> list[SpillFile]:
+    """Distributes key-element pairs across new spill files by the seeded hash of their keys."""
+    partitions = [SpillFile() for _ in range(SPILL_PARTITIONS)]
+    _spill(pairs, partitions, seed)
+    return partitions
+
+
+def _spill(pairs: Iterable[tuple[Any, Any]], partitions: list[SpillFile], seed: int) -> None:
+    """Distributes key-element pairs across existing spill files by the seeded hash of their
+    keys.
+    """
+    count = len(partitions)
+    for pair in pairs:
+        partitions[_bucket(pair[0], seed) % count].append(pair)
+
+
+def _bucket(key: Any, seed: int) -> int:
+    """Mixes the hash of a key with a seed through the SplitMix64 finaliser, so that every seed
+    spreads the keys of a partition differently.
+    """
+    value = (hash(key) + (seed + 1) * 0x9E3779B97F4A7C15) & _MASK
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK
+    return value ^ (value >> 31)
@@ -0,0 +1,99 @@
+"""A one-to-many mapping of keys to elements."""
+
+from collections import defaultdict
+from collections.abc import Callable, Container, Iterable, Iterator, Mapping, Sequence
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class Lookup(Mapping[K, Sequence[V]]):
+    """A mapping of each key to the sequence of elements sharing it.
+
+    Unlike a dictionary, looking up a missing key returns an empty list instead of
+    raising a KeyError, which makes a Lookup suitable for one-to-many joins. `get` still
+    returns its default for a missing key.
+
+    Example:
+        ```python
+        words = ["apple", "avocado", "banana"]
+        lookup = Lookup.build(words, lambda word: word[0])
+
+        print(lookup["a"])  # Output: ['apple', 'avocado']
+        print(lookup["c"])  # Output: []
+        ```
+    """
+
+    def __init__(self, groups: Optional[Mapping[K, Sequence[V]]] = None) -> None:
+        """Initializes a Lookup.
+
+        Args:
+            groups (Optional[Mapping[K, Sequence[V]]]): The elements of each key.
+        """
+        self._groups: Mapping[K, Sequence[V]] = {} if groups is None else groups
+
+    @classmethod
+    def build(
+        cls,
+        items: Iterable[T],
+        key_selector: Callable[[T], K],
+        element_selector: Optional[Callable[[T], V]] = None,
+        keys: Optional[Container[K]] = None,
+    ) -> "Lookup[K, Any]":
+        """Builds a Lookup in a single pass over the given elements.
+
+        Args:
+            items (Iterable[T]): The elements to group.
+            key_selector (Callable[[T], K]): A function extracting the key of each element.
+            element_selector (Optional[Callable[[T], V]]): An optional function mapping each
+                element to the value stored in the Lookup.
+            keys (Optional[Container[K]]): If specified, only the elements whose key belongs
+                to this container are retained.
+
+        Returns:
+            Lookup: A Lookup holding the elements of each key in their original order.
+        """
+        groups: defaultdict[K, list[Any]] = defaultdict(list)
+        for item in items:
+            key = key_selector(item)
+            if keys is None or key in keys:
+                groups[key].append(item if element_selector is None else element_selector(item))
+
+        return cls(groups)
+
+    def __getitem__(self, key: K) -> Sequence[V]:
+        """Returns the elements of the given key, or an empty list if there are none.
+
+        Never raises a KeyError, so `Mapping` methods relying on one are overridden.
+        """
+        return self._groups.get(key, [])
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """Returns the elements of the given key, or the default if there are none.
+
+        Args:
+            key (K): The key to look up.
+            default (Any): The value returned if no element has the key.
+
+        Returns:
+            Any: The elements of the key, or the default.
+        """
+        return self._groups.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        """Determines whether any element has the given key."""
+        return key in self._groups
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterates over the keys, in the order they were first encountered."""
+        return iter(self._groups)
+
+    def __len__(self) -> int:
+        """Returns the number of distinct keys."""
+        return len(self._groups)
+
+    def __repr__(self) -> str:
+        """Returns a representation of the Lookup."""
+        return f"Lookup({dict(self._groups)!r})"
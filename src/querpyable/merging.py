@@ -0,0 +1,117 @@
+"""Set operations over inputs sorted by the key elements are compared by."""
+
+from collections.abc import Callable, Iterable, Iterator
+from heapq import merge
+from operator import gt, itemgetter, lt
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+_key = itemgetter(0)
+
+
+def merge_union(
+    left: Iterable[T],
+    right: Iterable[T],
+    key: Callable[[T], Any],
+    reverse: bool,  # noqa: FBT001
+) -> Iterator[T]:
+    """Merges two sorted inputs, keeping the first element of each key.
+
+    Both inputs are consumed in a single, streaming pass, holding a single key in memory.
+    Elements with equal keys are taken from the left input first.
+
+    Args:
+        left (Iterable[T]): The first input, sorted by key.
+        right (Iterable[T]): The second input, sorted by key.
+        key (Callable[[T], Any]): The key of each element.
+        reverse (bool): Whether the inputs are sorted in descending order.
+
+    Yields:
+        T: The first element of each distinct key, in sorted order.
+    """
+    decorated = (((key(item), item) for item in items) for items in (left, right))
+    previous: Any = _MISSING
+    for value, item in merge(*decorated, key=_key, reverse=reverse):
+        if previous is _MISSING or value != previous:
+            previous = value
+            yield item
+
+
+def merge_intersect(
+    left: Iterable[T],
+    right: Iterable[Any],
+    key: Callable[[Any], Any],
+    reverse: bool,  # noqa: FBT001
+) -> Iterator[T]:
+    """Yields the first element of the left input of each key found in the right input.
+
+    Both inputs are consumed in a single, streaming pass, stopping as soon as the right input
+    is exhausted.
+
+    Args:
+        left (Iterable[T]): The first input, sorted by key.
+        right (Iterable[Any]): The second input, sorted by key.
+        key (Callable[[Any], Any]): The key of each element.
+        reverse (bool): Whether the inputs are sorted in descending order.
+
+    Yields:
+        T: The matching elements of the left input, in sorted order.
+    """
+    for item, found in _probe(left, right, key, reverse):
+        if found is None:
+            return
+
+        if found:
+            yield item
+
+
+def merge_except(
+    left: Iterable[T],
+    right: Iterable[Any],
+    key: Callable[[Any], Any],
+    reverse: bool,  # noqa: FBT001
+) -> Iterator[T]:
+    """Yields the first element of the left input of each key missing from the right input.
+
+    Args:
+        left (Iterable[T]): The first input, sorted by key.
+        right (Iterable[Any]): The second input, sorted by key.
+        key (Callable[[Any], Any]): The key of each element.
+        reverse (bool): Whether the inputs are sorted in descending order.
+
+    Yields:
+        T: The remaining elements of the left input, in sorted order.
+    """
+    for item, found in _probe(left, right, key, reverse):
+        if not found:
+            yield item
+
+
+def _probe(
+    left: Iterable[T],
+    right: Iterable[Any],
+    key: Callable[[Any], Any],
+    reverse: bool,  # noqa: FBT001
+) -> Iterator[tuple[T, Any]]:
+    """Pairs the first element of the left input of each key with whether the right input
+    contains the key, or None once the right input is exhausted.
+    """
+    before = gt if reverse else lt
+    iterator = iter(right)
+    pending: Any = next(iterator, _MISSING)
+    pending_key = _MISSING if pending is _MISSING else key(pending)
+    previous: Any = _MISSING
+    for item in left:
+        value = key(item)
+        if previous is not _MISSING and value == previous:
+            continue
+
+        previous = value
+        while pending is not _MISSING and before(pending_key, value):
+            pending = next(iterator, _MISSING)
+            pending_key = _MISSING if pending is _MISSING else key(pending)
+
+        yield item, None if pending is _MISSING else pending_key == value
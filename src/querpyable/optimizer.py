@@ -0,0 +1,155 @@
+"""Rule-based rewriting of the logical plan of a query."""
+
+from typing import Optional
+
+from querpyable.pipeline import PARALLELIZABLE, SortKeys, Stage
+
+ORDER_INSENSITIVE_TERMINALS = frozenset(
+    {
+        "count",
+        "sum",
+        "average",
+        "stats",
+        "contains",
+        "any",
+        "all",
+        "approx_count_distinct",
+        "approx_quantiles",
+        "approx_top_frequent",
+    },
+)
+"""The terminal operators whose result does not depend on the order of the elements."""
+
+ORDER_PRESERVING = frozenset({"where", "select", "select_many", "of_type", "assume_sorted"})
+"""The operators whose output order only depends on the order of their input."""
+
+LIMITING_TERMINALS = frozenset({"first", "first_or_default"})
+"""The terminal operators that only consume the first element."""
+
+ORDERING = frozenset({"order_by", "reverse"})
+"""The operators that reorder their input."""
+
+SORT_PRESERVING = frozenset({"where", "of_type", "skip", "take"})
+"""The operators whose output is sorted by the same keys as their input."""
+
+SORTING = frozenset({"order_by", "top_k", "assume_sorted"})
+"""The operators whose output is sorted by the keys given as their first argument."""
+
+
+def optimize(stages: tuple[Stage, ...], terminal: Optional[str] = None) -> tuple[Stage, ...]:
+    """Rewrites the stages of a query into an equivalent, cheaper sequence of stages.
+
+    The following rules are applied:
+
+    - adjacent `where` stages are merged into a single stage testing every predicate,
+    - `skip(a).skip(b)` is collapsed into `skip(a + b)` and `take(a).take(b)` into
+      `take(min(a, b))`,
+    - `skip`, `take` and `reverse` are pushed in front of `select`, so that the selector is
+      not invoked for elements that are discarded anyway and positional stages are applied
+      directly to the source,
+    - `reverse().reverse()` is removed altogether,
+    - the element-wise stages following `as_parallel` are absorbed into the parallel stage,
+      which executes them in worker processes,
+    - an ordering followed by `take(k)`, or consumed by `first`, is replaced by a top-k
+      selection, which keeps only `k` elements in memory instead of sorting the whole input,
+    - orderings are dropped when the query ends in an order-insensitive terminal, such as
+      `count` or `sum`, and only order-preserving stages follow them,
+    - an ordering of elements already sorted by the same keys, or by keys it is a prefix of,
+      is dropped, since a stable sort leaves them unchanged. `assume_sorted` stages only
+      serve this purpose and are removed from the optimized plan.
+
+    Args:
+        stages (tuple[Stage, ...]): The stages of the query, in order.
+        terminal (Optional[str]): The name of the terminal operator consuming the query,
+            if any.
+
+    Returns:
+        tuple[Stage, ...]: The optimized stages.
+    """
+    plan: list[Stage] = []
+    for stage in stages:
+        _push(plan, stage)
+
+    if terminal in LIMITING_TERMINALS:
+        _push(plan, Stage("take", (1,)))
+
+    if terminal in ORDER_INSENSITIVE_TERMINALS and any(stage.op in ORDERING for stage in plan):
+        return optimize(_drop_trailing_orderings(plan))
+
+    return tuple(stage for stage in plan if stage.op != "assume_sorted")
+
+
+def sort_keys(stages: tuple[Stage, ...]) -> Optional[SortKeys]:
+    """Returns the keys the result of a plan is known to be sorted by.
+
+    Args:
+        stages (tuple[Stage, ...]): The stages of the query, in order.
+
+    Returns:
+        Optional[SortKeys]: The keys of the last ordering or `assume_sorted` stage, if it is
+            only followed by stages preserving the order of the elements, or None.
+    """
+    for stage in reversed(stages):
+        if stage.op in SORTING:
+            return stage.args[0]
+
+        if stage.op not in SORT_PRESERVING:
+            return None
+
+    return None
+
+
+def _push(plan: list[Stage], stage: Stage) -> None:
+    """Appends a stage to a plan, rewriting it against the stages preceding it."""
+    if not plan:
+        plan.append(stage)
+        return
+
+    last = plan[-1]
+    if stage.op == "order_by" and _is_prefix(stage.args[0], sort_keys(tuple(plan))):
+        return
+
+    if last.op == "parallel" and stage.op in PARALLELIZABLE:
+        *options, absorbed = last.args
+        stages = list(absorbed)
+        _push(stages, stage)
+        plan[-1] = Stage("parallel", (*options, tuple(stages)))
+    elif stage.op == "where" and last.op == "where":
+        plan[-1] = Stage("where", last.args + stage.args)
+    elif stage.op == "skip" and last.op == "skip":
+        plan.pop()
+        _push(plan, Stage("skip", (max(last.args[0], 0) + max(stage.args[0], 0),)))
+    elif stage.op == "take" and last.op == "take":
+        plan.pop()
+        _push(plan, Stage("take", (min(last.args[0], stage.args[0]),)))
+    elif stage.op == "take" and last.op == "order_by":
+        plan[-1] = Stage("top_k", (last.args[0], stage.args[0]))
+    elif stage.op == "take" and last.op == "top_k":
+        plan[-1] = Stage("top_k", (*last.args[:-1], min(last.args[-1], stage.args[0])))
+    elif stage.op == "reverse" and last.op == "reverse":
+        plan.pop()
+    elif stage.op in ("skip", "take", "reverse") and last.op == "select":
+        plan.pop()
+        _push(plan, stage)
+        plan.append(last)
+    else:
+        plan.append(stage)
+
+
+def _is_prefix(keys: SortKeys, known: Optional[SortKeys]) -> bool:
+    """Determines whether sorting by some keys is implied by being sorted by known keys."""
+    return known is not None and len(keys) <= len(known) and keys == known[: len(keys)]
+
+
+def _drop_trailing_orderings(plan: list[Stage]) -> tuple[Stage, ...]:
+    """Removes the orderings that are only followed by order-preserving stages."""
+    kept: list[Stage] = []
+    droppable = True
+    for stage in reversed(plan):
+        if stage.op in ORDERING and droppable:
+            continue
+
+        droppable = droppable and stage.op in ORDER_PRESERVING
+        kept.append(stage)
+
+    return tuple(reversed(kept))
@@ -0,0 +1,173 @@
+"""Execution of a function over a stream in a pool of worker processes or threads."""
+
+import multiprocessing
+import os
+import pickle
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import islice
+from typing import Any, Optional
+
+CHUNK_SIZE = 1024
+"""The default number of elements shipped to a worker at once."""
+
+_POOLS: dict[tuple[int, Optional[str]], ProcessPoolExecutor] = {}
+"""The worker pools, by number of workers and start method, shared by every parallel query."""
+
+_POOLS_LOCK = threading.Lock()
+
+_WORKER: dict[str, Any] = {}
+
+
+def parallel_map(
+    function: Callable[[list[Any]], list[Any]],
+    items: Iterable[Any],
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    ordered: bool = True,  # noqa: FBT001, FBT002
+    start_method: Optional[str] = None,
+) -> Iterator[Any]:
+    """Applies a function to chunks of a stream in a pool of worker processes.
+
+    The stream is split into chunks of `chunk_size` elements and at most two chunks per worker
+    are in flight at any time, so that memory stays bounded and no more of the stream is read
+    than needed. Closing the returned iterator cancels the pending chunks, which lets a
+    downstream `take` or `first` terminate the computation early.
+
+    The worker processes are started once per number of workers and start method, and reused
+    by every later call, so that iterating a parallel query again does not pay for starting
+    a new pool. The function is pickled once per call and unpickled once per worker, so it
+    must be picklable, e.g. a function defined at the top level of a module rather than a
+    lambda or a closure, whatever the start method. The elements of the stream and of the
+    results must be picklable too.
+
+    Args:
+        function (Callable[[list[Any]], list[Any]]): The function mapping each chunk to the
+            elements it produces.
+        items (Iterable[Any]): The elements to process.
+        workers (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int): The number of elements per chunk.
+        ordered (bool): Whether the results are produced in the order of the stream, rather
+            than as soon as their chunk is processed.
+        start_method (Optional[str]): The `multiprocessing` start method of the workers, such
+            as `"spawn"`, `"forkserver"` or `"fork"`. Defaults to the platform default. `"fork"`
+            starts workers fastest but is unsafe in processes running threads.
+
+    Yields:
+        Any: The elements produced by the function for each chunk.
+    """
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(items)
+    chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+    apply = partial(_apply, pickle.dumps(function))
+    try:
+        for results in _imap(_pool(workers, start_method), apply, chunks, 2 * workers, ordered):
+            yield from results
+    except BrokenProcessPool:
+        with _POOLS_LOCK:
+            _POOLS.pop((workers, start_method), None)
+
+        raise
+
+
+def concurrent_map(
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: Optional[int] = None,
+    buffer: Optional[int] = None,
+    ordered: bool = True,  # noqa: FBT001, FBT002
+) -> Iterator[Any]:
+    """Applies a function to each element of a stream in a pool of threads.
+
+    At most `buffer` calls are in flight at any time, so that no more of the stream is read
+    than needed. Closing the returned iterator cancels the calls that have not started yet.
+
+    Args:
+        function (Callable[[Any], Any]): The function to apply.
+        items (Iterable[Any]): The elements to process.
+        max_workers (Optional[int]): The number of threads. Defaults to the number of CPUs
+            plus four, capped at 32, like `ThreadPoolExecutor`.
+        buffer (Optional[int]): The maximum number of calls in flight. Defaults to twice the
+            number of threads.
+        ordered (bool): Whether the results are produced in the order of the stream, rather
+            than as soon as they are available.
+
+    Yields:
+        Any: The result of the function for each element.
+    """
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        yield from _imap(executor, function, items, buffer or 2 * max_workers, ordered)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _imap(
+    executor: Executor,
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    in_flight: int,
+    ordered: bool,  # noqa: FBT001
+) -> Iterator[Any]:
+    """Maps a function over a stream through an executor, bounding the calls in flight.
+
+    The calls that have not started yet are cancelled once the iterator is closed.
+    """
+    iterator = iter(items)
+    pending: deque[Future[Any]] = deque()
+    running: set[Future[Any]] = set()
+    try:
+        pending.extend(executor.submit(function, item) for item in islice(iterator, in_flight))
+        if ordered:
+            while pending:
+                result = pending.popleft().result()
+                pending.extend(executor.submit(function, item) for item in islice(iterator, 1))
+                yield result
+
+            return
+
+        running.update(pending)
+        pending.clear()
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            running.update(executor.submit(function, item) for item in islice(iterator, len(done)))
+            for future in done:
+                yield future.result()
+    finally:
+        for future in (*pending, *running):
+            future.cancel()
+
+
+def _pool(workers: int, start_method: Optional[str]) -> ProcessPoolExecutor:
+    """Returns the shared pool of worker processes, starting it on first use."""
+    with _POOLS_LOCK:
+        key = (workers, start_method)
+        if key not in _POOLS:
+            context = multiprocessing.get_context(start_method)
+            _POOLS[key] = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+        return _POOLS[key]
+
+
+def _apply(function: bytes, chunk: list[Any]) -> list[Any]:
+    """Applies a pickled function to a chunk in a worker process, unpickling the function only
+    when it differs from the one applied last.
+    """
+    if _WORKER.get("pickled") != function:
+        _WORKER["function"] = pickle.loads(function)  # noqa: S301
+        _WORKER["pickled"] = function
+
+    apply: Callable[[list[Any]], list[Any]] = _WORKER["function"]
+    return apply(chunk)
@@ -0,0 +1,456 @@
+"""Execution of the logical plan of a query."""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import lru_cache, partial
+from heapq import nlargest, nsmallest
+from typing import Any, NamedTuple, Optional, Union, overload
+
+from querpyable.fields import Field, KeySelector, compile_key, is_field
+from querpyable.parallel import concurrent_map, parallel_map
+from querpyable.sorting import external_sort
+
+
+class Stage(NamedTuple):
+    """A single operator recorded by a Queryable.
+
+    Attributes:
+        op (str): The name of the operator, e.g. `"where"` or `"take"`.
+        args (tuple[Any, ...]): The arguments the operator was invoked with.
+    """
+
+    op: str
+    args: tuple[Any, ...] = ()
+
+
+FUSABLE = frozenset({"where", "select", "select_many", "of_type", "skip", "take"})
+"""The operators that can be compiled into a single fused loop."""
+
+PARALLELIZABLE = frozenset({"where", "select", "select_many", "of_type"})
+"""The operators that can be executed independently on chunks of the input."""
+
+MAX_FUSED_STAGES = 32
+"""The maximum number of stages compiled into a single loop."""
+
+MAX_FUSED_LOOPS = 16
+"""The maximum number of nested loops (one per `select_many`) of a single fused loop."""
+
+INDEX_PRESERVING = frozenset({"select", "skip", "take", "reverse"})
+"""The operators whose output elements can be located by index in their input."""
+
+INDEXABLE = (list, tuple, range, str, bytes)
+"""The sequence types indexed in constant time, whose leading `skip`, `take` and `reverse`
+stages are applied by indexing rather than by iterating."""
+
+
+class IndexView(Sequence[Any]):
+    """A random-access view of the result of a query over a sequence.
+
+    The view is only available while every stage of the query preserves positions, in which
+    case each resulting element maps to a single element of the source. Indexing, `len` and
+    `reversed` then take constant time, and the selectors are only applied to the elements
+    that are actually accessed.
+
+    Attributes:
+        sequence (Sequence[Any]): The source sequence.
+        indices (range): The indices of the source elements making up the result.
+        selectors (tuple[Callable[[Any], Any], ...]): The selectors applied to each element.
+    """
+
+    def __init__(
+        self,
+        sequence: Sequence[Any],
+        indices: range,
+        selectors: tuple[Callable[[Any], Any], ...] = (),
+    ) -> None:
+        """Initializes an IndexView.
+
+        Args:
+            sequence (Sequence[Any]): The source sequence.
+            indices (range): The indices of the source elements making up the result.
+            selectors (tuple[Callable[[Any], Any], ...]): The selectors to apply, in order.
+        """
+        self.sequence = sequence
+        self.indices = indices
+        self.selectors = selectors
+
+    def __len__(self) -> int:
+        """Returns the number of elements of the view."""
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "IndexView": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Returns the element at the given position, or a sub-view for a slice."""
+        if isinstance(index, slice):
+            return IndexView(self.sequence, self.indices[index], self.selectors)
+
+        item = self.sequence[self.indices[index]]
+        for selector in self.selectors:
+            item = selector(item)
+
+        return item
+
+    def as_range(self) -> Optional[range]:
+        """Returns the view as a range, if it selects from a range without any selector.
+
+        Returns:
+            Optional[range]: The equivalent range, or None if the view does not select from a
+                range or applies selectors to its elements.
+        """
+        if self.selectors or not isinstance(self.sequence, range):
+            return None
+
+        return _compose(self.sequence, self.indices)
+
+
+def index_view(source: Iterable[Any], stages: tuple[Stage, ...]) -> Optional[IndexView]:
+    """Returns a random-access view of the result of a query, if one is available.
+
+    Args:
+        source (Iterable[Any]): The source elements.
+        stages (tuple[Stage, ...]): The stages of the query, in order.
+
+    Returns:
+        Optional[IndexView]: The view, or None if the source is not a sequence indexed in
+            constant time or any stage does not preserve positions.
+    """
+    if not isinstance(source, INDEXABLE):
+        return None
+
+    if any(stage.op not in INDEX_PRESERVING for stage in stages):
+        return None
+
+    indices = range(len(source))
+    selectors = []
+    for stage in stages:
+        if stage.op == "select":
+            selectors.append(stage.args[0])
+        else:
+            indices = _slice(indices, stage)
+
+    return IndexView(source, indices, tuple(selectors))
+
+
+def _slice(indices: range, stage: Stage) -> range:
+    """Applies a `skip`, `take` or `reverse` stage to a range of indices."""
+    if stage.op == "reverse":
+        return indices[::-1]
+
+    (count,) = stage.args
+    if stage.op == "skip":
+        return indices[max(count, 0) :]
+
+    return indices[: max(count, 0)]
+
+
+def _compose(sequence: range, indices: range) -> range:
+    """Returns the elements of a range at the given indices as a range, in constant time."""
+    start, step = sequence.start, sequence.step
+    return range(start + step * indices.start, start + step * indices.stop, step * indices.step)
+
+
+def _select(sequence: Sequence[Any], indices: range) -> Iterable[Any]:
+    """Returns the elements of a sequence at the given indices lazily, without copying them."""
+    if isinstance(sequence, range):
+        return _compose(sequence, indices)
+
+    return map(sequence.__getitem__, indices)
+
+
+def execute(source: Iterable[Any], stages: tuple[Stage, ...]) -> Iterator[Any]:
+    """Executes a sequence of stages over a source.
+
+    Runs of consecutive element-wise stages are compiled into a single generator, so that each
+    element flows through the whole run within one frame instead of one generator per
+    operator. The remaining stages are dispatched to their entry in `OPERATORS`.
+
+    Args:
+        source (Iterable[Any]): The source elements.
+        stages (tuple[Stage, ...]): The stages to apply, in order.
+
+    Returns:
+        Iterator[Any]: An iterator over the resulting elements.
+    """
+    iterable, stages = _seek(source, stages)
+    run: list[Stage] = []
+    for stage in stages:
+        if stage.op in FUSABLE:
+            run.append(stage)
+            continue
+
+        iterable = OPERATORS[stage.op](_fuse(iterable, run), *stage.args)
+        run = []
+
+    return iter(_fuse(iterable, run))
+
+
+def _seek(
+    source: Iterable[Any],
+    stages: tuple[Stage, ...],
+) -> tuple[Iterable[Any], tuple[Stage, ...]]:
+    """Applies the leading `skip`, `take` and `reverse` stages of a query over a sequence
+    indexed in constant time by streaming the selected indices.
+    """
+    if not isinstance(source, INDEXABLE):
+        return source, stages
+
+    indices = range(len(source))
+    count = 0
+    for stage in stages:
+        if stage.op not in ("skip", "take", "reverse"):
+            break
+
+        indices = _slice(indices, stage)
+        count += 1
+
+    if count == 0:
+        return source, stages
+
+    return _select(source, indices), stages[count:]
+
+
+def _fuse(iterable: Iterable[Any], stages: list[Stage]) -> Iterable[Any]:
+    """Applies a run of element-wise stages to an iterable through compiled loops."""
+    for segment in _segments(stages):
+        loop = _compile(tuple((stage.op, len(stage.args)) for stage in segment))
+        iterable = loop(iterable, *(arg for stage in segment for arg in stage.args))
+
+    return iterable
+
+
+def _segments(stages: list[Stage]) -> Iterator[list[Stage]]:
+    """Splits stages into chunks small enough to be compiled into a single loop."""
+    start, loops = 0, 0
+    for index, stage in enumerate(stages):
+        loops += stage.op == "select_many"
+        if index - start == MAX_FUSED_STAGES or loops > MAX_FUSED_LOOPS:
+            yield stages[start:index]
+            start, loops = index, int(stage.op == "select_many")
+
+    if start < len(stages):
+        yield stages[start:]
+
+
+@lru_cache(maxsize=256)
+def _compile(signature: tuple[tuple[str, int], ...]) -> Callable[..., Iterator[Any]]:
+    """Generates a generator function running the given operators in a single loop.
+
+    The signature lists each operator along with its number of arguments. The generated
+    function takes the source iterable followed by the arguments of every operator. Filters
+    nest the remaining operators in an `if` block, projections rebind the current element,
+    `select_many` opens a nested loop, and `take` returns as soon as its quota is met, so no
+    element is pulled from the source after the last one is produced.
+    """
+    params = ", ".join(
+        f"a{index}_{position}"
+        for index, (_, arity) in enumerate(signature)
+        for position in range(arity)
+    )
+    prologue: list[str] = []
+    body: list[str] = []
+
+    def emit(index: int, depth: int) -> None:
+        pad = "    " * depth
+        if index == len(signature):
+            body.append(f"{pad}yield x")
+            return
+
+        (op, arity), arg, counter = signature[index], f"a{index}_0", f"c{index}"
+        if op == "where":
+            condition = " and ".join(f"a{index}_{position}(x)" for position in range(arity))
+            body.append(f"{pad}if {condition}:")
+            emit(index + 1, depth + 1)
+        elif op == "of_type":
+            body.append(f"{pad}if isinstance(x, {arg}):")
+            emit(index + 1, depth + 1)
+        elif op == "select":
+            body.append(f"{pad}x = {arg}(x)")
+            emit(index + 1, depth)
+        elif op == "select_many":
+            body.append(f"{pad}for x in {arg}(x):")
+            emit(index + 1, depth + 1)
+        elif op == "skip":
+            prologue.append(f"{counter} = 0")
+            body.append(f"{pad}if {counter} < {arg}:")
+            body.append(f"{pad}    {counter} += 1")
+            body.append(f"{pad}else:")
+            emit(index + 1, depth + 1)
+        elif op == "take":
+            prologue.append(f"if {arg} <= 0:")
+            prologue.append("    return")
+            prologue.append(f"{counter} = 0")
+            body.append(f"{pad}{counter} += 1")
+            emit(index + 1, depth)
+            body.append(f"{pad}if {counter} >= {arg}:")
+            body.append(f"{pad}    return")
+        else:
+            msg = f"Operator '{op}' cannot be fused."
+            raise ValueError(msg)
+
+    emit(0, 2)
+
+    lines = [f"def fused(source, {params}):" if params else "def fused(source):"]
+    lines.extend(f"    {line}" for line in prologue)
+    lines.append("    for x in source:")
+    lines.extend(body)
+
+    namespace: dict[str, Any] = {}
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["fused"]
+
+
+SortKeys = tuple[tuple[KeySelector, bool], ...]
+"""The key selectors of an ordering, along with whether each one is descending."""
+
+
+class Descending:
+    """Wraps a sort key so that it compares in reverse order.
+
+    Attributes:
+        value (Any): The wrapped sort key.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        """Initializes a Descending sort key.
+
+        Args:
+            value (Any): The sort key to reverse.
+        """
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the wrapped keys for equality."""
+        return isinstance(other, Descending) and self.value == other.value
+
+    def __lt__(self, other: "Descending") -> bool:
+        """Orders the wrapped keys in reverse."""
+        return bool(other.value < self.value)
+
+
+def composite_key(keys: SortKeys) -> tuple[Callable[[Any], Any], bool]:
+    """Combines the key selectors of an ordering into a single sort key.
+
+    When every key has the same direction the keys are compared as a plain tuple, sorting in
+    reverse if they are all descending. If they are all field specifications, the tuple is
+    extracted by a single compiled getter. Otherwise, descending keys are wrapped in
+    `Descending` so that a single ascending sort honours every direction without negating any
+    key.
+
+    Args:
+        keys (SortKeys): The key selectors along with whether each one is descending.
+
+    Returns:
+        tuple[Callable[[Any], Any], bool]: The composite key selector and whether the sort
+            must be performed in reverse.
+    """
+    directions = {descending for _, descending in keys}
+
+    if len(keys) == 1:
+        return compile_key(keys[0][0]), keys[0][1]
+
+    if len(directions) == 1 and all(is_field(key) for key, _ in keys):
+        fields = (field for field, _ in keys)
+        paths = tuple(path for field in fields for path in _paths(field))
+        return compile_key(paths), directions.pop()
+
+    selectors = tuple((compile_key(key), descending) for key, descending in keys)
+    if len(directions) == 1:
+        return lambda item: tuple(get(item) for get, _ in selectors), directions.pop()
+
+    def key(item: Any) -> tuple[Any, ...]:
+        return tuple(
+            Descending(get(item)) if descending else get(item) for get, descending in selectors
+        )
+
+    return key, False
+
+
+def _paths(field: Field) -> tuple[str, ...]:
+    """Returns the paths of a field specification."""
+    return (field,) if isinstance(field, str) else field
+
+
+def _order_by(
+    items: Iterable[Any],
+    keys: SortKeys,
+    memory_budget: Optional[int] = None,
+) -> Iterator[Any]:
+    """Sorts the elements in a single stable pass, computing the keys of each element once.
+
+    With a memory budget, the elements are sorted externally, spilling sorted runs to disk.
+    """
+    key, reverse = composite_key(keys)
+    if memory_budget is not None:
+        return external_sort(items, key, reverse, memory_budget)
+
+    return iter(sorted(items, key=key, reverse=reverse))
+
+
+def _reverse(items: Iterable[Any]) -> Iterator[Any]:
+    """Yields the elements in reverse order, buffering them unless they form a sequence."""
+    if isinstance(items, Sequence):
+        return reversed(items)
+
+    return reversed(list(items))
+
+
+def _top_k(items: Iterable[Any], keys: SortKeys, count: int) -> Iterator[Any]:
+    """Selects the first elements of the sorted sequence without sorting all of them.
+
+    A bounded heap is used, taking O(n log k) time and O(k) memory. Ties are broken by the
+    original position of the elements, exactly like a stable sort followed by a slice.
+    """
+    if count <= 0:
+        return iter(())
+
+    key, reverse = composite_key(keys)
+    select = nlargest if reverse else nsmallest
+    return iter(select(count, items, key=key))
+
+
+def _parallel(
+    items: Iterable[Any],
+    workers: Optional[int],
+    chunk_size: int,
+    ordered: bool,  # noqa: FBT001
+    start_method: Optional[str],
+    stages: tuple[Stage, ...],
+) -> Iterator[Any]:
+    """Executes element-wise stages on chunks of the input in a pool of worker processes."""
+    if not stages:
+        return iter(items)
+
+    function = partial(_run_chunk, stages)
+    return parallel_map(function, items, workers, chunk_size, ordered, start_method)
+
+
+def _run_chunk(stages: tuple[Stage, ...], chunk: list[Any]) -> list[Any]:
+    """Executes element-wise stages over a chunk of elements."""
+    return list(_fuse(chunk, list(stages)))
+
+
+def _select_concurrent(
+    items: Iterable[Any],
+    selector: Callable[[Any], Any],
+    max_workers: Optional[int],
+    buffer: Optional[int],
+    ordered: bool,  # noqa: FBT001
+) -> Iterator[Any]:
+    """Projects the elements in a pool of threads."""
+    return concurrent_map(selector, items, max_workers, buffer, ordered)
+
+
+OPERATORS: dict[str, Callable[..., Iterator[Any]]] = {
+    "order_by": _order_by,
+    "parallel": _parallel,
+    "reverse": _reverse,
+    "select_concurrent": _select_concurrent,
+    "top_k": _top_k,
+}
+"""The implementations of the operators that cannot be fused, by name."""
@@ -1,12 +1,46 @@
-from collections.abc import Callable, Iterable, Iterator
-from itertools import chain
-from typing import Optional, TypeVar, Union
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence, Sized
+from functools import partial
+from heapq import merge
+from itertools import chain, compress, islice
+from typing import IO, Any, Optional, TypeVar, Union
+
+from querpyable.aggregates import STATS, Aggregate, aggregate_many
+from querpyable.columnar import Factory, Table
+from querpyable.fields import Field, KeySelector, compile_key, freeze
+from querpyable.joins import merge_join, partitioned_hash_join
+from querpyable.lookup import Lookup
+from querpyable.merging import merge_except, merge_intersect, merge_union
+from querpyable.optimizer import optimize, sort_keys
+from querpyable.parallel import CHUNK_SIZE
+from querpyable.pipeline import (
+    IndexView,
+    SortKeys,
+    Stage,
+    composite_key,
+    execute,
+    index_view,
+)
+from querpyable.replay import ReplayBuffer
+from querpyable.sinks import FORMATS, WRITE_BATCH_SIZE, open_sink, write_csv
+from querpyable.sketches import BloomFilter, HyperLogLog, SpaceSaving, TDigest
+from querpyable.sorting import external_sort
+from querpyable.sources import (
+    BUFFER_SIZE,
+    FileSource,
+    Path,
+    read_csv,
+    read_jsonl,
+    read_stripped_lines,
+)
 
 T = TypeVar("T")
 U = TypeVar("U")
 K = TypeVar("K")
 V = TypeVar("V")
 
+_MISSING = object()
+
 
 class Queryable(Iterable[T]):
     def __init__(self, collection: Iterable[T]) -> None:
@@ -26,9 +60,163 @@ class Queryable(Iterable[T]):
             ```
         """
         self.collection = collection
+        self._stages: tuple[Stage, ...] = ()
 
     def __iter__(self) -> Iterator[T]:
-        yield from self.collection
+        return self._execute()
+
+    def _execute(self, terminal: Optional[str] = None) -> Iterator[T]:
+        """Optimizes and executes the logical plan of the Queryable.
+
+        Args:
+            terminal (Optional[str]): The name of the terminal operator consuming the result,
+                allowing the optimizer to drop work the terminal does not depend on.
+
+        Returns:
+            Iterator[T]: An iterator over the resulting elements.
+        """
+        if not self._stages:
+            return iter(self.collection)
+
+        return execute(self.collection, optimize(self._stages, terminal))
+
+    def _index_view(self, terminal: Optional[str] = None) -> Optional[IndexView]:
+        """Returns a random-access view of the result, if the source is a sequence and every
+        stage of the optimized plan preserves positions.
+        """
+        return index_view(self.collection, optimize(self._stages, terminal))
+
+    def _range(self, terminal: Optional[str] = None) -> Optional[range]:
+        """Returns the result as a range, if the source is a range and the optimized plan
+        only consists of positional stages, allowing terminals to answer in constant time.
+        """
+        view = self._index_view(terminal)
+        return None if view is None else view.as_range()
+
+    def _size(self) -> Optional[int]:
+        """Returns the number of elements, if it is known without iterating."""
+        if not self._stages and isinstance(self.collection, Sized):
+            return len(self.collection)
+
+        view = self._index_view()
+        return None if view is None else len(view)
+
+    def _pairs(
+        self,
+        inner: Iterable[U],
+        outer_key_selector: KeySelector,
+        inner_key_selector: KeySelector,
+        strategy: str,
+        memory_budget: Optional[int],
+    ) -> Iterator[tuple[T, Sequence[U]]]:
+        """Pairs each element with the inner elements sharing its key using a join strategy."""
+        outer_key_selector = compile_key(outer_key_selector)
+        inner_key_selector = compile_key(inner_key_selector)
+        if strategy == "merge":
+            if memory_budget is not None:
+                msg = "A memory budget only applies to the 'hash' join strategy."
+                raise ValueError(msg)
+
+            return merge_join(self, inner, outer_key_selector, inner_key_selector)
+
+        if strategy != "hash":
+            msg = f"Unknown join strategy '{strategy}'."
+            raise ValueError(msg)
+
+        if memory_budget is not None:
+            return partitioned_hash_join(
+                self,
+                inner,
+                outer_key_selector,
+                inner_key_selector,
+                memory_budget,
+            )
+
+        return self._probe(inner, outer_key_selector, inner_key_selector)
+
+    def _probe(
+        self,
+        inner: Iterable[U],
+        outer_key_selector: Callable[[T], K],
+        inner_key_selector: Callable[[U], K],
+    ) -> Iterator[tuple[T, Sequence[U]]]:
+        """Pairs each element with the inner elements sharing its key through a hash lookup.
+
+        The lookup is built over the inner elements. When both sizes are known and the outer
+        sequence is the smaller one, its keys are collected first and the lookup only retains
+        the inner elements matching them, bounding memory by the smaller input.
+        """
+        outer_size, inner_size = self._size(), _size(inner)
+        if outer_size is None or inner_size is None or outer_size >= inner_size:
+            lookup = Lookup.build(inner, inner_key_selector)
+            for item in self:
+                yield item, lookup[outer_key_selector(item)]
+
+            return
+
+        outer = list(self)
+        keys = [outer_key_selector(item) for item in outer]
+        lookup = Lookup.build(inner, inner_key_selector, keys=set(keys))
+        for item, key in zip(outer, keys):
+            yield item, lookup[key]
+
+    def _last(self, predicate: Optional[Callable[[T], bool]]) -> tuple[bool, Optional[T]]:
+        """Finds the last element satisfying the optional predicate, along with whether one was
+        found, scanning random-access results backwards.
+        """
+        view = self._index_view()
+        if view is not None:
+            for item in reversed(view):
+                if predicate is None or predicate(item):
+                    return True, item
+
+            return False, None
+
+        found, result = False, None
+        for item in self:
+            if predicate is None or predicate(item):
+                found, result = True, item
+
+        return found, result
+
+    def _element_at(self, index: int) -> tuple[bool, Optional[T]]:
+        """Finds the element at the given index, along with whether one exists, indexing
+        random-access results directly.
+        """
+        if index < 0:
+            return False, None
+
+        view = self._index_view()
+        if view is not None:
+            return (True, view[index]) if index < len(view) else (False, None)
+
+        for item in self.skip(index)._execute("first"):
+            return True, item
+
+        return False, None
+
+    def _chain(self, op: str, *args: Any) -> "Queryable[Any]":
+        """Returns a new Queryable over the same source with an additional stage.
+
+        Operators are recorded rather than wrapped around `self`, building up a logical plan
+        that is optimized and executed by fused loops when iterated.
+        """
+        return self._derive((*self._stages, Stage(op, args)))
+
+    def _derive(
+        self,
+        stages: tuple[Stage, ...],
+        cls: Optional[type["Queryable[Any]"]] = None,
+    ) -> "Queryable[Any]":
+        """Returns a new Queryable of the given type over the same source with the given stages."""
+        queryable = (cls or Queryable)(self.collection)
+        queryable._stages = stages
+        return queryable
+
+    def _order(self, keys: SortKeys, memory_budget: Optional[int] = None) -> "OrderedQueryable[T]":
+        """Returns a new OrderedQueryable sorting the elements by the given keys."""
+        args = (keys,) if memory_budget is None else (keys, memory_budget)
+        return self._derive((*self._stages, Stage("order_by", args)), OrderedQueryable)
 
     @classmethod
     def range(cls, start: int, stop: Optional[int] = None, step: int = 1) -> "Queryable[int]":
@@ -75,6 +263,202 @@ class Queryable(Iterable[T]):
         """
         return cls([])
 
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Any],
+        fields: Optional[Sequence[str]] = None,
+    ) -> "ColumnarQueryable[Any]":
+        """Create a ColumnarQueryable storing the given records one column per field.
+
+        Args:
+            records (Iterable[Any]): The records, which may be mappings, dataclass instances,
+                named tuples or plain objects.
+            fields (Optional[Sequence[str]]): The names of the fields to store. Defaults to
+                every field encountered.
+
+        Returns:
+            ColumnarQueryable: A ColumnarQueryable over the records.
+
+        Example:
+            ```python
+            records = [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
+            people = Queryable.from_records(records)
+            result = people.where(lambda age: age > 26, on="age").select("name").to_list()
+            print(result)  # Output: ['Alice']
+            ```
+        """
+        return ColumnarQueryable(Table.from_records(records, fields))
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Mapping[str, Sequence[Any]],
+        factory: Factory = dict,
+    ) -> "ColumnarQueryable[Any]":
+        """Create a ColumnarQueryable over the given columns.
+
+        Args:
+            columns (Mapping[str, Sequence[Any]]): The values of each field, in record order.
+            factory (Callable[..., Any]): The callable building a record from its fields, passed
+                as keyword arguments. Defaults to `dict`.
+
+        Returns:
+            ColumnarQueryable: A ColumnarQueryable over the records formed by the columns.
+
+        Example:
+            ```python
+            people = Queryable.from_columns({"name": ["Alice", "Bob"], "age": [30, 25]})
+            print(people.order_by("age").to_list())
+            # Output: [{'name': 'Bob', 'age': 25}, {'name': 'Alice', 'age': 30}]
+            ```
+        """
+        return ColumnarQueryable(Table(columns, factory))
+
+    @classmethod
+    def from_lines(
+        cls,
+        path: Path,
+        encoding: str = "utf-8",
+        buffer_size: int = BUFFER_SIZE,
+        use_mmap: bool = False,  # noqa: FBT001, FBT002
+    ) -> "Queryable[str]":
+        """Create a Queryable over the lines of a text file, without their line endings.
+
+        The file is read lazily, in constant memory, and only as far as the query needs, so
+        that `take` or `first` stop reading early. It is read again each time the Queryable is
+        iterated.
+
+        Args:
+            path (Path): The path of the file.
+            encoding (str): The encoding of the file.
+            buffer_size (int): The size of the read buffer, in bytes.
+            use_mmap (bool): Whether to map the file into memory instead of reading it through
+                a buffer.
+
+        Returns:
+            Queryable[str]: A Queryable over the lines of the file.
+
+        Example:
+            ```python
+            errors = Queryable.from_lines("app.log").where(lambda line: "ERROR" in line)
+            print(errors.take(10).to_list())
+            ```
+        """
+        return cls(FileSource(read_stripped_lines, path, encoding, buffer_size, use_mmap))
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: Path,
+        columns: Optional[Sequence[str]] = None,
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+        buffer_size: int = BUFFER_SIZE,
+        use_mmap: bool = False,  # noqa: FBT001, FBT002
+    ) -> "Queryable[dict[str, Optional[str]]]":
+        """Create a Queryable over the rows of a CSV file with a header row.
+
+        The file is read lazily and re-read on each iteration, as with `from_lines`. Each row is
+        a dict of its values, as strings, by column name. Only the requested columns are
+        extracted from each row. As with `csv.DictReader`, blank rows are skipped and the values
+        missing from short rows are None.
+
+        Args:
+            path (Path): The path of the file.
+            columns (Optional[Sequence[str]]): The names of the columns to extract. Defaults to
+                every column of the header.
+            delimiter (str): The character separating the values.
+            encoding (str): The encoding of the file.
+            buffer_size (int): The size of the read buffer, in bytes.
+            use_mmap (bool): Whether to map the file into memory instead of reading it through
+                a buffer.
+
+        Returns:
+            Queryable[dict[str, Optional[str]]]: A Queryable over the rows of the file.
+
+        Raises:
+            ValueError: When iterated, if a requested column is missing from the header.
+
+        Example:
+            ```python
+            sales = Queryable.from_csv("sales.csv", columns=["region", "amount"])
+            print(sales.select(lambda row: float(row["amount"])).sum())
+            ```
+        """
+        args = (path, columns, delimiter, encoding, buffer_size, use_mmap)
+        return cls(FileSource(read_csv, *args))
+
+    @classmethod
+    def from_jsonl(
+        cls,
+        path: Path,
+        fields: Optional[Sequence[str]] = None,
+        encoding: str = "utf-8",
+        buffer_size: int = BUFFER_SIZE,
+        use_mmap: bool = False,  # noqa: FBT001, FBT002
+    ) -> "Queryable[Any]":
+        """Create a Queryable over the values of a JSON Lines file, one per line.
+
+        The file is read lazily and re-read on each iteration, as with `from_lines`. Blank lines
+        are skipped.
+
+        Args:
+            path (Path): The path of the file.
+            fields (Optional[Sequence[str]]): The fields to keep from each object, missing
+                fields being None. Defaults to the whole values.
+            encoding (str): The encoding of the file.
+            buffer_size (int): The size of the read buffer, in bytes.
+            use_mmap (bool): Whether to map the file into memory instead of reading it through
+                a buffer.
+
+        Returns:
+            Queryable[Any]: A Queryable over the values of the file.
+
+        Example:
+            ```python
+            clicks = Queryable.from_jsonl("clicks.jsonl", fields=["user", "page"])
+            print(clicks.distinct("['user']").count())
+            ```
+        """
+        return cls(FileSource(read_jsonl, path, fields, encoding, buffer_size, use_mmap))
+
+    @classmethod
+    def merge_sorted(
+        cls,
+        *sources: Iterable[T],
+        key: Optional[KeySelector] = None,
+        descending: bool = False,
+    ) -> "Queryable[T]":
+        """Create a Queryable merging sources that are each sorted by the same key.
+
+        The sources are merged lazily with a heap, holding a single element of each source in
+        memory. The merge is stable: elements with equal keys are taken from earlier sources
+        first. The result is known to be sorted, as if by `assume_sorted`.
+
+        Args:
+            *sources (Iterable[T]): The sorted sources.
+            key (Optional[KeySelector]): A function or field specification selecting the key
+                the sources are sorted by. Defaults to the elements themselves.
+            descending (bool): Whether the sources are sorted in descending order.
+
+        Returns:
+            Queryable: A Queryable over the elements of every source, in sorted order.
+
+        Example:
+            ```python
+            shards = [[1, 4, 7], [2, 5, 8], [3, 6, 9]]
+            print(Queryable.merge_sorted(*shards).to_list())
+            # Output: [1, 2, 3, 4, 5, 6, 7, 8, 9]
+            ```
+        """
+        get, reverse = composite_key(((key or _identity, descending),))
+
+        def _():
+            yield from merge(*sources, key=get, reverse=reverse)
+
+        return Queryable(_Deferred(_)).assume_sorted(key, descending)
+
     def where(self, predicate: Callable[[T], bool]) -> "Queryable[T]":
         """Filters the elements of the Queryable based on a given predicate.
 
@@ -102,7 +486,7 @@ class Queryable(Iterable[T]):
             # Output: [2, 4]
             ```
         """
-        return Queryable(item for item in self if predicate(item))
+        return self._chain("where", predicate)
 
     def select(self, selector: Callable[[T], U]) -> "Queryable[T]":
         """Projects each element of the Queryable using the provided selector function.
@@ -125,15 +509,154 @@ class Queryable(Iterable[T]):
             # The 'result' Queryable will contain [2, 4, 6, 8, 10]
             ```
         """
-        return Queryable(selector(item) for item in self)
+        return self._chain("select", selector)
+
+    def select_concurrent(
+        self,
+        selector: Callable[[T], U],
+        max_workers: Optional[int] = None,
+        ordered: bool = True,  # noqa: FBT001, FBT002
+        buffer: Optional[int] = None,
+    ) -> "Queryable[U]":
+        """Projects each element of the Queryable in a pool of threads.
+
+        This is meant for I/O-bound selectors, which spend most of their time blocked and can
+        therefore overlap. The Queryable remains lazy: at most `buffer` calls are in flight at
+        any time, and no more elements are read than needed by downstream operators.
+
+        Args:
+            selector (Callable[[T], U]): A function that maps elements of the Queryable to a new value.
+            max_workers (Optional[int]): The number of threads. Defaults to the number of CPUs
+                plus four, capped at 32.
+            ordered (bool): Whether the results preserve the order of the elements, rather than
+                being produced as soon as they are available.
+            buffer (Optional[int]): The maximum number of calls in flight. Defaults to twice the
+                number of threads.
+
+        Returns:
+            Queryable: A new Queryable containing the results of applying the selector function to each element.
+
+        Example:
+            ```python
+            from urllib.request import urlopen
+
+            urls = Queryable(["https://example.com", "https://example.org"])
+            pages = urls.select_concurrent(lambda url: urlopen(url).read(), max_workers=8)
+            ```
+        """
+        return self._chain("select_concurrent", selector, max_workers, buffer, ordered)
+
+    def select_batch(
+        self,
+        selector: Callable[[list[T]], Sequence[U]],
+        size: int = 1024,
+    ) -> "Queryable[U]":
+        """Projects the elements in batches, calling the selector once per batch.
+
+        This amortises the fixed cost of each call for selectors such as model inference or
+        bulk database lookups. The batches are formed and projected lazily, so that only a
+        single batch is held in memory, and the results are produced one by one, in order.
+
+        Args:
+            selector (Callable[[list[T]], Sequence[U]]): A function mapping a list of elements
+                to the list of their projections, in the same order.
+            size (int): The maximum number of elements of each batch.
+
+        Returns:
+            Queryable[U]: A new Queryable containing the projection of each element.
+
+        Raises:
+            ValueError: If the size is not positive, or, when iterated, if the selector does
+                not return a result per element.
+
+        Example:
+            ```python
+            texts = Queryable(["good", "bad", "great"])
+            scores = texts.select_batch(model.predict, size=256)
+            ```
+        """
+        if size <= 0:
+            msg = "The size must be positive."
+            raise ValueError(msg)
+
+        def _():
+            for batch in _batches(self, size):
+                yield from _results(batch, selector(batch))
+
+        return Queryable(_Deferred(_))
+
+    def where_batch(
+        self,
+        predicate: Callable[[list[T]], Sequence[bool]],
+        size: int = 1024,
+    ) -> "Queryable[T]":
+        """Filters the elements in batches, calling the predicate once per batch.
+
+        Like `select_batch`, this amortises the fixed cost of each call, while the remaining
+        elements are produced one by one, in order.
+
+        Args:
+            predicate (Callable[[list[T]], Sequence[bool]]): A function mapping a list of
+                elements to whether each of them should be included in the result.
+            size (int): The maximum number of elements of each batch.
+
+        Returns:
+            Queryable[T]: A new Queryable containing the elements satisfying the predicate.
+
+        Raises:
+            ValueError: If the size is not positive, or, when iterated, if the predicate does
+                not return a result per element.
+
+        Example:
+            ```python
+            ids = Queryable(range(1, 10_001))
+            missing = ids.where_batch(lambda batch: [not found for found in db.exists(batch)])
+            ```
+        """
+        if size <= 0:
+            msg = "The size must be positive."
+            raise ValueError(msg)
+
+        def _():
+            for batch in _batches(self, size):
+                yield from compress(batch, _results(batch, predicate(batch)))
+
+        return Queryable(_Deferred(_))
 
-    def distinct(self) -> "Queryable[T]":
+    def distinct(
+        self,
+        key: Optional[KeySelector] = None,
+        *,
+        window: Optional[int] = None,
+        false_positive_rate: Optional[float] = None,
+        capacity: int = 1_000_000,
+    ) -> "Queryable[T]":
         """Returns a new Queryable containing distinct elements from the original
-        Queryable.
+        Queryable, keeping the first element of each key in order.
+
+        Keys that are not hashable, such as dicts or lists, are frozen into equal hashable
+        values, so that rows can be deduplicated without converting them beforehand. By default,
+        every distinct key is kept in memory. Memory is bounded either by only remembering the
+        `window` most recently seen keys, which removes duplicates that occur close to each other
+        in a stream, or by recording keys in a Bloom filter, which may drop an element that is
+        not a duplicate with the given false positive rate.
+
+        Args:
+            key (Optional[KeySelector]): A function or field specification selecting the key
+                elements are compared by. Defaults to the elements themselves.
+            window (Optional[int]): The number of most recently seen keys to remember.
+            false_positive_rate (Optional[float]): The probability of dropping an element whose
+                key was not seen before, enabling the Bloom filter mode.
+            capacity (int): The expected number of distinct keys in the Bloom filter mode.
 
         Returns:
             Queryable: A new Queryable with distinct elements.
 
+        Raises:
+            ValueError: If both `window` and `false_positive_rate` are given, `window` is not
+                positive, or the Bloom filter `capacity` is not positive or its
+                `false_positive_rate` is not between 0 and 1.
+
         Example:
             ```python
             data = [1, 2, 2, 3, 4, 4, 5]
@@ -142,17 +665,89 @@ class Queryable(Iterable[T]):
             distinct_queryable = queryable_data.distinct()
 
             # Result: Queryable([1, 2, 3, 4, 5])
+
+            clicks = Queryable([{"user": 1, "page": "a"}, {"user": 1, "page": "b"}])
+            print(clicks.distinct("['user']").to_list())  # Output: [{'user': 1, 'page': 'a'}]
             ```
         """
+        if window is not None and false_positive_rate is not None:
+            msg = "Only one of window and false_positive_rate can be given."
+            raise ValueError(msg)
+
+        if window is not None and window <= 0:
+            msg = "The window must be positive."
+            raise ValueError(msg)
+
+        if false_positive_rate is not None and (capacity <= 0 or not 0 < false_positive_rate < 1):
+            msg = "The capacity must be positive and the false positive rate between 0 and 1."
+            raise ValueError(msg)
+
+        key = None if key is None else compile_key(key)
 
         def _():
-            seen = set()
+            seen = set() if false_positive_rate is None else None
+            recent = {}
+            bloom = None if seen is not None else BloomFilter(capacity, false_positive_rate)
             for item in self:
-                if item not in seen:
-                    seen.add(item)
+                value = item if key is None else key(item)
+                try:
+                    hash(value)
+                except TypeError:
+                    value = freeze(value)
+
+                if bloom is not None:
+                    if bloom.add(value):
+                        yield item
+                elif window is None:
+                    if value not in seen:
+                        seen.add(value)
+                        yield item
+                elif value in recent:
+                    recent[value] = recent.pop(value)
+                else:
+                    recent[value] = None
+                    if len(recent) > window:
+                        del recent[next(iter(recent))]
+
                     yield item
 
-        return Queryable(_())
+        return Queryable(_Deferred(_))
+
+    def distinct_by(
+        self,
+        key_selector: KeySelector,
+        *,
+        window: Optional[int] = None,
+        false_positive_rate: Optional[float] = None,
+        capacity: int = 1_000_000,
+    ) -> "Queryable[T]":
+        """Returns a new Queryable containing the first element of each distinct key.
+
+        This is equivalent to `distinct(key_selector, ...)`.
+
+        Args:
+            key_selector (KeySelector): A function or field specification selecting the key
+                elements are compared by.
+            window (Optional[int]): The number of most recently seen keys to remember.
+            false_positive_rate (Optional[float]): The probability of dropping an element whose
+                key was not seen before, enabling the Bloom filter mode.
+            capacity (int): The expected number of distinct keys in the Bloom filter mode.
+
+        Returns:
+            Queryable: A new Queryable with an element per distinct key.
+
+        Example:
+            ```python
+            words = Queryable(["apple", "avocado", "banana"])
+            print(words.distinct_by(lambda word: word[0]).to_list())  # Output: ['apple', 'banana']
+            ```
+        """
+        return self.distinct(
+            key_selector,
+            window=window,
+            false_positive_rate=false_positive_rate,
+            capacity=capacity,
+        )
 
     def skip(self, count: int) -> "Queryable[T]":
         """Skips the specified number of elements from the beginning of the Queryable.
@@ -175,7 +770,7 @@ class Queryable(Iterable[T]):
             assert list(result) == [3, 4, 5]
             ```
         """
-        return Queryable(item for index, item in enumerate(self) if index >= count)
+        return self._chain("skip", count)
 
     def take(self, count: int) -> "Queryable[T]":
         """Returns a new Queryable containing the first 'count' elements of the current
@@ -196,7 +791,218 @@ class Queryable(Iterable[T]):
         print(result.to_list())  # Output: [1, 2, 3]
         ```
         """
-        return Queryable(item for _, item in zip(range(count), self))
+        return self._chain("take", count)
+
+    def chunk(self, size: int) -> "Queryable[tuple[T, ...]]":
+        """Splits the elements into consecutive batches of a fixed size.
+
+        The batches are produced lazily, so that only a single batch is held in memory.
+
+        Args:
+            size (int): The number of elements of each batch. The last batch may be smaller.
+
+        Returns:
+            Queryable[tuple[T, ...]]: A new Queryable of the batches, as tuples.
+
+        Raises:
+            ValueError: If the size is not positive.
+
+        Example:
+            ```python
+            numbers = Queryable(range(7))
+            print(numbers.chunk(3).to_list())  # Output: [(0, 1, 2), (3, 4, 5), (6,)]
+            ```
+        """
+        if size <= 0:
+            msg = "The size must be positive."
+            raise ValueError(msg)
+
+        def _():
+            iterator = iter(self)
+            yield from iter(lambda: tuple(islice(iterator, size)), ())
+
+        return Queryable(_Deferred(_))
+
+    def window(self, size: int, step: int = 1) -> "Queryable[tuple[T, ...]]":
+        """Returns the sliding windows of consecutive elements.
+
+        The windows are produced lazily from a ring buffer holding the last `size` elements.
+        Only full windows are produced, so that no window is produced if there are fewer than
+        `size` elements.
+
+        Args:
+            size (int): The number of elements of each window.
+            step (int): The number of elements the window advances by. Defaults to 1.
+
+        Returns:
+            Queryable[tuple[T, ...]]: A new Queryable of the windows, as tuples.
+
+        Raises:
+            ValueError: If the size or the step is not positive.
+
+        Example:
+            ```python
+            numbers = Queryable(range(6))
+            print(numbers.window(3).to_list())
+            # Output: [(0, 1, 2), (1, 2, 3), (2, 3, 4), (3, 4, 5)]
+            print(numbers.window(2, step=3).to_list())  # Output: [(0, 1), (3, 4)]
+            ```
+        """
+        if size <= 0 or step <= 0:
+            msg = "The size and the step must be positive."
+            raise ValueError(msg)
+
+        def _():
+            iterator = iter(self)
+            buffer = deque(islice(iterator, size), maxlen=size)
+            if len(buffer) < size:
+                return
+
+            yield tuple(buffer)
+            while True:
+                advance = tuple(islice(iterator, step))
+                if len(advance) < step:
+                    return
+
+                buffer.extend(advance)
+                yield tuple(buffer)
+
+        return Queryable(_Deferred(_))
+
+    def pairwise(self) -> "Queryable[tuple[T, T]]":
+        """Returns the pairs of consecutive elements.
+
+        Returns:
+            Queryable[tuple[T, T]]: A new Queryable of the pairs, one fewer than the elements.
+
+        Example:
+            ```python
+            readings = Queryable([3, 5, 4, 8])
+            deltas = readings.pairwise().select(lambda pair: pair[1] - pair[0])
+            print(deltas.to_list())  # Output: [2, -1, 4]
+            ```
+        """
+
+        def _():
+            iterator = iter(self)
+            previous = next(iterator, _MISSING)
+            if previous is _MISSING:
+                return
+
+            for item in iterator:
+                yield previous, item
+                previous = item
+
+        return Queryable(_Deferred(_))
+
+    def as_parallel(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = CHUNK_SIZE,
+        ordered: bool = True,  # noqa: FBT001, FBT002
+        start_method: Optional[str] = None,
+    ) -> "Queryable[T]":
+        """Executes the subsequent `where`, `select`, `select_many` and `of_type` operators in a
+        pool of worker processes.
+
+        The elements are shipped to the workers in chunks, where the operators following
+        `as_parallel` run as a single fused loop, and the results are reassembled in order.
+        Only a bounded number of chunks is in flight at a time, so a downstream `take`,
+        `first` or `any` stops the computation as soon as it is satisfied. The worker processes
+        are started on first use and shared by every parallel query. The elements and the
+        callables must be picklable, so the callables must be defined at the top level of a
+        module rather than as lambdas or closures.
+
+        Args:
+            workers (Optional[int]): The number of worker processes. Defaults to the number of
+                CPUs.
+            chunk_size (int): The number of elements shipped to a worker at once.
+            ordered (bool): Whether the results preserve the order of the elements. Producing
+                them as soon as their chunk is processed yields higher throughput.
+            start_method (Optional[str]): The `multiprocessing` start method of the workers.
+                Defaults to the platform default. `"fork"` starts workers fastest but is unsafe
+                in processes running threads.
+
+        Returns:
+            Queryable: A new Queryable whose subsequent element-wise operators run in parallel.
+
+        Example:
+            ```python
+            def is_prime(n):
+                return all(n % i != 0 for i in range(2, int(n**0.5) + 1))
+
+            primes = Queryable.range(2, 1_000_000).as_parallel().where(is_prime).take(10000)
+            print(primes.to_list()[:5])  # Output: [2, 3, 5, 7, 11]
+            ```
+        """
+        return self._chain("parallel", workers, chunk_size, ordered, start_method, ())
+
+    def cache(self) -> "Queryable[T]":
+        """Records the elements of the Queryable, so that iterating it again replays them.
+
+        The elements are computed lazily, as far as the furthest consumer has read, and held in
+        a single buffer shared by every iterator of the resulting Queryable and of the queries
+        derived from it. This makes queries over one-shot sources, such as generators, safe to
+        iterate more than once, and avoids recomputing expensive stages. The buffer is held
+        until `release` is called.
+
+        Returns:
+            Queryable: A new, re-iterable Queryable over the recorded elements.
+
+        Example:
+            ```python
+            def expensive(x):
+                print(f"computing {x}")
+                return x * x
+
+            squares = Queryable(range(3)).select(expensive).cache()
+            print(squares.sum())  # Output: computing 0, computing 1, computing 2, 5
+            print(squares.max())  # Output: 4
+            ```
+        """
+        return Queryable(ReplayBuffer(self))
+
+    def memoize(self) -> "Queryable[T]":
+        """Records the elements of the Queryable, so that iterating it again replays them.
+
+        This is an alias of `cache`.
+
+        Returns:
+            Queryable: A new, re-iterable Queryable over the recorded elements.
+        """
+        return self.cache()
+
+    def release(self) -> None:
+        """Discards the elements recorded by `cache`.
+
+        Iterating the Queryable afterwards recomputes the elements from the original query,
+        which must therefore be re-iterable. This has no effect on a Queryable that is not
+        derived from `cache`.
+
+        Example:
+            ```python
+            squares = Queryable(range(3)).select(lambda x: x * x).cache()
+            print(squares.to_list())  # Output: [0, 1, 4]
+            squares.release()
+            ```
+        """
+        if isinstance(self.collection, ReplayBuffer):
+            self.collection.release()
+
+    def reverse(self) -> "Queryable[T]":
+        """Inverts the order of the elements of the Queryable.
+
+        Returns:
+            Queryable: A new Queryable containing the elements in reverse order.
+
+        Example:
+            ```python
+            numbers = Queryable([1, 2, 3, 4, 5])
+            result = numbers.reverse().to_list()
+            print(result)  # Output: [5, 4, 3, 2, 1]
+            ```
+        """
+        return self._chain("reverse")
 
     def of_type(self, type_filter: type[U]) -> "Queryable[T]":
         """Filters the elements of the Queryable to include only items of a specific
@@ -223,7 +1029,7 @@ class Queryable(Iterable[T]):
             print(result)  # Output: Queryable([1, 5])
             ```
         """
-        return Queryable(item for item in self if isinstance(item, type_filter))
+        return self._chain("of_type", type_filter)
 
     def select_many(self, selector: Callable[[T], Iterable[U]]) -> "Queryable[T]":
         """Projects each element of the sequence to an iterable and flattens the
@@ -249,22 +1055,30 @@ class Queryable(Iterable[T]):
             # Output: [1, 2, 3, 4, 5, 6, 7, 8, 9]
             ```
         """
+        return self._chain("select_many", selector)
 
-        def _():
-            for item in self:
-                yield from selector(item)
-
-        return Queryable(_())
-
-    def order_by(self, key_selector: Callable[[T], U]) -> "Queryable[T]":
+    def order_by(
+        self,
+        key_selector: KeySelector,
+        memory_budget: Optional[int] = None,
+    ) -> "OrderedQueryable[T]":
         """Orders the elements of the Queryable based on a key selector function.
 
+        The sort is stable. With a memory budget, inputs larger than the budget are sorted
+        externally: runs of `memory_budget` elements are sorted and spilled to temporary files,
+        then merged lazily as the result is iterated, so that elements and their keys must be
+        picklable.
+
         Args:
-            key_selector (Callable[[T], U]): A function that takes an element of the Queryable
-                and returns a value used for sorting.
+            key_selector (KeySelector): A function that takes an element of the Queryable
+                and returns a value used for sorting, or a field specification such as `"age"`,
+                `"address.city"` or `'["key"]'`, compiled to an `attrgetter` or `itemgetter`.
+            memory_budget (Optional[int]): The maximum number of elements sorted in memory at
+                once. Defaults to sorting every element in memory.
 
         Returns:
-            Queryable: A new Queryable containing the elements sorted based on the key selector.
+            OrderedQueryable: A new OrderedQueryable containing the elements sorted based on the
+                key selector, which can be further ordered using `then_by`.
 
         Example:
             ```python
@@ -276,19 +1090,34 @@ class Queryable(Iterable[T]):
 
             # Output: [(1, 'apple'), (2, 'orange'), (3, 'banana')]
             print(result)
+
+            # Order the Queryable by the same element, through a field specification
+            result = data.order_by("[0]").to_list()
+
+            # Sort more events than fit in memory, a million at a time
+            events = Queryable(read_events()).order_by("timestamp", memory_budget=1_000_000)
             ```
         """
-        return Queryable(item for item in sorted(self, key=key_selector))
+        return self._order(((key_selector, False),), memory_budget)
 
-    def order_by_descending(self, key_selector: Callable[[T], U]) -> "Queryable[T]":
+    def order_by_descending(
+        self,
+        key_selector: KeySelector,
+        memory_budget: Optional[int] = None,
+    ) -> "OrderedQueryable[T]":
         """Orders the elements of the Queryable in descending order based on the
         specified key selector.
 
         Args:
-            key_selector (Callable[[T], U]): A function that extracts a comparable key from each element.
+            key_selector (KeySelector): A function that extracts a comparable key from each
+                element, or a field specification such as `"age"`, `"address.city"`
+                or `'["key"]'`, compiled to an `attrgetter` or `itemgetter`.
+            memory_budget (Optional[int]): The maximum number of elements sorted in memory at
+                once, spilling sorted runs to disk as in `order_by`.
 
         Returns:
-            Queryable: A new Queryable with elements sorted in descending order.
+            OrderedQueryable: A new OrderedQueryable with elements sorted in descending order,
+                which can be further ordered using `then_by`.
 
         Example:
             ```python
@@ -318,14 +1147,17 @@ class Queryable(Iterable[T]):
             # Result: Queryable([Person('Bob', 30), Person('Alice', 25), Person('Charlie', 22)])
             ```
         """
-        return Queryable(item for item in sorted(self, key=key_selector, reverse=True))
+        return self._order(((key_selector, True),), memory_budget)
 
-    def then_by(self, key_selector: Callable[[T], U]) -> "Queryable[T]":
+    def then_by(self, key_selector: KeySelector) -> "OrderedQueryable[T]":
         """Applies a secondary sorting to the elements of the Queryable based on the
         specified key_selector.
 
+        On a Queryable that has not been ordered, this is equivalent to `order_by`.
+
         Args:
-            key_selector (Callable[[T], U]): A function that extracts a key from each element for sorting.
+            key_selector (KeySelector): A function that extracts a key from each element for
+                sorting, or a field specification, as in `order_by`.
 
         Returns:
             Queryable: A new Queryable with the elements sorted first by the existing sorting criteria,
@@ -352,15 +1184,17 @@ class Queryable(Iterable[T]):
             # Result: [Bob(25), Alice(30), Charlie(35)]
             ```
         """
-        return Queryable(item for item in sorted(self, key=key_selector, reverse=False))
+        return self.order_by(key_selector)
 
-    def then_by_descending(self, key_selector: Callable[[T], U]) -> "Queryable[T]":
+    def then_by_descending(self, key_selector: KeySelector) -> "OrderedQueryable[T]":
         """Sorts the elements of the Queryable in descending order based on the
         specified key selector.
 
+        On a Queryable that has not been ordered, this is equivalent to `order_by_descending`.
+
         Args:
-            key_selector (Callable[[T], U]): A function that takes an element of the Queryable and
-                returns a value used for sorting.
+            key_selector (KeySelector): A function that takes an element of the Queryable and
+                returns a value used for sorting, or a field specification, as in `order_by`.
 
         Returns:
             Queryable: A new Queryable with elements sorted in descending order based on the key selector.
@@ -398,23 +1232,63 @@ class Queryable(Iterable[T]):
             [Person(name=Charlie, age=35), Person(name=Alice, age=30), Person(name=Bob, age=25)]
             ```
         """
-        return Queryable(item for item in sorted(self, key=key_selector, reverse=True))
+        return self.order_by_descending(key_selector)
+
+    def group_by(
+        self,
+        key_selector: KeySelector,
+        element_selector: Optional[KeySelector] = None,
+    ) -> "Queryable[tuple[K, Sequence[Union[T, V]]]]":
+        """Groups the elements of the Queryable by a key.
+
+        Args:
+            key_selector (KeySelector): A function extracting the key of each element, or a
+                field specification, as in `order_by`.
+            element_selector (Optional[KeySelector]): An optional function, or field
+                specification, mapping each element to the value stored in its group.
+
+        Returns:
+            Queryable: A new Queryable of (key, elements) pairs, in the order the keys are first
+                encountered, with the elements of each group in their original order.
+
+        Example:
+            ```python
+            words = Queryable(["apple", "banana", "avocado"])
+            result = words.group_by(lambda word: word[0], len).to_list()
+            print(result)  # Output: [('a', [5, 7]), ('b', [6])]
+            ```
+        """
+
+        def _():
+            key = compile_key(key_selector)
+            element = None if element_selector is None else compile_key(element_selector)
+            yield from Lookup.build(self, key, element).items()
+
+        return Queryable(_Deferred(_))
 
     def group_join(
         self,
         inner: Iterable[U],
-        outer_key_selector: Callable[[T], K],
-        inner_key_selector: Callable[[U], K],
+        outer_key_selector: KeySelector,
+        inner_key_selector: KeySelector,
         result_selector: Callable[[T, Iterable[U]], V],
+        strategy: str = "hash",
+        memory_budget: Optional[int] = None,
     ) -> "Queryable[T]":
         """Performs a group join operation between two sequences.
 
         Args:
             inner (Iterable[U]): The inner sequence to join with the outer sequence.
-            outer_key_selector (Callable[[T], K]): A function to extract the key from elements in the outer sequence.
-            inner_key_selector (Callable[[U], K]): A function to extract the key from elements in the inner sequence.
+            outer_key_selector (KeySelector): A function to extract the key from elements in the
+                outer sequence, or a field specification, as in `order_by`.
+            inner_key_selector (KeySelector): A function to extract the key from elements in the
+                inner sequence, or a field specification, as in `order_by`.
             result_selector (Callable[[T, Iterable[U]], V]): A function to create a result element from an outer element
                                                             and its corresponding inner elements.
+            strategy (str): The join strategy, as in `join`.
+            memory_budget (Optional[int]): The maximum number of inner elements held in memory by
+                the `"hash"` strategy, as in `join`. The `"merge"` strategy does not accept a
+                memory budget.
 
         Returns:
             Queryable: A new Queryable containing the result of the group join operation.
@@ -440,21 +1314,25 @@ class Queryable(Iterable[T]):
                 print(item)
 
             # Output:
-            # (1, [('a',)])
-            # (2, [('b', 'c')])
-            # (3, [('d',)])
+            # (1, [(1, 'a')])
+            # (2, [(2, 'b'), (2, 'c')])
+            # (3, [(3, 'd')])
             # (4, [])
             ```
         """
 
         def _():
-            lookup = {inner_key_selector(item): item for item in inner}
-            for item in self:
-                key = outer_key_selector(item)
-                inner_items = [lookup[key]] if key in lookup else []
-                yield result_selector(item, inner_items)
+            pairs = self._pairs(
+                inner,
+                outer_key_selector,
+                inner_key_selector,
+                strategy,
+                memory_budget,
+            )
+            for item, matches in pairs:
+                yield result_selector(item, matches)
 
-        return Queryable(_())
+        return Queryable(_Deferred(_))
 
     def zip(self, other: Iterable[T]) -> "Queryable[T]":
         """Zips the elements of the current Queryable instance with the elements of
@@ -478,6 +1356,55 @@ class Queryable(Iterable[T]):
         """
         return Queryable(zip(self, other))
 
+    def assume_sorted(
+        self,
+        key: Optional[KeySelector] = None,
+        descending: bool = False,
+    ) -> "Queryable[T]":
+        """Declares that the elements are already sorted by a key, without checking it.
+
+        A subsequent `order_by` by the same key, or a `then_by` chain starting with it, is then
+        skipped, and `union`, `intersect` and `except_for` with another sequence sorted by the
+        same key, which must also be their comparison key, are performed by merging both
+        sequences in a single pass with constant memory, keeping the result sorted.
+
+        Args:
+            key (Optional[KeySelector]): A function or field specification selecting the key
+                the elements are sorted by. Defaults to the elements themselves.
+            descending (bool): Whether the elements are sorted in descending order.
+
+        Returns:
+            Queryable: A new Queryable over the same elements, known to be sorted.
+
+        Example:
+            ```python
+            seen = Queryable(read_ids("seen.log")).assume_sorted()
+            fresh = Queryable(read_ids("today.log")).assume_sorted().except_for(seen)
+            ```
+        """
+        return self._chain("assume_sorted", ((key or _identity, descending),))
+
+    def _merge_key(
+        self,
+        other: Iterable[Any],
+        key: Optional[KeySelector],
+    ) -> Optional[tuple[KeySelector, bool]]:
+        """Returns the key and direction both sequences are sorted by, if the set operators can
+        merge them by comparing that key.
+        """
+        keys = self._sort_keys()
+        if keys is None or len(keys) != 1 or not isinstance(other, Queryable):
+            return None
+
+        if other._sort_keys() != keys or keys[0][0] != (key or _identity):
+            return None
+
+        return keys[0]
+
+    def _sort_keys(self) -> Optional[SortKeys]:
+        """Returns the keys the elements are known to be sorted by."""
+        return sort_keys(self._stages)
+
     def concat(self, other: Iterable[T]) -> "Queryable[T]":
         """Concatenates the elements of the current Queryable with the elements from
         another iterable.
@@ -544,11 +1471,174 @@ class Queryable(Iterable[T]):
 
         return result
 
-    def union(self, other: Iterable[T]) -> "Queryable[T]":
+    def aggregate_many(self, **aggregates: Aggregate) -> dict[str, Any]:
+        """Computes several aggregates of the elements in a single pass.
+
+        Args:
+            **aggregates (Aggregate): The aggregates to compute, by the name of their result.
+                Each one is either the name of a built-in aggregate, namely `"count"`, `"sum"`,
+                `"min"`, `"max"`, `"mean"`, `"variance"`, `"stddev"`, `"first"` or `"last"`, or
+                a `Fold` of a seed and a binary function, optionally followed by a function
+                mapping the final accumulator to the result. A plain tuple of these is accepted
+                as well.
+
+        Returns:
+            dict[str, Any]: The result of each aggregate. Aggregates that are undefined for the
+                number of elements, such as the minimum of no elements, are None, while folds
+                result in their seed.
+
+        Raises:
+            ValueError: If an aggregate is neither a built-in aggregate nor a fold.
+
+        Example:
+            ```python
+            numbers = Queryable([3, 1, 4, 1, 5])
+            result = numbers.aggregate_many(
+                low="min",
+                high="max",
+                product=Fold(1, lambda product, x: product * x),
+            )
+            print(result)  # Output: {'low': 1, 'high': 5, 'product': 60}
+            ```
+        """
+        return aggregate_many(self._execute(), aggregates)
+
+    def stats(self) -> dict[str, Any]:
+        """Computes the summary statistics of the elements in a single pass.
+
+        Returns:
+            dict[str, Any]: The `count`, `sum`, `min`, `max`, `mean`, `variance` and `stddev`
+                of the elements, as computed by `aggregate_many`. The variance and standard
+                deviation are those of a sample.
+
+        Example:
+            ```python
+            numbers = Queryable([2, 4, 4, 4, 5, 5, 7, 9])
+            print(numbers.stats()["mean"])  # Output: 5.0
+            ```
+        """
+        return aggregate_many(self._execute("stats"), {name: name for name in STATS})
+
+    def approx_count_distinct(self, error: float = 0.01) -> int:
+        """Estimates the number of distinct elements with a HyperLogLog sketch.
+
+        Unlike `distinct().count()`, which holds every distinct element in memory, this uses
+        a fixed amount of memory, e.g. 16KB for a 1% error.
+
+        Args:
+            error (float): The relative standard error of the estimate.
+
+        Returns:
+            int: The estimated number of distinct elements.
+
+        Example:
+            ```python
+            numbers = Queryable.range(1_000_000).select(lambda x: x % 250_000)
+            print(numbers.approx_count_distinct())  # Output: about 250000
+            ```
+        """
+        sketch = HyperLogLog.from_error(error)
+        sketch.update(self._execute("approx_count_distinct"))
+        return sketch.estimate()
+
+    def approx_percentile(self, percentile: float, compression: float = 100) -> float:
+        """Estimates a percentile of the elements with a t-digest sketch.
+
+        Args:
+            percentile (float): The percentile, between 0 and 100.
+            compression (float): The accuracy of the sketch, trading memory for precision.
+
+        Returns:
+            float: The estimated value of the percentile.
+
+        Raises:
+            ValueError: If the percentile is out of range or the sequence is empty.
+
+        Example:
+            ```python
+            latencies = Queryable.range(1, 1001)
+            print(latencies.approx_percentile(99))  # Output: about 990
+            ```
+        """
+        (result,) = self.approx_quantiles([percentile / 100], compression)
+        return result
+
+    def approx_quantiles(
+        self,
+        quantiles: Iterable[float],
+        compression: float = 100,
+    ) -> list[float]:
+        """Estimates several quantiles of the elements in a single pass, with a t-digest sketch.
+
+        The sketch holds a bounded number of centroids, rather than every element as a sort
+        would, and its error, measured in ranks, shrinks towards the extreme quantiles.
+
+        Args:
+            quantiles (Iterable[float]): The quantiles, between 0 and 1.
+            compression (float): The accuracy of the sketch, trading memory for precision.
+
+        Returns:
+            list[float]: The estimated value of each quantile.
+
+        Raises:
+            ValueError: If a quantile is out of range or the sequence is empty.
+
+        Example:
+            ```python
+            latencies = Queryable.range(1, 1001)
+            print(latencies.approx_quantiles([0.5, 0.9]))  # Output: about [500, 900]
+            ```
+        """
+        quantiles = list(quantiles)
+        if not all(0 <= q <= 1 for q in quantiles):
+            msg = "The quantiles must be between 0 and 1."
+            raise ValueError(msg)
+
+        digest = TDigest(compression)
+        digest.update(self._execute("approx_quantiles"))
+        return [digest.quantile(q) for q in quantiles]
+
+    def approx_top_frequent(
+        self,
+        count: int,
+        capacity: Optional[int] = None,
+    ) -> list[tuple[T, int]]:
+        """Estimates the most frequent elements with a space-saving sketch.
+
+        Each estimated count is an upper bound of the true count, exceeding it by less than
+        the number of elements divided by `capacity`.
+
+        Args:
+            count (int): The number of elements to return.
+            capacity (Optional[int]): The number of counters of the sketch. Defaults to ten
+                times `count`, and at least 100.
+
+        Returns:
+            list[tuple[T, int]]: The most frequent elements along with their estimated counts,
+                in descending order of count.
+
+        Example:
+            ```python
+            words = Queryable("the cat and the dog and the bird".split())
+            print(words.approx_top_frequent(2))  # Output: [('the', 3), ('and', 2)]
+            ```
+        """
+        sketch = SpaceSaving(capacity or max(10 * count, 100))
+        sketch.update(self._execute("approx_top_frequent"))
+        return sketch.top(count)
+
+    def union(self, other: Iterable[T], key: Optional[KeySelector] = None) -> "Queryable[T]":
         """Returns a new Queryable containing unique elements from both sequences.
 
+        Both sequences are streamed, the elements of this one first, each in its original order,
+        and only the keys seen so far are held in memory. If both sequences are known to be
+        sorted by the key, as by `assume_sorted`, they are merged instead, in constant memory,
+        and the result is sorted.
+
         Args:
             other (Iterable[T]): Another iterable sequence to perform the union with.
+            key (Optional[KeySelector]): A function or field specification selecting the
+                hashable key elements are compared by. Defaults to the elements themselves.
 
         Returns:
             Queryable[T]: A new Queryable containing unique elements from both sequences.
@@ -562,13 +1652,38 @@ class Queryable(Iterable[T]):
             print(result)  # Output: Queryable([1, 2, 3, 4, 5, 6])
             ```
         """
-        return Queryable(set(self).union(other))
+        merge_key = self._merge_key(other, key)
+        if merge_key is not None:
+            selector, descending = merge_key
+            merged = _Deferred(
+                partial(merge_union, self, other, compile_key(selector), descending)
+            )
+            return Queryable(merged).assume_sorted(selector, descending)
+
+        key = _identity if key is None else compile_key(key)
+
+        def _():
+            seen = set()
+            for item in chain(self, other):
+                value = key(item)
+                if value not in seen:
+                    seen.add(value)
+                    yield item
 
-    def intersect(self, other: Iterable[T]) -> "Queryable[T]":
+        return Queryable(_Deferred(_))
+
+    def intersect(self, other: Iterable[T], key: Optional[KeySelector] = None) -> "Queryable[T]":
         """Returns a new Queryable containing common elements between two sequences.
 
+        Only the keys of the other sequence are buffered, once iteration starts. The elements of
+        this sequence are then streamed and produced lazily, in their original order. If both
+        sequences are known to be sorted by the key, as by `assume_sorted`, they are merged
+        instead, in constant memory.
+
         Args:
             other (Iterable[T]): Another iterable sequence to perform the intersection with.
+            key (Optional[KeySelector]): A function or field specification selecting the
+                hashable key elements are compared by. Defaults to the elements themselves.
 
         Returns:
             Queryable[T]: A new Queryable containing common elements between both sequences.
@@ -582,7 +1697,27 @@ class Queryable(Iterable[T]):
             print(result)  # Output: Queryable([3, 4])
             ```
         """
-        return Queryable(set(self).intersection(other))
+        merge_key = self._merge_key(other, key)
+        if merge_key is not None:
+            selector, descending = merge_key
+            merged = _Deferred(
+                partial(merge_intersect, self, other, compile_key(selector), descending)
+            )
+            return Queryable(merged).assume_sorted(selector, descending)
+
+        key = _identity if key is None else compile_key(key)
+
+        def _():
+            remaining = set(map(key, other))
+            for item in self:
+                value = key(item)
+                if value in remaining:
+                    remaining.remove(value)
+                    yield item
+                    if not remaining:
+                        return
+
+        return Queryable(_Deferred(_))
 
     def all(self, predicate: Callable[[T], bool]) -> bool:
         """Determines whether all elements of the sequence satisfy a given predicate.
@@ -602,9 +1737,9 @@ class Queryable(Iterable[T]):
             ```
         """
         if predicate is None:
-            return all(self)
+            return all(self._execute("all"))
 
-        return all(predicate(item) for item in self)
+        return all(predicate(item) for item in self._execute("all"))
 
     def any(self, predicate: Callable[[T], bool] = None) -> bool:
         """Determines whether any elements of the sequence satisfy a given predicate.
@@ -624,9 +1759,9 @@ class Queryable(Iterable[T]):
             ```
         """
         if predicate is None:
-            return any(self)
+            return any(self._execute("any"))
 
-        return any(predicate(item) for item in self)
+        return any(predicate(item) for item in self._execute("any"))
 
     def contains(self, value: T) -> T:
         """Determines whether the sequence contains a specific value.
@@ -645,7 +1780,11 @@ class Queryable(Iterable[T]):
             print(result)  # Output: True
             ```
         """
-        return value in self
+        numbers = self._range("contains")
+        if numbers is not None and type(value) is int:
+            return value in numbers
+
+        return value in self._execute("contains")
 
     def count(self, predicate: Callable[[T], bool] = None) -> int:
         """Counts the number of elements in the sequence or those satisfying a given
@@ -665,7 +1804,14 @@ class Queryable(Iterable[T]):
             print(result)  # Output: 3
             ```
         """
-        return sum(1 for _ in self)
+        if predicate is None:
+            view = self._index_view("count")
+            if view is not None:
+                return len(view)
+
+            return sum(1 for _ in self._execute("count"))
+
+        return sum(1 for item in self._execute("count") if predicate(item))
 
     def sum(self) -> int:
         """Calculates the sum of all elements in the sequence.
@@ -681,7 +1827,11 @@ class Queryable(Iterable[T]):
             print(result)  # Output: 15
             ```
         """
-        return sum(item for item in self)
+        numbers = self._range("sum")
+        if numbers is not None:
+            return len(numbers) * (numbers[0] + numbers[-1]) // 2 if numbers else 0
+
+        return sum(self._execute("sum"))
 
     def min(self) -> int:
         """Finds the minimum value among the elements in the sequence.
@@ -697,6 +1847,10 @@ class Queryable(Iterable[T]):
             print(result)  # Output: 1
             ```
         """
+        numbers = self._range()
+        if numbers:
+            return min(numbers[0], numbers[-1])
+
         return min(self)
 
     def max(self) -> int:
@@ -715,10 +1869,14 @@ class Queryable(Iterable[T]):
         ```
         ```
         """
+        numbers = self._range()
+        if numbers:
+            return max(numbers[0], numbers[-1])
+
         return max(self)
 
     def average(self) -> int:
-        """Calculates the average of all elements in the sequence.
+        """Calculates the average of all elements in the sequence, in a single pass.
 
         Returns:
             int: The average of all elements in the sequence.
@@ -731,14 +1889,34 @@ class Queryable(Iterable[T]):
             print(result)  # Output: 3
             ```
         """
-        return self.sum() / self.count()
+        numbers = self._range("average")
+        if numbers is not None:
+            return self.sum() / len(numbers)
+
+        total, count = 0, 0
+        for count, item in enumerate(self._execute("average"), 1):  # noqa: B007
+            total += item
+
+        return total / count
 
-    def except_for(self, other: Iterable[T]) -> "Queryable[T]":
+    def except_for(
+        self,
+        other: Iterable[T],
+        key: Optional[KeySelector] = None,
+    ) -> "Queryable[T]":
         """Returns a new Queryable containing elements that are not in the specified
         sequence.
 
+        Only the keys of the other sequence are buffered, once iteration starts. The elements of
+        this sequence are then streamed and produced lazily, in their original order, so that a
+        subsequent `take` stops reading this sequence as soon as enough elements are found. If
+        both sequences are known to be sorted by the key, as by `assume_sorted`, they are merged
+        instead, in constant memory.
+
         Args:
             other (Iterable[T]): Another iterable sequence to exclude from the current sequence.
+            key (Optional[KeySelector]): A function or field specification selecting the
+                hashable key elements are compared by. Defaults to the elements themselves.
 
         Returns:
             Queryable[T]: A new Queryable containing elements not present in the specified sequence.
@@ -750,9 +1928,30 @@ class Queryable(Iterable[T]):
             set2 = [3, 4, 5, 6]
             result = set1.except_for(set2)
             print(result)  # Output: Queryable([1, 2])
+
+            # Example: The first new users, without scanning every event
+            new_users = events.except_for(known_users, key="user_id").take(5)
             ```
         """
-        return Queryable(set(self).difference(other))
+        merge_key = self._merge_key(other, key)
+        if merge_key is not None:
+            selector, descending = merge_key
+            merged = _Deferred(
+                partial(merge_except, self, other, compile_key(selector), descending)
+            )
+            return Queryable(merged).assume_sorted(selector, descending)
+
+        key = _identity if key is None else compile_key(key)
+
+        def _():
+            excluded = set(map(key, other))
+            for item in self:
+                value = key(item)
+                if value not in excluded:
+                    excluded.add(value)
+                    yield item
+
+        return Queryable(_Deferred(_))
 
     def first(self, predicate: Optional[Callable[[T], bool]] = None) -> T:
         """Returns the first element of the sequence satisfying the optional predicate.
@@ -776,7 +1975,7 @@ class Queryable(Iterable[T]):
         """
         if predicate is None:
             try:
-                return next(iter(self))
+                return next(self._execute("first"))
             except StopIteration:
                 msg = "Sequence contains no elements."
                 raise ValueError(msg)
@@ -813,7 +2012,7 @@ class Queryable(Iterable[T]):
         """
         if predicate is None:
             try:
-                return next(iter(self))
+                return next(self._execute("first_or_default"))
             except StopIteration:
                 return default
 
@@ -843,25 +2042,16 @@ class Queryable(Iterable[T]):
             print(result)  # Output: 4
             ```
         """
-        if predicate is None:
-            try:
-                result = None
-                for item in self:
-                    result = item
-                return result
-            except StopIteration:
-                msg = "Sequence contains no elements."
-                raise ValueError(msg)
-
-        for item in self:
-            if predicate(item):
-                result = item
+        found, result = self._last(predicate)
+        if found:
+            return result
 
-        if result is None:
-            msg = "Sequence contains no matching element."
+        if predicate is None:
+            msg = "Sequence contains no elements."
             raise ValueError(msg)
 
-        return result
+        msg = "Sequence contains no matching element."
+        raise ValueError(msg)
 
     def last_or_default(
         self,
@@ -886,20 +2076,8 @@ class Queryable(Iterable[T]):
             print(result)  # Output: 0
             ```
         """
-        if predicate is None:
-            try:
-                result = default
-                for item in self:
-                    result = item
-                return result
-            except StopIteration:
-                return default
-
-        for item in self:
-            if predicate(item):
-                return item
-
-        return default
+        found, result = self._last(predicate)
+        return result if found else default
 
     def single(self, predicate: Callable[[T], bool] = None) -> T:
         """Returns the single element of the sequence satisfying the optional predicate.
@@ -1027,12 +2205,13 @@ class Queryable(Iterable[T]):
             print(result)  # Output: 3
             ```
         """
-        try:
-            return next(item for i, item in enumerate(self) if i == index)
-        except StopIteration:
+        found, result = self._element_at(index)
+        if not found:
             msg = "Sequence contains no element at the specified index."
             raise ValueError(msg)
 
+        return result
+
     def element_at_or_default(self, index: int, default: Optional[T] = None) -> T:
         """Returns the element at the specified index in the sequence, or a default
         value if none found.
@@ -1052,10 +2231,8 @@ class Queryable(Iterable[T]):
             print(result)  # Output: -1
             ```
         """
-        try:
-            return next(item for i, item in enumerate(self) if i == index)
-        except StopIteration:
-            return default
+        found, result = self._element_at(index)
+        return result if found else default
 
     def default_if_empty(self, default: T) -> "Queryable[T]":
         """Returns a new Queryable with a default value if the sequence is empty.
@@ -1076,30 +2253,48 @@ class Queryable(Iterable[T]):
         """
 
         def _() -> Iterator[Union[None, T]]:
-            try:
-                next(iter(self))
-            except StopIteration:
-                yield default
+            items = iter(self)
+            for item in items:
+                yield item
+                yield from items
                 return
 
-            yield from self
+            yield default
 
-        return Queryable(_())
+        return Queryable(_Deferred(_))
 
     def join(
         self,
         inner: Iterable[U],
-        outer_key_selector: Callable[[T], K],
-        inner_key_selector: Callable[[U], K],
+        outer_key_selector: KeySelector,
+        inner_key_selector: KeySelector,
         result_selector: Callable[[T, U], V],
+        strategy: str = "hash",
+        memory_budget: Optional[int] = None,
     ) -> "Queryable[V]":
         """Joins two iterables based on key selectors and applies a result selector.
 
+        The following strategies are available:
+
+        - `"hash"` builds a hash lookup over the inner iterable and streams the current
+          Queryable. If `memory_budget` is specified and the inner iterable holds more
+          elements, both inputs are partitioned into temporary files and joined one partition
+          at a time, in which case the results are grouped by partition rather than ordered
+          like the current Queryable.
+        - `"merge"` assumes both inputs are sorted in ascending order of their keys and joins
+          them in a single streaming pass, only buffering runs of inner elements sharing a key.
+
         Args:
             inner (Iterable[U]): The inner iterable to join with.
-            outer_key_selector (Callable[[T], K]): The key selector for the outer sequence.
-            inner_key_selector (Callable[[U], K]): The key selector for the inner sequence.
+            outer_key_selector (KeySelector): The key selector for the outer sequence, or a
+                field specification, as in `order_by`.
+            inner_key_selector (KeySelector): The key selector for the inner sequence, or a
+                field specification, as in `order_by`.
             result_selector (Callable[[T, U], V]): The result selector function to apply.
+            strategy (str): The join strategy, either `"hash"` or `"merge"`.
+            memory_budget (Optional[int]): The maximum number of inner elements held in memory by
+                the `"hash"` strategy before spilling to disk. The `"merge"` strategy does not
+                accept a memory budget, as it only buffers runs of equal keys.
 
         Returns:
             Queryable: A new Queryable containing the joined elements based on the specified conditions.
@@ -1111,18 +2306,23 @@ class Queryable(Iterable[T]):
             set2 = [3, 4, 5, 6]
             result = set1.join(set2, outer_key_selector=lambda x: x, inner_key_selector=lambda x: x % 3,
                                result_selector=lambda x, y: (x, y))
-            print(result.to_list())  # Output: [(1, 4), (2, 5), (3, 6)]
+            print(result.to_list())  # Output: [(1, 4), (2, 5)]
             ```
         """
 
         def _() -> "Iterator[V]":
-            lookup = {inner_key_selector(item): item for item in inner}
-            for item in self:
-                key = outer_key_selector(item)
-                if key in lookup:
-                    yield result_selector(item, lookup[key])
+            pairs = self._pairs(
+                inner,
+                outer_key_selector,
+                inner_key_selector,
+                strategy,
+                memory_budget,
+            )
+            for item, matches in pairs:
+                for match in matches:
+                    yield result_selector(item, match)
 
-        return Queryable(_())
+        return Queryable(_Deferred(_))
 
     def to_list(self) -> list[T]:
         """Converts the Queryable to a list.
@@ -1140,17 +2340,190 @@ class Queryable(Iterable[T]):
         """
         return list(self)
 
+    def to_lookup(
+        self,
+        key_selector: KeySelector,
+        element_selector: Optional[KeySelector] = None,
+    ) -> Lookup[K, Union[V, T]]:
+        """Groups the elements of the Queryable into a one-to-many Lookup.
+
+        Args:
+            key_selector (KeySelector): The key selector function, or a field specification, as
+                in `order_by`.
+            element_selector (Optional[KeySelector]): The optional element selector function, or
+                a field specification.
+
+        Returns:
+            Lookup[K, V]: A Lookup mapping each key to the elements sharing it, in their
+                original order.
+
+        Example:
+            ```python
+            words = Queryable(["apple", "avocado", "banana"])
+            lookup = words.to_lookup(lambda word: word[0], lambda word: len(word))
+            print(lookup["a"])  # Output: [5, 7]
+            print(lookup["c"])  # Output: []
+            ```
+        """
+        element = None if element_selector is None else compile_key(element_selector)
+        return Lookup.build(self, compile_key(key_selector), element)
+
+    def write_to(
+        self,
+        file: IO[str],
+        format: str = "lines",  # noqa: A002
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = WRITE_BATCH_SIZE,
+    ) -> int:
+        """Writes the elements to an open text file, in a streaming fashion.
+
+        The elements are serialised in batches, each written with a single call, so that only
+        a single batch is held in memory.
+
+        Args:
+            file (IO[str]): The file to write to, opened in text mode.
+            format (str): The output format: `"lines"` writes each element converted by `str`
+                on its own line, `"jsonl"` writes each element as JSON on its own line, and
+                `"csv"` writes each element as a row, as in `to_csv`.
+            columns (Optional[Sequence[str]]): The columns of the `"csv"` format.
+            batch_size (int): The number of elements serialised together.
+
+        Returns:
+            int: The number of elements written.
+
+        Raises:
+            ValueError: If the format is unknown, columns are given for a format other than
+                `"csv"`, or the batch size is not positive.
+
+        Example:
+            ```python
+            import sys
+
+            Queryable([{"id": 1}, {"id": 2}]).write_to(sys.stdout, "jsonl")
+            ```
+        """
+        if format not in FORMATS:
+            msg = f"Unknown format '{format}'."
+            raise ValueError(msg)
+
+        if format == "csv":
+            return write_csv(file, self, batch_size, columns)
+
+        if columns is not None:
+            msg = "Columns can only be given for the csv format."
+            raise ValueError(msg)
+
+        return FORMATS[format](file, self, batch_size)
+
+    def to_lines(
+        self,
+        path: Path,
+        encoding: str = "utf-8",
+        buffer_size: int = BUFFER_SIZE,
+        compress: Optional[bool] = None,
+    ) -> int:
+        """Writes each element, converted by `str`, on its own line of a text file.
+
+        The elements are streamed to the file in batched writes, without holding the result in
+        memory.
+
+        Args:
+            path (Path): The path of the file, which is overwritten.
+            encoding (str): The encoding of the file.
+            buffer_size (int): The size of the write buffer, in bytes.
+            compress (Optional[bool]): Whether to compress the file with gzip. Defaults to
+                whether the path ends with `.gz`.
+
+        Returns:
+            int: The number of lines written.
+
+        Example:
+            ```python
+            errors = Queryable.from_lines("app.log").where(lambda line: "ERROR" in line)
+            print(errors.to_lines("errors.log.gz"))  # Output: the number of errors
+            ```
+        """
+        with open_sink(path, encoding, buffer_size, compress) as file:
+            return self.write_to(file, "lines")
+
+    def to_jsonl(
+        self,
+        path: Path,
+        encoding: str = "utf-8",
+        buffer_size: int = BUFFER_SIZE,
+        compress: Optional[bool] = None,
+    ) -> int:
+        """Writes each element as JSON on its own line of a JSON Lines file.
+
+        The elements are streamed to the file in batched writes, as in `to_lines`.
+
+        Args:
+            path (Path): The path of the file, which is overwritten.
+            encoding (str): The encoding of the file.
+            buffer_size (int): The size of the write buffer, in bytes.
+            compress (Optional[bool]): Whether to compress the file with gzip. Defaults to
+                whether the path ends with `.gz`.
+
+        Returns:
+            int: The number of elements written.
+
+        Example:
+            ```python
+            clicks = Queryable.from_jsonl("clicks.jsonl").distinct("['user']")
+            print(clicks.to_jsonl("first_clicks.jsonl"))
+            ```
+        """
+        with open_sink(path, encoding, buffer_size, compress) as file:
+            return self.write_to(file, "jsonl")
+
+    def to_csv(
+        self,
+        path: Path,
+        columns: Optional[Sequence[str]] = None,
+        encoding: str = "utf-8",
+        buffer_size: int = BUFFER_SIZE,
+        compress: Optional[bool] = None,
+    ) -> int:
+        """Writes each element as a row of a CSV file.
+
+        Mappings are written as the values of the columns, which default to the keys of the
+        first element, preceded by a header row, with missing values left empty. Other elements
+        are sequences of values, preceded by a header row only if columns are given. The rows
+        are streamed to the file in batched writes, as in `to_lines`.
+
+        Args:
+            path (Path): The path of the file, which is overwritten.
+            columns (Optional[Sequence[str]]): The names of the columns.
+            encoding (str): The encoding of the file.
+            buffer_size (int): The size of the write buffer, in bytes.
+            compress (Optional[bool]): Whether to compress the file with gzip. Defaults to
+                whether the path ends with `.gz`.
+
+        Returns:
+            int: The number of rows written, excluding the header row.
+
+        Example:
+            ```python
+            sales = Queryable([{"region": "eu", "amount": 10}, {"region": "us", "amount": 20}])
+            print(sales.to_csv("sales.csv", columns=["region", "amount"]))  # Output: 2
+            ```
+        """
+        with open_sink(path, encoding, buffer_size, compress) as file:
+            return self.write_to(file, "csv", columns)
+
     def to_dictionary(
         self,
-        key_selector: Callable[[T], K],
-        value_selector: Optional[Callable[[T], V]] = None,
+        key_selector: KeySelector,
+        value_selector: Optional[KeySelector] = None,
     ) -> dict[K, Union[V, T]]:
         """Converts the Queryable to a dictionary using key and optional value
         selectors.
 
         Args:
-            key_selector (Callable[[T], K]): The key selector function.
-            value_selector (Optional[Callable[[T], V]]): The optional value selector function.
+            key_selector (KeySelector): The key selector function, or a field specification, as
+                in `order_by`.
+            value_selector (Optional[KeySelector]): The optional value selector function, or a
+                field specification.
 
         Returns:
             dict[K, V]: A dictionary containing elements of the Queryable.
@@ -1161,9 +2534,434 @@ class Queryable(Iterable[T]):
             pairs = Queryable([(1, 'one'), (2, 'two'), (3, 'three')])
             result = pairs.to_dictionary(key_selector=lambda x: x[0], value_selector=lambda x: x[1])
             print(result)  # Output: {1: 'one', 2: 'two', 3: 'three'}
+
+            # The same dictionary, built without calling back into Python for each pair
+            result = pairs.to_dictionary("[0]", "[1]")
             ```
         """
+        key = compile_key(key_selector)
         if value_selector is None:
-            return {key_selector(item): item for item in self}
+            return {key(item): item for item in self}
+
+        if isinstance(key_selector, str) and isinstance(value_selector, str):
+            return dict(map(compile_key((key_selector, value_selector)), self))
+
+        value = compile_key(value_selector)
+        return {key(item): value(item) for item in self}
+
+
+def _size(items: Iterable[Any]) -> Optional[int]:
+    """Returns the number of elements of an iterable, if it is known without iterating."""
+    if isinstance(items, Queryable):
+        return items._size()
+
+    return len(items) if isinstance(items, Sized) else None
+
+
+def _batches(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Splits the elements into consecutive lists of at most `size` elements."""
+    iterator = iter(items)
+    return iter(lambda: list(islice(iterator, size)), [])
+
+
+def _results(batch: list[Any], results: Sequence[U]) -> Sequence[U]:
+    """Checks that a batched callable returned a result per element of the batch."""
+    if len(results) != len(batch):
+        msg = f"Expected {len(batch)} results for the batch, got {len(results)}."
+        raise ValueError(msg)
+
+    return results
+
+
+def _identity(item: T) -> T:
+    """Returns the element itself, as the default key of the set operators."""
+    return item
+
+
+class OrderedQueryable(Queryable[T]):
+    """A Queryable whose elements are sorted by one or more keys.
+
+    The key selectors and directions added by `then_by` and `then_by_descending` are accumulated
+    and the elements are sorted exactly once, when the OrderedQueryable is iterated, within the
+    memory budget given to `order_by`, if any.
+    """
+
+    def then_by(self, key_selector: KeySelector) -> "OrderedQueryable[T]":
+        """Performs a subsequent ordering of the elements in ascending order.
+
+        Args:
+            key_selector (KeySelector): A function that extracts a key from each element, or a
+                field specification, as in `order_by`.
+
+        Returns:
+            OrderedQueryable: A new OrderedQueryable whose elements are sorted by the existing
+                keys, with ties broken by the specified key.
 
-        return {key_selector(item): value_selector(item) for item in self}
+        Example:
+            ```python
+            people = Queryable([("Bob", 30), ("Alice", 30), ("Charlie", 25)])
+            result = people.order_by(lambda p: p[1]).then_by(lambda p: p[0]).to_list()
+            print(result)  # Output: [('Charlie', 25), ('Alice', 30), ('Bob', 30)]
+            ```
+        """
+        return self._then(key_selector, descending=False)
+
+    def then_by_descending(self, key_selector: KeySelector) -> "OrderedQueryable[T]":
+        """Performs a subsequent ordering of the elements in descending order.
+
+        Args:
+            key_selector (KeySelector): A function that extracts a key from each element, or a
+                field specification, as in `order_by`.
+
+        Returns:
+            OrderedQueryable: A new OrderedQueryable whose elements are sorted by the existing
+                keys, with ties broken by the specified key in descending order.
+
+        Example:
+            ```python
+            people = Queryable([("Alice", 30), ("Bob", 30), ("Charlie", 25)])
+            result = people.order_by(lambda p: p[1]).then_by_descending(lambda p: p[0]).to_list()
+            print(result)  # Output: [('Charlie', 25), ('Bob', 30), ('Alice', 30)]
+            ```
+        """
+        return self._then(key_selector, descending=True)
+
+    def _then(self, key_selector: KeySelector, *, descending: bool) -> "OrderedQueryable[T]":
+        """Returns a new OrderedQueryable with an additional key appended to the ordering."""
+        if not self._stages or self._stages[-1].op != "order_by":
+            return self._order(((key_selector, descending),))
+
+        *stages, last = self._stages
+        keys, *options = last.args
+        ordering = Stage("order_by", ((*keys, (key_selector, descending)), *options))
+        return self._derive((*stages, ordering), OrderedQueryable)
+
+
+class ColumnarQueryable(Queryable[T]):
+    """A Queryable over records stored one column per field.
+
+    `where` and `select` can be evaluated against named columns, and `order_by`, `then_by` and
+    `group_by` accept column names in place of key selectors, in which case no record is built.
+    These operators work on the indices of the selected records, and records are only built
+    when the ColumnarQueryable is iterated. Any other operator falls back to the element-wise
+    execution of `Queryable` over the built records.
+    """
+
+    def __init__(self, table: Table, indices: Optional[Sequence[int]] = None) -> None:
+        """Initializes a ColumnarQueryable object.
+
+        Args:
+            table (Table): The columns of the records.
+            indices (Optional[Sequence[int]]): The indices of the records to query. Defaults to
+                every record of the table.
+        """
+        super().__init__(_Records(self))
+        self.table = table
+        self.indices = range(len(table)) if indices is None else indices
+        self._plan: tuple[Stage, ...] = ()
+
+    def _extend(self, op: str, *args: Any) -> "ColumnarQueryable[T]":
+        """Returns a new ColumnarQueryable over the same records with an additional stage."""
+        queryable: ColumnarQueryable[T] = ColumnarQueryable(self.table, self.indices)
+        queryable._plan = (*self._plan, Stage(op, args))
+        return queryable
+
+    def _evaluate(self) -> Sequence[int]:
+        """Executes the plan, returning the indices of the resulting records in order."""
+        indices = self.indices
+        for op, args in self._plan:
+            if op == "where":
+                indices = list(compress(indices, self._map(*args, indices)))
+            elif op == "order_by":
+                keys, memory_budget = args
+                key, reverse = composite_key(tuple((self._key(k), d) for k, d in keys))
+                if memory_budget is None:
+                    indices = sorted(indices, key=key, reverse=reverse)
+                else:
+                    indices = list(external_sort(indices, key, reverse, memory_budget))
+            elif op == "skip":
+                indices = indices[max(args[0], 0) :]
+            elif op == "take":
+                indices = indices[: max(args[0], 0)]
+            elif op == "reverse":
+                indices = indices[::-1]
+
+        return indices
+
+    def _column(self, name: str) -> Sequence[Any]:
+        """Returns the column of the given name."""
+        try:
+            return self.table.columns[name]
+        except KeyError:
+            msg = f"Unknown column '{name}'."
+            raise ValueError(msg) from None
+
+    def _key(self, key: Union[Field, Callable[[T], Any]]) -> Callable[[int], Any]:
+        """Returns a function mapping the index of a record to the given key."""
+        if isinstance(key, str):
+            return self._column(key).__getitem__
+
+        if isinstance(key, tuple):
+            columns = [self._column(name) for name in key]
+            return lambda index: tuple(column[index] for column in columns)
+
+        return lambda index: key(self.table.row(index))
+
+    def _map(
+        self,
+        function: Callable[..., Any],
+        on: Optional[Field],
+        indices: Sequence[int],
+    ) -> Iterator[Any]:
+        """Applies a function to the given columns, or to the records if none is specified."""
+        if on is None:
+            return map(function, self.table.rows(indices))
+
+        names = (on,) if isinstance(on, str) else on
+        columns = [map(self._column(name).__getitem__, indices) for name in names]
+        return map(function, *columns)
+
+    def where(
+        self,
+        predicate: Callable[..., bool],
+        on: Optional[Field] = None,
+    ) -> "ColumnarQueryable[T]":
+        """Filters the records based on a given predicate.
+
+        Args:
+            predicate (Callable[..., bool]): A function receiving the values of the columns
+                specified by `on`, or the record itself, and indicating whether the record
+                should be included in the result.
+            on (Optional[Union[str, tuple[str, ...]]]): The column, or columns, passed to the
+                predicate as positional arguments.
+
+        Returns:
+            ColumnarQueryable: A new ColumnarQueryable containing the records satisfying the
+                predicate.
+
+        Example:
+            ```python
+            points = Queryable.from_columns({"x": [1, 2, 3], "y": [3, 2, 1]})
+            result = points.where(lambda x, y: x < y, on=("x", "y")).to_list()
+            print(result)  # Output: [{'x': 1, 'y': 3}]
+            ```
+        """
+        return self._extend("where", predicate, on)
+
+    def select(
+        self,
+        selector: Union[Field, Callable[..., U]],
+        on: Optional[Field] = None,
+    ) -> "Queryable[U]":
+        """Projects each record to a new value.
+
+        Args:
+            selector (Union[str, tuple[str, ...], Callable[..., U]]): The column whose values
+                are selected, a tuple of columns whose values are selected as tuples, or a
+                function receiving the values of the columns specified by `on`, or the record
+                itself.
+            on (Optional[Union[str, tuple[str, ...]]]): The column, or columns, passed to the
+                selector as positional arguments.
+
+        Returns:
+            Queryable: A new Queryable containing the projected values.
+
+        Example:
+            ```python
+            people = Queryable.from_columns({"name": ["Alice", "Bob"], "age": [30, 25]})
+            print(people.select("name").to_list())  # Output: ['Alice', 'Bob']
+            print(people.select(lambda age: age + 1, on="age").to_list())  # Output: [31, 26]
+            ```
+        """
+
+        def _():
+            indices = self._evaluate()
+            if isinstance(selector, (str, tuple)):
+                yield from map(self._key(selector), indices)
+            else:
+                yield from self._map(selector, on, indices)
+
+        return Queryable(_Deferred(_))
+
+    def skip(self, count: int) -> "ColumnarQueryable[T]":
+        """Skips the specified number of records.
+
+        Args:
+            count (int): The number of records to skip.
+
+        Returns:
+            ColumnarQueryable: A new ColumnarQueryable containing the remaining records.
+        """
+        return self._extend("skip", count)
+
+    def take(self, count: int) -> "ColumnarQueryable[T]":
+        """Takes the specified number of records.
+
+        Args:
+            count (int): The number of records to take.
+
+        Returns:
+            ColumnarQueryable: A new ColumnarQueryable containing the first `count` records.
+        """
+        return self._extend("take", count)
+
+    def reverse(self) -> "ColumnarQueryable[T]":
+        """Inverts the order of the records.
+
+        Returns:
+            ColumnarQueryable: A new ColumnarQueryable containing the records in reverse order.
+        """
+        return self._extend("reverse")
+
+    def order_by(
+        self,
+        key_selector: Union[Field, Callable[[T], U]],
+        memory_budget: Optional[int] = None,
+    ) -> "ColumnarQueryable[T]":
+        """Orders the records in ascending order of a key.
+
+        Args:
+            key_selector (Union[str, tuple[str, ...], Callable[[T], U]]): The column, or
+                columns, to sort by, or a function extracting a key from each record.
+            memory_budget (Optional[int]): The maximum number of records sorted in memory at
+                once. Larger inputs are sorted externally as in `Queryable.order_by`, spilling
+                the indices of the records along with their keys, which must be picklable.
+
+        Returns:
+            ColumnarQueryable: A new ColumnarQueryable containing the sorted records, which can
+                be further ordered using `then_by`.
+        """
+        return self._extend("order_by", ((key_selector, False),), memory_budget)
+
+    def order_by_descending(
+        self,
+        key_selector: Union[Field, Callable[[T], U]],
+        memory_budget: Optional[int] = None,
+    ) -> "ColumnarQueryable[T]":
+        """Orders the records in descending order of a key.
+
+        Args:
+            key_selector (Union[str, tuple[str, ...], Callable[[T], U]]): The column, or
+                columns, to sort by, or a function extracting a key from each record.
+            memory_budget (Optional[int]): The maximum number of records sorted in memory at
+                once, spilling sorted runs to disk as in `order_by`.
+
+        Returns:
+            ColumnarQueryable: A new ColumnarQueryable containing the sorted records, which can
+                be further ordered using `then_by`.
+        """
+        return self._extend("order_by", ((key_selector, True),), memory_budget)
+
+    def then_by(self, key_selector: Union[Field, Callable[[T], U]]) -> "ColumnarQueryable[T]":
+        """Performs a subsequent ordering of the records in ascending order of a key.
+
+        Args:
+            key_selector (Union[str, tuple[str, ...], Callable[[T], U]]): The column, or
+                columns, breaking ties of the existing ordering.
+
+        Returns:
+            ColumnarQueryable: A new ColumnarQueryable containing the sorted records.
+        """
+        return self._then(key_selector, descending=False)
+
+    def then_by_descending(
+        self,
+        key_selector: Union[Field, Callable[[T], U]],
+    ) -> "ColumnarQueryable[T]":
+        """Performs a subsequent ordering of the records in descending order of a key.
+
+        Args:
+            key_selector (Union[str, tuple[str, ...], Callable[[T], U]]): The column, or
+                columns, breaking ties of the existing ordering.
+
+        Returns:
+            ColumnarQueryable: A new ColumnarQueryable containing the sorted records.
+        """
+        return self._then(key_selector, descending=True)
+
+    def _then(
+        self,
+        key_selector: Union[Field, Callable[[T], U]],
+        *,
+        descending: bool,
+    ) -> "ColumnarQueryable[T]":
+        """Returns a new ColumnarQueryable with an additional key appended to the ordering."""
+        if not self._plan or self._plan[-1].op != "order_by":
+            return self._extend("order_by", ((key_selector, descending),), None)
+
+        keys, memory_budget = self._plan[-1].args
+        queryable = self._extend("order_by", (*keys, (key_selector, descending)), memory_budget)
+        queryable._plan = (*self._plan[:-1], queryable._plan[-1])
+        return queryable
+
+    def group_by(
+        self,
+        key_selector: Union[Field, Callable[[T], K]],
+        element_selector: Optional[Union[Field, Callable[[T], V]]] = None,
+    ) -> "Queryable[tuple[K, Any]]":
+        """Groups the records by a key.
+
+        Args:
+            key_selector (Union[str, tuple[str, ...], Callable[[T], K]]): The column, or
+                columns, to group by, or a function extracting a key from each record.
+            element_selector (Optional[Union[str, tuple[str, ...], Callable[[T], V]]]): An
+                optional column, tuple of columns, or function, as in `select`, selecting the
+                values stored in each group.
+
+        Returns:
+            Queryable: A new Queryable of (key, group) pairs, in the order the keys are first
+                encountered. Each group is a ColumnarQueryable over the records sharing the
+                key, or the list of their selected values if an element selector is specified.
+
+        Example:
+            ```python
+            sales = Queryable.from_columns({"region": ["eu", "us", "eu"], "amount": [1, 2, 3]})
+            result = sales.group_by("region", "amount").to_list()
+            print(result)  # Output: [('eu', [1, 3]), ('us', [2])]
+            ```
+        """
+
+        def _():
+            lookup = Lookup.build(self._evaluate(), self._key(key_selector))
+            for key, indices in lookup.items():
+                group = ColumnarQueryable(self.table, indices)
+                if element_selector is None:
+                    yield key, group
+                else:
+                    yield key, group.select(element_selector).to_list()
+
+        return Queryable(_Deferred(_))
+
+    def count(self, predicate: Optional[Callable[[T], bool]] = None) -> int:
+        """Counts the records, or those satisfying a given predicate.
+
+        Args:
+            predicate (Optional[Callable[[T], bool]]): The optional predicate.
+
+        Returns:
+            int: The number of records satisfying the predicate.
+        """
+        if predicate is None:
+            return len(self._evaluate())
+
+        return super().count(predicate)
+
+
+class _Records(Iterable[Any]):
+    """The records of a ColumnarQueryable, built when iterated."""
+
+    def __init__(self, queryable: ColumnarQueryable[Any]) -> None:
+        self.queryable = queryable
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.queryable.table.rows(self.queryable._evaluate())
+
+
+class _Deferred(Iterable[T]):
+    """An iterable creating a new iterator from a factory each time it is iterated."""
+
+    def __init__(self, factory: Callable[[], Iterator[T]]) -> None:
+        self.factory = factory
+
+    def __iter__(self) -> Iterator[T]:
+        return self.factory()
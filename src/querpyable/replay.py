@@ -0,0 +1,102 @@
+"""A buffer sharing the elements of a single pass over an iterable between many iterators."""
+
+from collections.abc import Iterable, Iterator
+from threading import Lock
+from typing import Any, Optional
+
+
+class ReplayBuffer(Iterable[Any]):
+    """A re-iterable view of an iterable that is only iterated once.
+
+    The elements are read from the iterable lazily, as far as the furthest iterator has
+    advanced, and recorded in a single buffer shared by every iterator, so that iterating the
+    ReplayBuffer again replays them rather than recomputing them. Iterators can be interleaved,
+    even across threads. If the iterable raises an exception, it is recorded too, and raised
+    again by every iterator reaching the end of the recorded elements, rather than letting them
+    replay a truncated sequence.
+
+    Example:
+        ```python
+        squares = ReplayBuffer(x * x for x in range(4))
+
+        print(list(squares))  # Output: [0, 1, 4, 9]
+        print(list(squares))  # Output: [0, 1, 4, 9]
+        ```
+    """
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        """Initializes a ReplayBuffer.
+
+        Args:
+            items (Iterable[Any]): The iterable whose elements are recorded.
+        """
+        self.items = items
+        self._state = _State()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Replays the recorded elements, reading further elements from the iterable as needed."""
+        state = self._state
+        index = 0
+        while True:
+            if index < len(state.buffer):
+                yield state.buffer[index]
+                index += 1
+                continue
+
+            with state.lock:
+                if index < len(state.buffer) or state.fill(self.items):
+                    continue
+
+            return
+
+    def release(self) -> None:
+        """Discards the recorded elements.
+
+        Iterators that are already running keep replaying the elements they started with. Any
+        new iterator iterates the underlying iterable again, which must therefore be re-iterable
+        for the elements to be produced again.
+        """
+        self._state = _State()
+
+
+class _State:
+    """The elements recorded by a ReplayBuffer, along with the iterator producing them."""
+
+    def __init__(self) -> None:
+        self.buffer: list[Any] = []
+        self.iterator: Optional[Iterator[Any]] = None
+        self.exhausted = False
+        self.error: Optional[Exception] = None
+        self.lock = Lock()
+
+    def fill(self, items: Iterable[Any]) -> bool:
+        """Records the next element, returning whether there was one.
+
+        Raises:
+            Exception: The exception raised by the iterable, if any, on this and every later
+                call.
+        """
+        if self.error is not None:
+            raise self.error
+
+        if self.exhausted:
+            return False
+
+        if self.iterator is None:
+            self.iterator = iter(items)
+
+        try:
+            item = next(self.iterator)
+        except StopIteration:
+            pass
+        except Exception as error:
+            self.error = error
+            self.iterator = None
+            raise
+        else:
+            self.buffer.append(item)
+            return True
+
+        self.exhausted = True
+        self.iterator = None
+        return False
@@ -0,0 +1,159 @@
+"""Streaming serialisation of elements to files."""
+
+import csv
+import gzip
+import io
+import json
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import partial
+from itertools import islice
+from typing import IO, Any, Optional
+
+from querpyable.sources import BUFFER_SIZE, Path
+
+WRITE_BATCH_SIZE = 1024
+"""The default number of elements serialised together in a single write."""
+
+
+def open_sink(
+    path: Path,
+    encoding: str = "utf-8",
+    buffer_size: int = BUFFER_SIZE,
+    compress: Optional[bool] = None,  # noqa: FBT001
+) -> IO[str]:
+    """Opens a text file for writing, compressing it with gzip if requested.
+
+    Args:
+        path (Path): The path of the file, which is overwritten.
+        encoding (str): The encoding of the file.
+        buffer_size (int): The size of the write buffer, in bytes.
+        compress (Optional[bool]): Whether to compress the file with gzip. Defaults to whether
+            the path ends with `.gz`.
+
+    Returns:
+        IO[str]: The file, writing line endings untranslated.
+    """
+    if compress is None:
+        compress = str(path).endswith(".gz")
+
+    if compress:
+        buffered = io.BufferedWriter(gzip.GzipFile(path, "wb"), buffer_size)
+        return io.TextIOWrapper(buffered, encoding=encoding, newline="")
+
+    return open(path, "w", encoding=encoding, newline="", buffering=buffer_size)
+
+
+def write_lines(
+    file: IO[str],
+    items: Iterable[Any],
+    batch_size: int = WRITE_BATCH_SIZE,
+) -> int:
+    """Writes each element, converted by `str`, on its own line.
+
+    Returns:
+        int: The number of elements written.
+
+    Raises:
+        ValueError: If the batch size is not positive.
+    """
+    return _write(file, items, batch_size, str)
+
+
+def write_jsonl(
+    file: IO[str],
+    items: Iterable[Any],
+    batch_size: int = WRITE_BATCH_SIZE,
+) -> int:
+    """Writes each element as JSON on its own line.
+
+    Returns:
+        int: The number of elements written.
+
+    Raises:
+        ValueError: If the batch size is not positive.
+    """
+    return _write(file, items, batch_size, json.JSONEncoder(ensure_ascii=False).encode)
+
+
+def write_csv(
+    file: IO[str],
+    items: Iterable[Any],
+    batch_size: int = WRITE_BATCH_SIZE,
+    columns: Optional[Sequence[str]] = None,
+) -> int:
+    """Writes each element as a CSV row.
+
+    Mappings are written as the values of the columns, defaulting to the keys of the first
+    element, preceded by a header row, with missing values left empty. Other elements are
+    sequences of values, written as is, preceded by a header row if columns are given.
+
+    Returns:
+        int: The number of elements written, excluding the header row.
+
+    Raises:
+        ValueError: If the batch size is not positive.
+    """
+    _check(batch_size)
+    iterator = iter(items)
+    batch = list(islice(iterator, batch_size))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    row: Callable[[Any], Sequence[Any]] = list
+    if batch and isinstance(batch[0], Mapping):
+        names = list(batch[0]) if columns is None else list(columns)
+        writer.writerow(names)
+        row = partial(_values, names)
+    elif columns is not None:
+        writer.writerow(columns)
+
+    count = 0
+    while batch:
+        writer.writerows(map(row, batch))
+        count += len(batch)
+        file.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+        batch = list(islice(iterator, batch_size))
+
+    file.write(buffer.getvalue())
+    return count
+
+
+FORMATS: dict[str, Callable[..., int]] = {
+    "csv": write_csv,
+    "jsonl": write_jsonl,
+    "lines": write_lines,
+}
+"""The writers of the supported output formats, by name."""
+
+
+def _write(
+    file: IO[str],
+    items: Iterable[Any],
+    batch_size: int,
+    serialize: Callable[[Any], str],
+) -> int:
+    """Writes the serialised elements one per line, joining each batch into a single write."""
+    _check(batch_size)
+    iterator = map(serialize, items)
+    count = 0
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return count
+
+        batch.append("")
+        file.write("\n".join(batch))
+        count += len(batch) - 1
+
+
+def _values(names: list[str], item: Mapping[str, Any]) -> list[Any]:
+    """Returns the values of the given keys of a mapping, missing values being empty."""
+    return [item.get(name, "") for name in names]
+
+
+def _check(batch_size: int) -> None:
+    """Checks that a batch size is positive."""
+    if batch_size <= 0:
+        msg = "The batch size must be positive."
+        raise ValueError(msg)
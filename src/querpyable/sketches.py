@@ -0,0 +1,564 @@
+"""Mergeable sketches summarising streams in bounded memory."""
+
+import math
+import struct
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from hashlib import blake2b
+from itertools import chain
+
+
+def hash64(item: Hashable) -> int:
+    """Hashes an element to 64 well-mixed bits.
+
+    Strings, bytes and numbers are hashed by BLAKE2b over a stable byte encoding, in which
+    integral floats and booleans are encoded as the equal integers, so that their hashes do
+    not depend on the interpreter's hash seed and, unlike the built-in hash, -1 and -2 do not
+    collide. Any other element is hashed through the bytes of its built-in hash, so sketches
+    of such elements can only be merged across processes sharing the hash seed, such as forked
+    workers.
+
+    Args:
+        item (Hashable): The element to hash.
+
+    Returns:
+        int: A 64-bit hash of the element.
+    """
+    return int.from_bytes(blake2b(_encode(item), digest_size=8).digest(), "little")
+
+
+def _encode(item: Hashable) -> bytes:
+    """Encodes an element into bytes, tagged with its kind so that distinct kinds differ."""
+    if isinstance(item, str):
+        return b"s" + item.encode("utf-8", "surrogatepass")
+
+    if isinstance(item, bytes):
+        return b"b" + item
+
+    if isinstance(item, float) and item.is_integer():
+        item = int(item)
+
+    if isinstance(item, int):
+        return b"i" + item.to_bytes(item.bit_length() // 8 + 1, "little", signed=True)
+
+    if isinstance(item, float):
+        return b"f" + struct.pack("<d", item)
+
+    return b"h" + hash(item).to_bytes(8, "little", signed=True)
+
+
+class HyperLogLog:
+    """An estimator of the number of distinct elements of a stream.
+
+    The memory used is `2 ** precision` bytes, whatever the number of elements, and the
+    relative standard error of the estimate is about `1.04 / sqrt(2 ** precision)`.
+
+    Example:
+        ```python
+        sketch = HyperLogLog.from_error(0.01)
+        sketch.update(range(100_000))
+        print(sketch.estimate())  # Output: about 100000
+        ```
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        """Initializes an empty HyperLogLog.
+
+        Args:
+            precision (int): The number of bits of the hash selecting a register, between 4
+                and 18.
+
+        Raises:
+            ValueError: If the precision is out of range.
+        """
+        if not 4 <= precision <= 18:  # noqa: PLR2004
+            msg = "The precision must be between 4 and 18."
+            raise ValueError(msg)
+
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    @classmethod
+    def from_error(cls, error: float) -> "HyperLogLog":
+        """Creates an empty HyperLogLog with the given relative standard error.
+
+        Args:
+            error (float): The relative standard error of the estimate, e.g. 0.01 for 1%.
+
+        Returns:
+            HyperLogLog: A HyperLogLog with the smallest precision achieving the error.
+        """
+        precision = math.ceil(math.log2((1.04 / error) ** 2))
+        return cls(min(max(precision, 4), 18))
+
+    def add(self, item: Hashable) -> None:
+        """Adds an element.
+
+        Args:
+            item (Hashable): The element to add.
+        """
+        value = hash64(item)
+        bits = 64 - self.precision
+        index = value >> bits
+        rank = bits - (value & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, items: Iterable[Hashable]) -> None:
+        """Adds every element of an iterable.
+
+        Args:
+            items (Iterable[Hashable]): The elements to add.
+        """
+        registers, precision = self.registers, self.precision
+        bits = 64 - precision
+        low = (1 << bits) - 1
+        for item in items:
+            value = hash64(item)
+            index = value >> bits
+            rank = bits - (value & low).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Adds the elements summarised by another HyperLogLog.
+
+        Args:
+            other (HyperLogLog): A HyperLogLog of the same precision.
+
+        Raises:
+            ValueError: If the precisions differ.
+        """
+        if other.precision != self.precision:
+            msg = "Only HyperLogLogs of the same precision can be merged."
+            raise ValueError(msg)
+
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> int:
+        """Estimates the number of distinct elements added.
+
+        Returns:
+            int: The estimated number of distinct elements.
+        """
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / math.fsum(2.0**-rank for rank in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+
+        return round(estimate)
+
+
+class TDigest:
+    """An estimator of the quantiles of a stream of numbers.
+
+    Values are clustered into centroids, which are kept small near the extremes, so that the
+    error of the estimates, measured in ranks, shrinks towards the extreme quantiles. The
+    smallest and the largest values are kept as centroids of their own. The number of
+    centroids is bounded by about `compression`, whatever the number of values.
+
+    Example:
+        ```python
+        digest = TDigest()
+        digest.update(range(1, 1001))
+        print(digest.quantile(0.99))  # Output: about 990
+        ```
+    """
+
+    def __init__(self, compression: float = 100) -> None:
+        """Initializes an empty TDigest.
+
+        Args:
+            compression (float): The accuracy of the digest, trading memory for precision.
+        """
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._centroids: list[tuple[float, float]] = []
+        self._buffer: list[tuple[float, float]] = []
+        self._buffer_size = max(int(5 * compression), 16)
+
+    def add(self, value: float, weight: float = 1) -> None:
+        """Adds a value.
+
+        Args:
+            value (float): The value to add.
+            weight (float): The number of times the value is added.
+        """
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self._buffer_size:
+            self._compress()
+
+    def update(self, values: Iterable[float]) -> None:
+        """Adds every value of an iterable.
+
+        Args:
+            values (Iterable[float]): The values to add.
+        """
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "TDigest") -> None:
+        """Adds the values summarised by another TDigest.
+
+        Args:
+            other (TDigest): The TDigest to merge.
+        """
+        if not other.count:
+            return
+
+        self._buffer.extend(chain(other._centroids, other._buffer))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile of the values added.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated value of the quantile.
+
+        Raises:
+            ValueError: If the quantile is out of range or no value was added.
+        """
+        if not 0 <= q <= 1:
+            msg = "The quantile must be between 0 and 1."
+            raise ValueError(msg)
+
+        if not self.count:
+            msg = "Sequence contains no elements."
+            raise ValueError(msg)
+
+        self._compress()
+        centroids = self._centroids
+        index = q * self.count
+        mean, weight = centroids[0]
+        if index < weight / 2:
+            return self.min + (mean - self.min) * index / (weight / 2)
+
+        cumulative = weight / 2
+        for (mean, weight), (next_mean, next_weight) in zip(centroids, centroids[1:]):
+            step = (weight + next_weight) / 2
+            if cumulative + step > index:
+                return mean + (next_mean - mean) * (index - cumulative) / step
+
+            cumulative += step
+
+        mean, weight = centroids[-1]
+        return min(mean + (self.max - mean) * (index - cumulative) / (weight / 2), self.max)
+
+    def _compress(self) -> None:
+        """Merges the buffered values into the centroids, keeping the smallest and the largest
+        point as centroids of their own.
+        """
+        if not self._buffer:
+            return
+
+        points = sorted(chain(self._centroids, self._buffer))
+        self._buffer = []
+        total = math.fsum(weight for _, weight in points)
+        scale = self.compression / (2 * math.pi)
+
+        def limit(q: float) -> float:
+            k = scale * math.asin(2 * q - 1) + 1
+            return (math.sin(min(k / scale, math.pi / 2)) + 1) / 2
+
+        if len(points) <= 2:
+            self._centroids = points
+            return
+
+        centroids = [points[0]]
+        mean, weight = points[1]
+        seen = points[0][1]
+        bound = limit(seen / total)
+        for value, count in points[2:-1]:
+            if (seen + weight + count) / total <= bound:
+                weight += count
+                mean += (value - mean) * count / weight
+                continue
+
+            centroids.append((mean, weight))
+            seen += weight
+            bound = limit(seen / total)
+            mean, weight = value, count
+
+        centroids.append((mean, weight))
+        centroids.append(points[-1])
+        self._centroids = centroids
+
+
+class SpaceSaving:
+    """An estimator of the most frequent elements of a stream.
+
+    At most about twice `capacity` counters are kept. Each estimated count is at least the
+    true count and exceeds it by at most its error, which is below the number of elements
+    divided by `capacity`, so every element more frequent than that is reported.
+
+    Example:
+        ```python
+        sketch = SpaceSaving(capacity=10)
+        sketch.update("abracadabra")
+        print(sketch.top(2))  # Output: [('a', 5), ('b', 2)]
+        ```
+    """
+
+    def __init__(self, capacity: int = 100) -> None:
+        """Initializes an empty SpaceSaving.
+
+        Args:
+            capacity (int): The number of counters retained when they are pruned.
+        """
+        self.capacity = capacity
+        self.counts: dict[Hashable, int] = {}
+        self.errors: dict[Hashable, int] = {}
+        self.floor = 0
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        """Adds an element.
+
+        Args:
+            item (Hashable): The element to add.
+            count (int): The number of times the element is added.
+        """
+        if item in self.counts:
+            self.counts[item] += count
+            return
+
+        self.counts[item] = self.floor + count
+        self.errors[item] = self.floor
+        if len(self.counts) >= 2 * self.capacity:
+            self._prune()
+
+    def update(self, items: Iterable[Hashable]) -> None:
+        """Adds every element of an iterable.
+
+        Args:
+            items (Iterable[Hashable]): The elements to add.
+        """
+        for item in items:
+            self.add(item)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """Adds the elements summarised by another SpaceSaving.
+
+        Args:
+            other (SpaceSaving): The SpaceSaving to merge.
+        """
+        for item in self.counts.keys() - other.counts.keys():
+            self.counts[item] += other.floor
+            self.errors[item] += other.floor
+
+        for item, count in other.counts.items():
+            if item in self.counts:
+                self.counts[item] += count
+                self.errors[item] += other.errors[item]
+            else:
+                self.counts[item] = self.floor + count
+                self.errors[item] = self.floor + other.errors[item]
+
+        self.floor += other.floor
+        if len(self.counts) > self.capacity:
+            self._prune()
+
+    def estimate(self, item: Hashable) -> int:
+        """Estimates the number of occurrences of an element, as an upper bound.
+
+        Args:
+            item (Hashable): The element.
+
+        Returns:
+            int: The estimated number of occurrences.
+        """
+        return self.counts.get(item, self.floor)
+
+    def top(self, count: int) -> list[tuple[Hashable, int]]:
+        """Returns the most frequent elements, along with their estimated counts.
+
+        Args:
+            count (int): The number of elements to return.
+
+        Returns:
+            list[tuple[Hashable, int]]: The elements in descending order of estimated count.
+        """
+        return sorted(self.counts.items(), key=lambda pair: pair[1], reverse=True)[:count]
+
+    def _prune(self) -> None:
+        """Retains the `capacity` largest counters, raising the floor to the largest dropped."""
+        ranked = sorted(self.counts.items(), key=lambda pair: pair[1], reverse=True)
+        self.floor = max(self.floor, ranked[self.capacity][1])
+        self.counts = dict(ranked[: self.capacity])
+        self.errors = {item: self.errors[item] for item in self.counts}
+
+
+class CountMinSketch:
+    """An estimator of the number of occurrences of any element of a stream.
+
+    The estimates never undercount, and overcount by at most `epsilon` times the number of
+    elements with probability `1 - delta`.
+
+    Example:
+        ```python
+        sketch = CountMinSketch(epsilon=0.001, delta=0.01)
+        sketch.update(["a", "b", "a"])
+        print(sketch.estimate("a"))  # Output: 2
+        ```
+    """
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01) -> None:
+        """Initializes an empty CountMinSketch.
+
+        Args:
+            epsilon (float): The error of the estimates, relative to the number of elements.
+            delta (float): The probability of exceeding the error.
+        """
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = [[0] * self.width for _ in range(self.depth)]
+
+    def _cells(self, item: Hashable) -> Sequence[int]:
+        """Returns the column of the element in each row, by double hashing."""
+        value = hash64(item)
+        low, high = value & 0xFFFFFFFF, value >> 32
+        return [(low + row * high) % self.width for row in range(self.depth)]
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        """Adds an element.
+
+        Args:
+            item (Hashable): The element to add.
+            count (int): The number of times the element is added.
+        """
+        for row, column in zip(self.table, self._cells(item)):
+            row[column] += count
+
+    def update(self, items: Iterable[Hashable]) -> None:
+        """Adds every element of an iterable.
+
+        Args:
+            items (Iterable[Hashable]): The elements to add.
+        """
+        for item in items:
+            self.add(item)
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """Adds the elements summarised by another CountMinSketch.
+
+        Args:
+            other (CountMinSketch): A CountMinSketch of the same dimensions.
+
+        Raises:
+            ValueError: If the dimensions differ.
+        """
+        if (other.width, other.depth) != (self.width, self.depth):
+            msg = "Only CountMinSketches of the same dimensions can be merged."
+            raise ValueError(msg)
+
+        self.table = [
+            [mine + theirs for mine, theirs in zip(row, other_row)]
+            for row, other_row in zip(self.table, other.table)
+        ]
+
+    def estimate(self, item: Hashable) -> int:
+        """Estimates the number of occurrences of an element, as an upper bound.
+
+        Args:
+            item (Hashable): The element.
+
+        Returns:
+            int: The estimated number of occurrences.
+        """
+        return min(row[column] for row, column in zip(self.table, self._cells(item)))
+
+
+class BloomFilter:
+    """A set of elements answering membership queries with false positives but no false
+    negatives.
+
+    The memory used only depends on the expected number of elements and the false positive
+    rate, e.g. about 1.2MB for a million elements at 1%.
+
+    Example:
+        ```python
+        seen = BloomFilter(capacity=1_000, false_positive_rate=0.01)
+        print(seen.add("a"))  # Output: True
+        print(seen.add("a"))  # Output: False
+        print("a" in seen)  # Output: True
+        ```
+    """
+
+    def __init__(self, capacity: int = 1_000_000, false_positive_rate: float = 0.01) -> None:
+        """Initializes an empty BloomFilter.
+
+        Args:
+            capacity (int): The expected number of elements. Adding more elements raises the
+                false positive rate above the requested one.
+            false_positive_rate (float): The probability that an element is reported as present
+                although it was never added, once `capacity` elements are added.
+
+        Raises:
+            ValueError: If the capacity or the false positive rate is out of range.
+        """
+        if capacity <= 0 or not 0 < false_positive_rate < 1:
+            msg = "The capacity must be positive and the false positive rate between 0 and 1."
+            raise ValueError(msg)
+
+        self.size = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: Hashable) -> Iterator[int]:
+        """Yields the bit of the element for each hash function, by double hashing."""
+        value = hash64(item)
+        low, high = value & 0xFFFFFFFF, value >> 32 | 1
+        size = self.size
+        for index in range(self.hashes):
+            yield (low + index * high) % size
+
+    def add(self, item: Hashable) -> bool:
+        """Adds an element.
+
+        Args:
+            item (Hashable): The element to add.
+
+        Returns:
+            bool: True if the element was definitely absent, False if it may have been added
+                before.
+        """
+        bits = self.bits
+        added = False
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+
+        return added
+
+    def __contains__(self, item: Hashable) -> bool:
+        """Determines whether an element may have been added."""
+        bits = self.bits
+        return all(bits[position >> 3] >> (position & 7) & 1 for position in self._positions(item))
+
+    def merge(self, other: "BloomFilter") -> None:
+        """Adds the elements of another BloomFilter.
+
+        Args:
+            other (BloomFilter): A BloomFilter of the same dimensions.
+
+        Raises:
+            ValueError: If the dimensions differ.
+        """
+        if (other.size, other.hashes) != (self.size, self.hashes):
+            msg = "Only BloomFilters of the same dimensions can be merged."
+            raise ValueError(msg)
+
+        self.bits = bytearray(mine | theirs for mine, theirs in zip(self.bits, other.bits))
@@ -0,0 +1,130 @@
+"""External merge sort of inputs that do not fit in memory."""
+
+from collections.abc import Callable, Iterable, Iterator
+from heapq import merge
+from itertools import islice
+from operator import itemgetter
+from typing import Any, TypeVar
+
+from querpyable.spill import SpillFile
+
+T = TypeVar("T")
+
+MERGE_WIDTH = 64
+"""The maximum number of runs merged at once, bounding the number of open temporary files."""
+
+_MISSING = object()
+
+_key = itemgetter(0)
+_value = itemgetter(1)
+
+
+def external_sort(
+    items: Iterable[T],
+    key: Callable[[T], Any],
+    reverse: bool,  # noqa: FBT001
+    memory_budget: int,
+) -> Iterator[T]:
+    """Sorts the elements while holding at most `memory_budget` of them in memory.
+
+    The input is read in runs of `memory_budget` elements, each of which is sorted in memory
+    and spilled to a temporary file along with the keys of its elements, so that keys are
+    computed exactly once. As soon as `MERGE_WIDTH` runs of the same size are spilled, they are
+    merged into a single file, so that only `MERGE_WIDTH - 1` files per level of merging, a
+    handful even for huge inputs, are open at once. The remaining runs are merged lazily as the
+    result is iterated, at most `MERGE_WIDTH` at a time. An input that fits within the budget
+    is sorted in memory without touching the disk. Like `sorted`, the sort is stable, and keys
+    and elements must be picklable to be spilled.
+
+    Args:
+        items (Iterable[T]): The elements to sort.
+        key (Callable[[T], Any]): The sort key of each element.
+        reverse (bool): Whether to sort in descending order.
+        memory_budget (int): The maximum number of elements sorted in memory at once.
+
+    Yields:
+        T: The elements, in sorted order.
+
+    Raises:
+        ValueError: If the memory budget is not positive.
+    """
+    if memory_budget <= 0:
+        msg = "The memory budget must be positive."
+        raise ValueError(msg)
+
+    iterator = iter(items)
+    run = list(islice(iterator, memory_budget))
+    extra = next(iterator, _MISSING)
+    if extra is _MISSING:
+        yield from sorted(run, key=key, reverse=reverse)
+        return
+
+    levels: list[list[SpillFile]] = []
+    runs: list[SpillFile] = []
+    try:
+        while run:
+            pairs = sorted(((key(item), item) for item in run), key=_key, reverse=reverse)
+            del run
+            _add(levels, 0, _spill(pairs), reverse)
+            del pairs
+            if extra is _MISSING:
+                break
+
+            run = [extra, *islice(iterator, memory_budget - 1)]
+            extra = next(iterator, _MISSING)
+
+        runs = [spilled for level in reversed(levels) for spilled in level]
+        while len(runs) > MERGE_WIDTH:
+            oldest = runs[:MERGE_WIDTH]
+            runs = [_spill(_merge(oldest, reverse)), *runs[MERGE_WIDTH:]]
+            _close(oldest)
+
+        yield from map(_value, _merge(runs, reverse))
+    finally:
+        _close(runs)
+        for level in levels:
+            _close(level)
+
+
+def _add(
+    levels: list[list[SpillFile]],
+    depth: int,
+    run: SpillFile,
+    reverse: bool,  # noqa: FBT001
+) -> None:
+    """Adds a run to a level, merging the level into a single run of the next one once it
+    holds `MERGE_WIDTH` runs, so that at most `MERGE_WIDTH - 1` runs per level stay open.
+    Runs of deeper levels hold earlier elements than the runs of shallower ones.
+    """
+    if depth == len(levels):
+        levels.append([])
+
+    level = levels[depth]
+    level.append(run)
+    if len(level) < MERGE_WIDTH:
+        return
+
+    merged = _spill(_merge(level, reverse))
+    _close(level)
+    level.clear()
+    _add(levels, depth + 1, merged, reverse)
+
+
+def _close(runs: Iterable[SpillFile]) -> None:
+    """Closes spill files, removing their underlying files."""
+    for spilled in runs:
+        spilled.close()
+
+
+def _spill(pairs: Iterable[tuple[Any, Any]]) -> SpillFile:
+    """Writes key-element pairs to a new spill file."""
+    spilled = SpillFile()
+    spilled.extend(pairs)
+    return spilled
+
+
+def _merge(runs: list[SpillFile], reverse: bool) -> Iterator[tuple[Any, Any]]:  # noqa: FBT001
+    """Merges sorted runs of key-element pairs, taking pairs with equal keys from earlier runs
+    first.
+    """
+    return merge(*runs, key=_key, reverse=reverse)
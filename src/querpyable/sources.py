@@ -0,0 +1,171 @@
+"""Lazy, re-iterable sources reading elements from files."""
+
+import csv
+import io
+import json
+import mmap
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from operator import itemgetter
+from typing import Any, Optional, Union
+
+Path = Union[str, "os.PathLike[str]"]
+"""The path of a file."""
+
+BUFFER_SIZE = 1 << 20
+"""The default size of the read buffer, in bytes."""
+
+
+class FileSource(Iterable[Any]):
+    """A re-iterable view of the elements read from a file.
+
+    The file is opened anew each time the source is iterated, and closed as soon as the
+    iteration completes or is abandoned, e.g. by a `take` that is satisfied.
+    """
+
+    def __init__(self, read: Callable[..., Iterator[Any]], *args: Any) -> None:
+        """Initializes a FileSource.
+
+        Args:
+            read (Callable[..., Iterator[Any]]): The generator reading the elements.
+            *args (Any): The arguments of the generator, starting with the path of the file.
+        """
+        self.read = read
+        self.args = args
+
+    def __iter__(self) -> Iterator[Any]:
+        """Reads the elements of the file."""
+        return self.read(*self.args)
+
+
+def read_lines(
+    path: Path,
+    encoding: str = "utf-8",
+    buffer_size: int = BUFFER_SIZE,
+    use_mmap: bool = False,  # noqa: FBT001, FBT002
+) -> Iterator[str]:
+    """Yields the lines of a text file, along with their line endings.
+
+    Args:
+        path (Path): The path of the file.
+        encoding (str): The encoding of the file.
+        buffer_size (int): The size of the read buffer, in bytes.
+        use_mmap (bool): Whether to map the file into memory rather than reading it through a
+            buffer, letting the operating system page it in.
+
+    Yields:
+        str: Each line, decoded lazily.
+    """
+    if not use_mmap:
+        with open(path, encoding=encoding, newline="", buffering=buffer_size) as file:
+            yield from file
+
+        return
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            buffered = io.BufferedReader(_MappedFile(mapped), buffer_size)
+            yield from io.TextIOWrapper(buffered, encoding=encoding, newline="")
+
+
+class _MappedFile(io.RawIOBase):
+    """A readable raw stream over a memory-mapped file, so that it can be decoded by the same
+    text layer as a regular file.
+    """
+
+    def __init__(self, mapped: mmap.mmap) -> None:
+        self.mapped = mapped
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.mapped.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def read_stripped_lines(
+    path: Path,
+    encoding: str,
+    buffer_size: int,
+    use_mmap: bool,  # noqa: FBT001
+) -> Iterator[str]:
+    """Yields the lines of a text file, without their line endings.
+
+    Exactly one line ending, `\\r\\n`, `\\n` or `\\r`, is removed from each line.
+    """
+    for line in read_lines(path, encoding, buffer_size, use_mmap):
+        if line.endswith("\r\n"):
+            yield line[:-2]
+        elif line.endswith(("\n", "\r")):
+            yield line[:-1]
+        else:
+            yield line
+
+
+def read_csv(
+    path: Path,
+    columns: Optional[Sequence[str]],
+    delimiter: str,
+    encoding: str,
+    buffer_size: int,
+    use_mmap: bool,  # noqa: FBT001
+) -> Iterator[dict[str, Optional[str]]]:
+    """Yields the rows of a CSV file with a header row, as dicts of the requested columns.
+
+    Like `csv.DictReader`, blank rows are skipped and the values missing from short rows are
+    None.
+
+    Raises:
+        ValueError: If a requested column is missing from the header.
+    """
+    rows = csv.reader(read_lines(path, encoding, buffer_size, use_mmap), delimiter=delimiter)
+    header = next(rows, None)
+    if header is None:
+        return
+
+    names = header if columns is None else list(columns)
+    missing = [name for name in names if name not in header]
+    if missing:
+        msg = f"Unknown columns {missing} in '{path}'."
+        raise ValueError(msg)
+
+    width = len(header)
+    indices = [header.index(name) for name in names]
+    values = itemgetter(*indices) if len(indices) > 1 else lambda row: (row[indices[0]],)
+    for row in rows:
+        if not row:
+            continue
+
+        if len(row) < width:
+            yield dict(zip(names, values([*row, *[None] * (width - len(row))])))
+        else:
+            yield dict(zip(names, values(row)))
+
+
+def read_jsonl(
+    path: Path,
+    fields: Optional[Sequence[str]],
+    encoding: str,
+    buffer_size: int,
+    use_mmap: bool,  # noqa: FBT001
+) -> Iterator[Any]:
+    """Yields the values of a JSON Lines file, skipping blank lines.
+
+    When fields are requested, each value is an object reduced to those fields, missing fields
+    being None.
+    """
+    loads = json.loads
+    for line in read_lines(path, encoding, buffer_size, use_mmap):
+        if not line.strip():
+            continue
+
+        value = loads(line)
+        if fields is None:
+            yield value
+        else:
+            yield {field: value.get(field) for field in fields}
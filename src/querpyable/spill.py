@@ -0,0 +1,87 @@
+"""Temporary on-disk storage for elements that do not fit in memory."""
+
+import pickle
+from collections.abc import Iterable, Iterator
+from tempfile import TemporaryFile
+from typing import IO, Any, Optional
+
+BATCH_SIZE = 1024
+"""The number of elements serialised together in a single pickle record."""
+
+
+class SpillFile(Iterable[Any]):
+    """An append-only sequence of elements backed by an anonymous temporary file.
+
+    Elements are buffered and serialised in batches, which keeps the per-element overhead of
+    pickling low. The file is removed as soon as the SpillFile is closed or garbage collected.
+    """
+
+    def __init__(self, batch_size: int = BATCH_SIZE) -> None:
+        """Initializes an empty SpillFile.
+
+        Args:
+            batch_size (int): The number of elements serialised together.
+        """
+        self.batch_size = batch_size
+        self._buffer: list[Any] = []
+        self._file: Optional[IO[bytes]] = None
+        self._length = 0
+
+    def __len__(self) -> int:
+        """Returns the number of elements written."""
+        return self._length
+
+    def append(self, item: Any) -> None:
+        """Appends an element, writing the buffered batch to disk once it is full.
+
+        Args:
+            item (Any): The element to append. It must be picklable.
+        """
+        self._buffer.append(item)
+        self._length += 1
+        if len(self._buffer) >= self.batch_size:
+            self._flush()
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Appends every element of an iterable.
+
+        Args:
+            items (Iterable[Any]): The elements to append.
+        """
+        for item in items:
+            self.append(item)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Reads the elements back, in the order they were written."""
+        self._flush()
+        if self._file is None:
+            return
+
+        self._file.seek(0)
+        while True:
+            try:
+                batch = pickle.load(self._file)  # noqa: S301
+            except EOFError:
+                return
+
+            yield from batch
+
+    def close(self) -> None:
+        """Discards the elements and removes the underlying file."""
+        self._buffer = []
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _flush(self) -> None:
+        """Writes the buffered elements to the end of the file."""
+        if not self._buffer:
+            return
+
+        if self._file is None:
+            # The file outlives this call and is closed by `close` or on garbage collection.
+            self._file = TemporaryFile()  # noqa: SIM115
+
+        self._file.seek(0, 2)
+        pickle.dump(self._buffer, self._file, pickle.HIGHEST_PROTOCOL)
+        self._buffer = []
@@ -0,0 +1,359 @@
+"""Vectorised execution of queries over NumPy arrays."""
+
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from typing import Any, Optional, TypeVar
+
+from querpyable.querpyable import Queryable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+Array = Any
+"""A NumPy array."""
+
+BOX_SIZE = 1024
+"""The number of elements converted to Python objects at once when iterating an array."""
+
+
+class ArrayQueryable(Queryable[T]):
+    """A Queryable over a one-dimensional NumPy array, evaluated a whole array at a time.
+
+    `where`, `select`, `skip`, `take` and `reverse` are recorded as array operations, and the
+    numeric terminals are computed by NumPy. Predicates and selectors are applied element by
+    element, unless they are NumPy ufuncs or `numpy.vectorize` objects, or `vectorized=True`
+    is passed, in which case they are called once with the whole array and must return an
+    array with one result per element. The elements are only converted to Python objects
+    when the ArrayQueryable is iterated or converted to a list, and any other operator falls
+    back to the element-wise execution of `Queryable`.
+
+    NumPy is an optional dependency, which must be installed to use an ArrayQueryable.
+
+    Example:
+        ```python
+        import numpy as np
+
+        readings = ArrayQueryable(np.array([0.5, 2.0, 3.5, 1.0]))
+        print(readings.where(lambda x: x > 1, vectorized=True).select(np.sqrt).sum())
+        # Output: 3.2850...
+        ```
+    """
+
+    def __init__(
+        self,
+        array: Array,
+        operations: tuple[Callable[[Array], Array], ...] = (),
+    ) -> None:
+        """Initializes an ArrayQueryable object.
+
+        Args:
+            array (numpy.ndarray): The array to be queried. Any object convertible to an array
+                with `numpy.asarray` is accepted.
+            operations (tuple[Callable[[numpy.ndarray], numpy.ndarray], ...]): The array
+                operations applied, in order, when the ArrayQueryable is evaluated.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            msg = "NumPy is required to query arrays, install the `querpyable[numpy]` extra."
+            raise ImportError(msg)
+
+        super().__init__(_Boxed(self))
+        self.array = array
+        self._operations = operations
+
+    def _apply(self, operation: Callable[[Array], Array]) -> "ArrayQueryable[Any]":
+        """Returns a new ArrayQueryable over the same array with an additional operation."""
+        return ArrayQueryable(self.array, (*self._operations, operation))
+
+    def to_array(self) -> Array:
+        """Evaluates the ArrayQueryable into an array.
+
+        Returns:
+            numpy.ndarray: An array containing the resulting elements.
+
+        Example:
+            ```python
+            numbers = ArrayQueryable(np.arange(5))
+            print(numbers.skip(1).take(3).to_array())  # Output: [1 2 3]
+            ```
+        """
+        array = np.asarray(self.array)
+        for operation in self._operations:
+            array = operation(array)
+
+        return array
+
+    def where(
+        self,
+        predicate: Callable[[T], bool],
+        *,
+        vectorized: bool = False,
+    ) -> "ArrayQueryable[T]":
+        """Filters the elements with a boolean mask.
+
+        Args:
+            predicate (Callable[[T], bool]): A function mapping an element to a boolean.
+            vectorized (bool): Whether the predicate maps the whole array to a boolean mask.
+                Implied for NumPy ufuncs and `numpy.vectorize` objects.
+
+        Returns:
+            ArrayQueryable: A new ArrayQueryable containing the elements satisfying the predicate.
+
+        Raises:
+            ValueError: If a vectorised predicate does not return one result per element.
+
+        Example:
+            ```python
+            numbers = ArrayQueryable(np.arange(10))
+            print(numbers.where(lambda x: x % 3 == 0, vectorized=True).to_list())
+            # Output: [0, 3, 6, 9]
+            ```
+        """
+        return self._apply(partial(_filter, predicate, vectorized))
+
+    def select(
+        self,
+        selector: Callable[[T], U],
+        *,
+        vectorized: bool = False,
+    ) -> "ArrayQueryable[U]":
+        """Projects the elements into a new array.
+
+        Args:
+            selector (Callable[[T], U]): A function mapping an element to a new value.
+            vectorized (bool): Whether the selector maps the whole array to an array of the
+                same length. Implied for NumPy ufuncs and `numpy.vectorize` objects.
+
+        Returns:
+            ArrayQueryable: A new ArrayQueryable containing the projected elements.
+
+        Raises:
+            ValueError: If a vectorised selector does not return one result per element.
+        """
+        return self._apply(partial(_map, selector, vectorized))
+
+    def skip(self, count: int) -> "ArrayQueryable[T]":
+        """Skips the specified number of elements by slicing the array.
+
+        Args:
+            count (int): The number of elements to skip.
+
+        Returns:
+            ArrayQueryable: A new ArrayQueryable containing the remaining elements.
+        """
+        return self._apply(lambda array: array[max(count, 0) :])
+
+    def take(self, count: int) -> "ArrayQueryable[T]":
+        """Takes the specified number of elements by slicing the array.
+
+        Args:
+            count (int): The number of elements to take.
+
+        Returns:
+            ArrayQueryable: A new ArrayQueryable containing the first `count` elements.
+        """
+        return self._apply(lambda array: array[: max(count, 0)])
+
+    def reverse(self) -> "ArrayQueryable[T]":
+        """Reverses the elements through a view of the array.
+
+        Returns:
+            ArrayQueryable: A new ArrayQueryable containing the elements in reverse order.
+        """
+        return self._apply(lambda array: array[::-1])
+
+    def to_list(self) -> list[T]:
+        """Converts the elements to a list of Python objects.
+
+        Returns:
+            list[T]: A list containing all resulting elements.
+        """
+        return self.to_array().tolist()
+
+    def count(
+        self,
+        predicate: Optional[Callable[[T], bool]] = None,
+        *,
+        vectorized: bool = False,
+    ) -> int:
+        """Counts the elements, or those satisfying a predicate.
+
+        Args:
+            predicate (Optional[Callable[[T], bool]]): The optional predicate.
+            vectorized (bool): Whether the predicate maps the whole array to a boolean mask.
+
+        Returns:
+            int: The number of elements satisfying the predicate.
+        """
+        array = self.to_array()
+        if predicate is None:
+            return len(array)
+
+        return int(np.count_nonzero(_mask(predicate, vectorized, array)))
+
+    def any(
+        self,
+        predicate: Optional[Callable[[T], bool]] = None,
+        *,
+        vectorized: bool = False,
+    ) -> bool:
+        """Determines whether any element is truthy or satisfies a predicate.
+
+        Args:
+            predicate (Optional[Callable[[T], bool]]): The optional predicate.
+            vectorized (bool): Whether the predicate maps the whole array to a boolean mask.
+
+        Returns:
+            bool: True if any element satisfies the predicate, False otherwise.
+        """
+        array = self.to_array()
+        return bool(np.any(array if predicate is None else _mask(predicate, vectorized, array)))
+
+    def all(
+        self,
+        predicate: Optional[Callable[[T], bool]] = None,
+        *,
+        vectorized: bool = False,
+    ) -> bool:
+        """Determines whether every element is truthy or satisfies a predicate.
+
+        Args:
+            predicate (Optional[Callable[[T], bool]]): The optional predicate.
+            vectorized (bool): Whether the predicate maps the whole array to a boolean mask.
+
+        Returns:
+            bool: True if all elements satisfy the predicate, False otherwise.
+        """
+        array = self.to_array()
+        return bool(np.all(array if predicate is None else _mask(predicate, vectorized, array)))
+
+    def contains(self, value: T) -> bool:
+        """Determines whether any element equals the given value.
+
+        Args:
+            value (T): The value to look for.
+
+        Returns:
+            bool: True if the value is found, False otherwise.
+        """
+        return bool(np.any(self.to_array() == value))
+
+    def sum(self) -> Any:
+        """Calculates the sum of the elements with NumPy.
+
+        Returns:
+            Any: The sum of the elements, as a Python number.
+        """
+        return self.to_array().sum().item()
+
+    def min(self) -> Any:
+        """Finds the minimum element with NumPy.
+
+        Returns:
+            Any: The minimum element, as a Python number.
+
+        Raises:
+            ValueError: If there are no elements.
+        """
+        return self.to_array().min().item()
+
+    def max(self) -> Any:
+        """Finds the maximum element with NumPy.
+
+        Returns:
+            Any: The maximum element, as a Python number.
+
+        Raises:
+            ValueError: If there are no elements.
+        """
+        return self.to_array().max().item()
+
+    def average(self) -> float:
+        """Calculates the average of the elements in a single NumPy reduction.
+
+        Returns:
+            float: The average of the elements.
+
+        Raises:
+            ZeroDivisionError: If there are no elements.
+        """
+        array = self.to_array()
+        return array.sum().item() / len(array)
+
+
+class _Boxed(Iterable[Any]):
+    """The elements of an ArrayQueryable as Python objects, converted a block at a time."""
+
+    def __init__(self, queryable: ArrayQueryable[Any]) -> None:
+        self.queryable = queryable
+
+    def __iter__(self) -> Iterator[Any]:
+        array = self.queryable.to_array()
+        for start in range(0, len(array), BOX_SIZE):
+            yield from array[start : start + BOX_SIZE].tolist()
+
+
+def _is_vectorized(function: Callable[[Any], Any], vectorized: bool) -> bool:  # noqa: FBT001
+    """Determines whether a function is to be called with the whole array."""
+    return vectorized or isinstance(function, (np.ufunc, np.vectorize))
+
+
+def _vectorize(function: Callable[[Any], Any], array: Array) -> Array:
+    """Calls a vectorised function with a whole array, checking that it returns an array holding
+    one result per element.
+    """
+    result = function(array)
+    if not isinstance(result, np.ndarray) or result.shape[:1] != array.shape[:1]:
+        msg = f"A vectorised function must return an array of {len(array)} elements."
+        raise ValueError(msg)
+
+    return result
+
+
+def _mask(
+    predicate: Callable[[Any], bool],
+    vectorized: bool,  # noqa: FBT001
+    array: Array,
+) -> Array:
+    """Computes the boolean mask of the elements satisfying a predicate."""
+    if _is_vectorized(predicate, vectorized):
+        return _vectorize(predicate, array).astype(bool, copy=False)
+
+    items = array.tolist()
+    return np.fromiter((bool(predicate(item)) for item in items), dtype=bool, count=len(items))
+
+
+def _filter(
+    predicate: Callable[[Any], bool],
+    vectorized: bool,  # noqa: FBT001
+    array: Array,
+) -> Array:
+    """Retains the elements of an array satisfying a predicate."""
+    return array[_mask(predicate, vectorized, array)]
+
+
+def _map(
+    selector: Callable[[Any], Any],
+    vectorized: bool,  # noqa: FBT001
+    array: Array,
+) -> Array:
+    """Projects the elements of an array with a selector."""
+    if _is_vectorized(selector, vectorized):
+        return _vectorize(selector, array)
+
+    values = [selector(item) for item in array.tolist()]
+    if all(np.isscalar(value) for value in values):
+        return np.asarray(values)
+
+    result = np.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        result[index] = value
+
+    return result
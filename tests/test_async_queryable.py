@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from querpyable import AsyncQueryable
+
+
+async def numbers(count):
+    for n in range(count):
+        await asyncio.sleep(0)
+        yield n
+
+
+async def is_even(n):
+    await asyncio.sleep(0)
+    return n % 2 == 0
+
+
+def test_operators_over_async_source():
+    async def query():
+        return await (
+            AsyncQueryable(numbers(10))
+            .where(is_even)
+            .select(lambda x: x * 10)
+            .skip(1)
+            .take(3)
+            .to_list()
+        )
+
+    assert asyncio.run(query()) == [20, 40, 60]
+
+
+def test_sync_source_is_reiterable():
+    async def query():
+        queryable = AsyncQueryable([1, 2, 3]).select(lambda x: x + 1)
+        return await queryable.to_list(), await queryable.sum()
+
+    assert asyncio.run(query()) == ([2, 3, 4], 9)
+
+
+def test_select_many_flattens_sync_and_async_results():
+    async def query():
+        return await AsyncQueryable([2, 3]).select_many(numbers).to_list()
+
+    assert asyncio.run(query()) == [0, 1, 0, 1, 2]
+
+
+def test_terminals():
+    async def query():
+        queryable = AsyncQueryable([3, 1, 2, 3])
+        return (
+            await queryable.first(is_even),
+            await queryable.first_or_default(lambda x: x > 5, -1),
+            await queryable.count(),
+            await queryable.any(is_even),
+            await queryable.all(is_even),
+            await queryable.min(),
+            await queryable.max(),
+            await queryable.distinct().to_list(),
+            await queryable.aggregate(lambda x, y: x * y),
+        )
+
+    assert asyncio.run(query()) == (2, -1, 4, True, False, 1, 3, [3, 1, 2], 18)
+
+
+def test_first_and_aggregate_raise_on_empty():
+    with pytest.raises(ValueError, match='no elements'):
+        asyncio.run(AsyncQueryable([]).first())
+
+    with pytest.raises(ValueError, match='no matching element'):
+        asyncio.run(AsyncQueryable([1, 3]).first(is_even))
+
+    with pytest.raises(ValueError, match='no elements'):
+        asyncio.run(AsyncQueryable([]).aggregate(lambda x, y: x + y))
+
+
+def test_take_does_not_pull_further():
+    pulled = []
+
+    async def source():
+        for n in range(100):
+            pulled.append(n)
+            yield n
+
+    assert asyncio.run(AsyncQueryable(source()).take(3).to_list()) == [0, 1, 2]
+    assert pulled == [0, 1, 2]
+
+
+def test_select_concurrency_preserves_order_and_limit():
+    running = 0
+    peak = 0
+
+    async def fetch(n):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - n % 5))
+        running -= 1
+        return n * n
+
+    async def query():
+        return await AsyncQueryable(numbers(10)).select(fetch, concurrency=4).to_list()
+
+    assert asyncio.run(query()) == [n * n for n in range(10)]
+    assert peak == 4
+
+
+def test_where_concurrency():
+    async def query():
+        return await AsyncQueryable(range(10)).where(is_even, concurrency=3).to_list()
+
+    assert asyncio.run(query()) == [0, 2, 4, 6, 8]
+
+
+def test_reverse_and_ordering():
+    people = [('Bob', 30), ('Alice', 30), ('Charlie', 25), ('Dave', 25)]
+
+    async def age_of(person):
+        await asyncio.sleep(0)
+        return person[1]
+
+    async def query():
+        queryable = AsyncQueryable(people)
+        return (
+            await queryable.reverse().to_list(),
+            await queryable.order_by(age_of).to_list(),
+            await queryable.order_by(age_of).then_by('[0]').to_list(),
+            await queryable.order_by_descending('[1]').then_by_descending('[0]').to_list(),
+            await queryable.order_by_descending(age_of).then_by('[0]').to_list(),
+            await queryable.order_by_descending(age_of).to_list(),
+        )
+
+    assert asyncio.run(query()) == (
+        people[::-1],
+        [('Charlie', 25), ('Dave', 25), ('Bob', 30), ('Alice', 30)],
+        [('Charlie', 25), ('Dave', 25), ('Alice', 30), ('Bob', 30)],
+        [('Bob', 30), ('Alice', 30), ('Dave', 25), ('Charlie', 25)],
+        [('Alice', 30), ('Bob', 30), ('Charlie', 25), ('Dave', 25)],
+        [('Bob', 30), ('Alice', 30), ('Charlie', 25), ('Dave', 25)],
+    )
+
+
+def test_group_by_join_and_to_dictionary():
+    users = [(1, 'Alice'), (2, 'Bob'), (3, 'Carol')]
+    orders = [(1, 'book'), (3, 'lamp'), (1, 'pen')]
+
+    async def query():
+        words = AsyncQueryable(numbers(6)).group_by(is_even, lambda n: n * 10)
+        joined = AsyncQueryable(users).join(
+            AsyncQueryable(orders), '[0]', '[0]', lambda user, order: (user[1], order[1])
+        )
+        return (
+            await words.to_list(),
+            await joined.to_list(),
+            await AsyncQueryable(users).to_dictionary('[0]', '[1]'),
+        )
+
+    assert asyncio.run(query()) == (
+        [(True, [0, 20, 40]), (False, [10, 30, 50])],
+        [('Alice', 'book'), ('Alice', 'pen'), ('Carol', 'lamp')],
+        {1: 'Alice', 2: 'Bob', 3: 'Carol'},
+    )
@@ -0,0 +1,108 @@
+from array import array
+from collections import namedtuple
+from dataclasses import dataclass
+
+import pytest
+
+from querpyable import ColumnarQueryable, Queryable
+from querpyable.columnar import Table
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+    city: str
+
+
+PEOPLE = [
+    Person('Alice', 30, 'Athens'),
+    Person('Bob', 25, 'Berlin'),
+    Person('Carol', 35, 'Athens'),
+    Person('Dave', 25, 'Athens'),
+]
+
+
+def test_table_packs_numeric_columns():
+    table = Table.from_records([{'a': 1, 'b': 1.5, 'c': 'x'}, {'a': 2, 'b': 2.5, 'c': True}])
+    assert table.columns['a'] == array('q', [1, 2])
+    assert table.columns['b'] == array('d', [1.5, 2.5])
+    assert table.columns['c'] == ['x', True]
+    assert len(table) == 2
+
+
+def test_table_fills_missing_fields():
+    table = Table.from_records([{'a': 1}, {'b': 2}])
+    assert list(table.rows(range(2))) == [{'a': 1, 'b': None}, {'a': None, 'b': 2}]
+
+
+def test_table_rejects_ragged_columns():
+    with pytest.raises(ValueError, match='same length'):
+        Table({'a': [1, 2], 'b': [1]})
+
+
+def test_records_are_rebuilt_with_their_type():
+    people = Queryable.from_records(PEOPLE)
+    assert isinstance(people, ColumnarQueryable)
+    assert people.to_list() == PEOPLE
+
+    Point = namedtuple('Point', 'x y')
+    assert Queryable.from_records([Point(1, 2)]).to_list() == [Point(1, 2)]
+
+
+def test_columnar_operators():
+    people = Queryable.from_records(PEOPLE)
+    adults = people.where(lambda age: age > 25, on='age')
+    assert adults.select('name').to_list() == ['Alice', 'Carol']
+    assert adults.count() == 2
+    assert people.where(lambda person: person.city == 'Berlin').select('name').to_list() == [
+        'Bob',
+    ]
+    labels = people.select(lambda name, age: f'{name}:{age}', on=('name', 'age'))
+    assert labels.take(2).to_list() == ['Alice:30', 'Bob:25']
+    assert people.select(('name', 'city')).skip(3).to_list() == [('Dave', 'Athens')]
+    assert people.reverse().select('name').first() == 'Dave'
+
+
+def test_columnar_ordering():
+    people = Queryable.from_records(PEOPLE)
+    assert people.order_by('age').then_by_descending('name').select('name').to_list() == [
+        'Dave',
+        'Bob',
+        'Alice',
+        'Carol',
+    ]
+    assert people.order_by_descending(lambda person: len(person.name)).first().name == 'Alice'
+
+
+def test_columnar_ordering_with_memory_budget():
+    people = Queryable.from_records(PEOPLE)
+    ordered = people.order_by('age', memory_budget=1).then_by_descending('name')
+    assert ordered.select('name').to_list() == ['Dave', 'Bob', 'Alice', 'Carol']
+    youngest = people.order_by_descending('age', memory_budget=2).reverse().first()
+    assert youngest.name == 'Dave'
+
+
+def test_columnar_group_by():
+    people = Queryable.from_records(PEOPLE)
+    assert people.group_by('city', 'name').to_list() == [
+        ('Athens', ['Alice', 'Carol', 'Dave']),
+        ('Berlin', ['Bob']),
+    ]
+    groups = dict(people.group_by('city'))
+    assert groups['Athens'].where(lambda age: age < 35, on='age').count() == 2
+
+
+def test_from_columns_and_fallback_operators():
+    sales = Queryable.from_columns({'region': ['eu', 'us', 'eu'], 'amount': [1, 2, 3]})
+    assert sales.select('amount').sum() == 6
+    assert sales.select('region').distinct().to_list() == ['eu', 'us']
+    assert sales.first() == {'region': 'eu', 'amount': 1}
+    assert sales.to_dictionary(lambda row: row['amount'], lambda row: row['region']) == {
+        1: 'eu',
+        2: 'us',
+        3: 'eu',
+    }
+
+    with pytest.raises(ValueError, match="Unknown column 'price'"):
+        sales.select('price').to_list()
@@ -0,0 +1,62 @@
+from operator import attrgetter, itemgetter
+from types import SimpleNamespace
+
+import pytest
+
+from querpyable.fields import compile_key, freeze
+
+ALICE = SimpleNamespace(
+    name='Alice',
+    age=30,
+    address=SimpleNamespace(city='Athens'),
+    orders=[{'total': 10}, {'total': 20}],
+)
+
+
+@pytest.mark.parametrize(
+    ('spec', 'expected'),
+    [
+        ('name', 'Alice'),
+        ('address.city', 'Athens'),
+        ('orders[1]', {'total': 20}),
+        ('orders[-1]["total"]', 20),
+        ("orders[0]['total']", 10),
+        (('name', 'age'), ('Alice', 30)),
+        (('address.city',), ('Athens',)),
+        (('name', 'orders[0]["total"]'), ('Alice', 10)),
+    ],
+)
+def test_compile_key(spec, expected):
+    assert compile_key(spec)(ALICE) == expected
+
+
+def test_item_paths():
+    record = {'id': 1, 'tags': ['a', 'b']}
+    assert compile_key('["id"]')(record) == 1
+    assert compile_key('["tags"][1]')(record) == 'b'
+    assert compile_key(('["id"]', '["tags"]'))(record) == (1, ['a', 'b'])
+
+
+def test_simple_specs_compile_to_getters():
+    assert isinstance(compile_key('address.city'), attrgetter)
+    assert isinstance(compile_key(('name', 'age')), attrgetter)
+    assert isinstance(compile_key('[0]'), itemgetter)
+    assert isinstance(compile_key(('[0]', '[1]')), itemgetter)
+
+
+def test_callables_are_returned_as_is():
+    assert compile_key(len) is len
+
+
+@pytest.mark.parametrize('spec', ['', '.name', 'name.', 'a..b', '[x]', 'a b', '["a"]b', '1a'])
+def test_invalid_specs(spec):
+    with pytest.raises(ValueError, match='Invalid field specification'):
+        compile_key(spec)
+
+
+def test_freeze():
+    row = {'id': 1, 'tags': ['a', 'b'], 'seen': {2, 3}}
+    assert freeze(row) == freeze({'seen': {3, 2}, 'tags': ['a', 'b'], 'id': 1})
+    assert hash(freeze(row)) == hash(freeze(dict(row)))
+    assert freeze('abc') == 'abc'
+    assert freeze(([1],)) == ((1,),)
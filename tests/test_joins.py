@@ -0,0 +1,82 @@
+from querpyable.joins import merge_join, partitioned_hash_join
+from querpyable.lookup import Lookup
+
+
+def first(pair):
+    return pair[0]
+
+
+def test_merge_join():
+    outer = [1, 2, 2, 4, 6]
+    inner = [(0, 'z'), (2, 'a'), (2, 'b'), (3, 'c'), (6, 'd')]
+    result = [(item, list(matches)) for item, matches in merge_join(outer, inner, int, first)]
+    assert result == [
+        (1, []),
+        (2, [(2, 'a'), (2, 'b')]),
+        (2, [(2, 'a'), (2, 'b')]),
+        (4, []),
+        (6, [(6, 'd')]),
+    ]
+
+
+def test_merge_join_is_lazy():
+    def inner():
+        yield (1, 'a')
+        yield (2, 'b')
+        raise AssertionError('the inner input should not be read any further')
+
+    pairs = merge_join(iter([1]), inner(), int, first)
+    assert next(pairs) == (1, [(1, 'a')])
+
+
+def test_partitioned_hash_join_spills():
+    outer = list(range(100))
+    inner = [(key % 50, key) for key in range(200)]
+    expected = {item: [pair for pair in inner if pair[0] == item] for item in outer}
+
+    in_memory = list(partitioned_hash_join(outer, inner, int, first, memory_budget=1000))
+    assert [item for item, _ in in_memory] == outer
+    assert {item: list(matches) for item, matches in in_memory} == expected
+
+    spilled = list(partitioned_hash_join(outer, inner, int, first, memory_budget=10))
+    assert sorted(item for item, _ in spilled) == outer
+    assert {item: list(matches) for item, matches in spilled} == expected
+
+
+def test_partitioned_hash_join_respects_budget(monkeypatch):
+    sizes = []
+
+    class RecordingLookup(Lookup):
+        @classmethod
+        def build(cls, items, *args, **kwargs):
+            lookup = super().build(items, *args, **kwargs)
+            sizes.append(sum(map(len, lookup.values())))
+            return lookup
+
+    monkeypatch.setattr('querpyable.joins.Lookup', RecordingLookup)
+    outer = list(range(0, 5_000, 7))
+    inner = [(key % 5_000, key) for key in range(20_000)]
+    pairs = partitioned_hash_join(outer, inner, int, first, memory_budget=100)
+    result = {item: sorted(matches) for item, matches in pairs}
+    assert result == {item: [(item, item + n * 5_000) for n in range(4)] for item in outer}
+    assert max(sizes) <= 100
+
+    sizes.clear()
+    fits = list(partitioned_hash_join([1], inner[:100], int, first, memory_budget=100))
+    assert fits == [(1, [(1, 1)])]
+    assert sizes == [100]
+
+
+def test_partitioned_hash_join_with_a_single_key():
+    inner = [(0, n) for n in range(50)]
+    result = list(partitioned_hash_join([0, 1], inner, int, first, memory_budget=10))
+    assert sorted((item, len(matches)) for item, matches in result) == [(0, 50), (1, 0)]
+
+
+def test_lookup_get_returns_default_for_missing_keys():
+    lookup = Lookup.build(['apple', 'avocado', 'banana'], lambda word: word[0])
+    assert lookup['c'] == []
+    assert lookup.get('a') == ['apple', 'avocado']
+    assert lookup.get('c') is None
+    assert lookup.get('c', ()) == ()
+    assert 'c' not in lookup
@@ -0,0 +1,58 @@
+import pytest
+
+from querpyable import Queryable
+from querpyable.merging import merge_except, merge_intersect, merge_union
+from querpyable.optimizer import optimize, sort_keys
+from querpyable.pipeline import Stage
+
+
+def identity(x):
+    return x
+
+
+LEFT = [1, 2, 2, 4, 5, 7]
+RIGHT = [2, 3, 5, 5, 8]
+
+
+@pytest.mark.parametrize('reverse', [False, True])
+def test_merge_set_operations(reverse):
+    left, right = sorted(LEFT, reverse=reverse), sorted(RIGHT, reverse=reverse)
+    order = lambda items: sorted(items, reverse=reverse)
+    assert list(merge_union(left, right, identity, reverse)) == order([1, 2, 3, 4, 5, 7, 8])
+    assert list(merge_intersect(left, right, identity, reverse)) == order([2, 5])
+    assert list(merge_except(left, right, identity, reverse)) == order([1, 4, 7])
+
+
+def test_merge_sorted_is_stable():
+    shards = [[(1, 'a'), (3, 'a')], [(1, 'b'), (2, 'b')], [(0, 'c'), (3, 'c')]]
+    result = Queryable.merge_sorted(*shards, key='[0]').to_list()
+    assert result == [(0, 'c'), (1, 'a'), (1, 'b'), (2, 'b'), (3, 'a'), (3, 'c')]
+    descending = Queryable.merge_sorted([5, 3], [4, 1], descending=True)
+    assert descending.to_list() == [5, 4, 3, 1]
+
+
+def test_order_by_after_known_sort_is_skipped():
+    stages = (
+        Stage('assume_sorted', (((identity, False),),)),
+        Stage('where', (bool,)),
+        Stage('order_by', (((identity, False),),)),
+    )
+    assert optimize(stages) == (Stage('where', (bool,)),)
+    assert sort_keys(stages) == ((identity, False),)
+    assert sort_keys((*stages, Stage('select', (str,)))) is None
+
+    numbers = Queryable([3, 1, 2]).assume_sorted()
+    assert numbers.order_by(identity).to_list() == [1, 2, 3]
+
+
+def test_set_operators_merge_sorted_sequences():
+    left = Queryable(LEFT).assume_sorted()
+    right = Queryable(RIGHT).assume_sorted()
+    assert left.union(right).to_list() == [1, 2, 3, 4, 5, 7, 8]
+    assert left.intersect(right).to_list() == [2, 5]
+    assert left.except_for(right).to_list() == [1, 4, 7]
+    assert left.except_for(right)._sort_keys() == left._sort_keys()
+
+    events = Queryable([{'ts': 1}, {'ts': 3}]).assume_sorted('["ts"]')
+    others = Queryable([{'ts': 2}, {'ts': 3}]).order_by('["ts"]')
+    assert events.union(others, key='["ts"]').to_list() == [{'ts': 1}, {'ts': 2}, {'ts': 3}]
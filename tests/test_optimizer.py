@@ -0,0 +1,54 @@
+from querpyable.optimizer import optimize
+from querpyable.pipeline import Stage
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+def is_positive(x):
+    return x > 0
+
+
+def double(x):
+    return x * 2
+
+
+def test_optimize_merges_where():
+    stages = (Stage("where", (is_even,)), Stage("where", (is_positive,)))
+    assert optimize(stages) == (Stage("where", (is_even, is_positive)),)
+
+
+def test_optimize_collapses_skip_and_take():
+    stages = (Stage("skip", (2,)), Stage("skip", (3,)), Stage("take", (5,)), Stage("take", (2,)))
+    assert optimize(stages) == (Stage("skip", (5,)), Stage("take", (2,)))
+
+
+def test_optimize_pushes_take_through_select():
+    stages = (Stage("select", (double,)), Stage("take", (3,)))
+    assert optimize(stages) == (Stage("take", (3,)), Stage("select", (double,)))
+
+
+def test_optimize_drops_order_by_before_count():
+    stages = (
+        Stage("where", (is_even,)),
+        Stage("order_by", (((double, False),),)),
+        Stage("where", (is_positive,)),
+    )
+    assert optimize(stages) == stages
+    assert optimize(stages, "count") == (Stage("where", (is_even, is_positive)),)
+
+
+def test_optimize_keeps_order_by_before_take():
+    stages = (Stage("order_by", (((double, False),),)), Stage("take", (3,)))
+    assert optimize(stages, "count") == (Stage("top_k", (((double, False),), 3)),)
+
+
+def test_optimize_replaces_order_by_take_with_top_k():
+    stages = (
+        Stage("order_by", (((double, True),),)),
+        Stage("select", (double,)),
+        Stage("take", (3,)),
+    )
+    assert optimize(stages) == (Stage("top_k", (((double, True),), 3)), Stage("select", (double,)))
+    assert optimize(stages[:1], "first") == (Stage("top_k", (((double, True),), 1)),)
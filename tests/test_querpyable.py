@@ -1,6 +1,13 @@
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from collections.abc import Sequence
+
 import pytest
 
-from querpyable import Queryable
+from querpyable import Fold, Queryable, parallel
 
 
 @pytest.fixture
@@ -90,7 +97,7 @@ def test_queryable_order_by_descending(flattened_list):
 def test_queryable_then_by(flattened_list):
     queryable = Queryable(flattened_list)
     result = queryable.order_by(lambda x: -x).then_by(lambda x: x).to_list()
-    assert result == [1, 2, 2, 3, 4, 5, 5]
+    assert result == [5, 5, 4, 3, 2, 2, 1]
 
 
 def test_queryable_then_by_descending(flattened_list):
@@ -350,3 +357,638 @@ def test_to_dictionary():
     expected_result = {'John': 30, 'Jane': 25, 'Mike': 35}
 
     assert result == expected_result
+
+
+def test_fused_chain(flattened_list):
+    queryable = (
+        Queryable(flattened_list + ['a', 'b'])
+        .of_type(int)
+        .where(lambda x: x > 1)
+        .select(lambda x: [x, x * 10])
+        .select_many(lambda x: x)
+        .skip(1)
+        .take(5)
+    )
+    assert queryable.to_list() == [20, 2, 20, 3, 30]
+    assert queryable.to_list() == [20, 2, 20, 3, 30]
+
+
+def test_fused_take_is_lazy():
+    pulled = []
+
+    def source():
+        for item in range(10):
+            pulled.append(item)
+            yield item
+
+    result = Queryable(source()).where(lambda x: x % 2 == 0).take(2).to_list()
+    assert result == [0, 2]
+    assert pulled == [0, 1, 2]
+
+
+def test_fused_long_chain():
+    queryable = Queryable(range(100))
+    for _ in range(50):
+        queryable = queryable.select(lambda x: x + 1).select_many(lambda x: [x])
+    assert queryable.take(3).to_list() == [50, 51, 52]
+
+
+def test_count_skips_order_by(flattened_list):
+    calls = []
+
+    def key(x):
+        calls.append(x)
+        return x
+
+    queryable = Queryable(flattened_list).order_by(key).where(lambda x: x > 2)
+    assert queryable.count() == 4
+    assert calls == []
+    assert queryable.to_list() == [3, 4, 5, 5]
+    assert calls == flattened_list
+
+
+def test_count_predicate(flattened_list):
+    assert Queryable(flattened_list).count(lambda x: x > 2) == 4
+
+
+def test_order_by_take_top_k():
+    data = [(3, 'a'), (1, 'b'), (3, 'c'), (2, 'd'), (1, 'e')]
+    queryable = Queryable(data)
+    assert queryable.order_by(lambda x: x[0]).take(3).to_list() == [(1, 'b'), (1, 'e'), (2, 'd')]
+    assert queryable.order_by_descending(lambda x: x[0]).take(2).to_list() == [(3, 'a'), (3, 'c')]
+    assert queryable.order_by_descending(lambda x: x[0]).first() == (3, 'a')
+    assert queryable.order_by(lambda x: x[0]).take(0).to_list() == []
+    assert queryable.order_by(lambda x: x[0]).take(2).count() == 2
+
+
+def test_queryable_then_by_composite_keys():
+    data = [('b', 2, 'x'), ('a', 1, 'y'), ('b', 1, 'z'), ('a', 2, 'w'), ('b', 1, 'v')]
+    queryable = Queryable(data)
+    result = queryable.order_by(lambda x: x[0]).then_by_descending(lambda x: x[1]).to_list()
+    assert result == [('a', 2, 'w'), ('a', 1, 'y'), ('b', 2, 'x'), ('b', 1, 'z'), ('b', 1, 'v')]
+    result = (
+        queryable.order_by_descending(lambda x: x[1])
+        .then_by(lambda x: x[0])
+        .then_by(lambda x: x[2])
+        .take(3)
+        .to_list()
+    )
+    assert result == [('a', 2, 'w'), ('b', 2, 'x'), ('a', 1, 'y')]
+
+
+def test_queryable_order_by_computes_keys_once(flattened_list):
+    calls = []
+
+    def key(x):
+        calls.append(x)
+        return x
+
+    Queryable(flattened_list).order_by(key).then_by_descending(key).to_list()
+    assert len(calls) == 2 * len(flattened_list)
+
+
+class CountingList(list):
+    def __init__(self, items):
+        super().__init__(items)
+        self.reads = 0
+
+    def __getitem__(self, index):
+        assert isinstance(index, int), 'the list should not be sliced'
+        self.reads += 1
+        return super().__getitem__(index)
+
+    def __iter__(self):
+        raise AssertionError('the list should not be iterated')
+
+
+class IteratedSequence(Sequence):
+    def __init__(self, items):
+        self.items = list(items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        raise AssertionError('the sequence should not be indexed')
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+def test_random_access_fast_paths():
+    data = CountingList(range(100))
+    queryable = Queryable(data).select(lambda x: x * 2).skip(10).take(50)
+    assert queryable.count() == 50
+    assert queryable.element_at(3) == 26
+    assert queryable.element_at_or_default(50, default=-1) == -1
+    assert queryable.last() == 118
+    assert queryable.last(lambda x: x % 4 == 0) == 116
+    assert queryable.last_or_default(lambda x: x > 1000, default=-1) == -1
+    assert data.reads == 1 + 1 + 2 + 50
+
+
+def test_skip_take_indexes_sequences_lazily():
+    data = CountingList(range(100))
+    iterator = iter(Queryable(data).skip(95).take(3))
+    assert next(iterator) == 95
+    assert data.reads == 1
+    assert list(iterator) == [96, 97]
+    assert data.reads == 3
+
+
+def test_other_sequences_are_iterated():
+    queryable = Queryable(IteratedSequence(range(10))).select(lambda x: x * 2).skip(2).take(3)
+    assert queryable.to_list() == [4, 6, 8]
+    assert queryable.count() == 3
+    assert queryable.element_at(1) == 6
+    assert queryable.last() == 8
+    assert queryable.reverse().to_list() == [8, 6, 4]
+
+
+def test_last_of_stream():
+    queryable = Queryable(iter([1, 2, 3, 4])).where(lambda x: x % 2 == 1)
+    assert queryable.last() == 3
+    with pytest.raises(ValueError):
+        Queryable.empty().where(lambda x: x).last()
+
+
+def test_queryable_reverse(flattened_list):
+    assert Queryable(flattened_list).reverse().to_list() == [5, 5, 4, 3, 2, 2, 1]
+    assert Queryable(iter(flattened_list)).reverse().take(2).to_list() == [5, 5]
+    assert Queryable(flattened_list).select(lambda x: x * 2).reverse().first() == 10
+
+
+def test_range_algebra():
+    numbers = Queryable.range(10**15, 3 * 10**15, 7).skip(5).take(10**14).reverse()
+    expected = range(10**15, 3 * 10**15, 7)[5 : 5 + 10**14][::-1]
+    assert numbers.count() == len(expected)
+    assert numbers.sum() == len(expected) * (expected[0] + expected[-1]) // 2
+    assert numbers.min() == expected[-1]
+    assert numbers.max() == expected[0]
+    assert numbers.first() == expected[0]
+    assert numbers.last() == expected[-1]
+    assert numbers.element_at(12345) == expected[12345]
+    assert numbers.contains(expected[777])
+    assert not numbers.contains(expected[0] + 1)
+    assert numbers.average() == (expected[0] + expected[-1]) / 2
+    assert numbers.take(3).to_list() == list(expected[:3])
+
+
+def test_range_sum():
+    assert Queryable.range(1, 101).sum() == 5050
+    assert Queryable.range(10, 0, -3).sum() == sum(range(10, 0, -3))
+    assert Queryable.range(5, 5).sum() == 0
+    assert Queryable.range(10).where(lambda x: x % 2 == 0).sum() == 20
+
+
+def test_to_lookup():
+    words = ['apple', 'avocado', 'banana', 'blueberry', 'cherry']
+    lookup = Queryable(words).to_lookup(lambda word: word[0], lambda word: len(word))
+    assert len(lookup) == 3
+    assert lookup['a'] == [5, 7]
+    assert lookup['b'] == [6, 9]
+    assert lookup['z'] == []
+    assert type(lookup['z']) is type(lookup['a'])
+    assert 'z' not in lookup
+
+
+def test_join_one_to_many():
+    outer = [1, 2, 3]
+    inner = [(1, 'a'), (2, 'b'), (2, 'c'), (4, 'd'), (1, 'e')]
+    expected = [(1, 'a'), (1, 'e'), (2, 'b'), (2, 'c')]
+    for source in (outer, iter(outer)):
+        result = Queryable(source).join(inner, lambda x: x, lambda x: x[0], lambda x, y: y)
+        assert result.to_list() == expected
+
+    result = Queryable(outer).group_join(inner, lambda x: x, lambda x: x[0], lambda x, ys: len(ys))
+    assert result.to_list() == [2, 2, 0]
+
+
+def test_join_strategies():
+    outer = [1, 2, 3]
+    inner = [(1, 'a'), (2, 'b'), (2, 'c'), (4, 'd')]
+    expected = [(1, 'a'), (2, 'b'), (2, 'c')]
+    for options in ({}, {'strategy': 'merge'}, {'memory_budget': 1}):
+        queryable = Queryable(outer).join(
+            inner, lambda x: x, lambda x: x[0], lambda x, y: y, **options
+        )
+        assert sorted(queryable.to_list()) == expected
+
+    result = Queryable(outer).group_join(
+        inner, lambda x: x, lambda x: x[0], lambda x, ys: len(ys), strategy='merge'
+    )
+    assert result.to_list() == [1, 2, 0]
+
+    with pytest.raises(ValueError):
+        queryable = Queryable(outer).join(
+            inner, lambda x: x, lambda x: x[0], lambda x, y: y, strategy='loop'
+        )
+        queryable.to_list()
+
+    with pytest.raises(ValueError, match='memory budget'):
+        queryable = Queryable(outer).join(
+            inner, lambda x: x, lambda x: x[0], lambda x, y: y, strategy='merge', memory_budget=1
+        )
+        queryable.to_list()
+
+
+def is_multiple_of_three(x):
+    return x % 3 == 0
+
+
+def with_negation(x):
+    return [x, -x]
+
+
+def double(x):
+    return x * 2
+
+
+def test_as_parallel():
+    queryable = (
+        Queryable.range(1000)
+        .as_parallel(workers=2, chunk_size=64)
+        .where(is_multiple_of_three)
+        .select(with_negation)
+        .select_many(list)
+    )
+    expected = [y for x in range(1000) if x % 3 == 0 for y in (x, -x)]
+    assert queryable.to_list() == expected
+    assert queryable.take(5).to_list() == expected[:5]
+    assert queryable.first() == 0
+
+    unordered = Queryable.range(1000).as_parallel(workers=2, chunk_size=64, ordered=False)
+    assert sorted(unordered.select(double).to_list()) == list(range(0, 2000, 2))
+
+
+def test_as_parallel_reuses_worker_processes():
+    queryable = Queryable.range(100).as_parallel(workers=2, chunk_size=10).select(getpid_of)
+    first = set(queryable.to_list())
+    assert queryable.first() in first
+    assert set(queryable.to_list()) == first
+    assert os.getpid() not in first
+
+
+def test_as_parallel_uses_the_default_start_method(monkeypatch):
+    requested = []
+    get_context = multiprocessing.get_context
+
+    def recording_get_context(method=None):
+        requested.append(method)
+        return get_context(method)
+
+    monkeypatch.setattr(multiprocessing, 'get_context', recording_get_context)
+    monkeypatch.setattr(parallel, '_POOLS', {})
+    queryable = Queryable.range(10).as_parallel(workers=1).select(double)
+    assert queryable.to_list() == list(range(0, 20, 2))
+    parallel._POOLS[(1, None)].shutdown()
+    assert requested == [None]
+
+
+def test_as_parallel_with_an_explicit_start_method():
+    queryable = Queryable.range(10).as_parallel(workers=1, start_method='spawn').select(double)
+    assert queryable.to_list() == list(range(0, 20, 2))
+
+
+def test_as_parallel_requires_picklable_callables():
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        Queryable.range(10).as_parallel(workers=1).select(lambda x: x).to_list()
+
+
+def getpid_of(_):
+    return os.getpid()
+
+
+def test_select_concurrent():
+    threads = set()
+
+    def slow_double(x):
+        threads.add(threading.get_ident())
+        time.sleep(0.01 * (x % 3))
+        return x * 2
+
+    queryable = Queryable(range(20)).select_concurrent(slow_double, max_workers=4)
+    assert queryable.to_list() == [x * 2 for x in range(20)]
+    assert len(threads) > 1
+
+    unordered = Queryable(range(20)).select_concurrent(slow_double, max_workers=4, ordered=False)
+    assert sorted(unordered.to_list()) == [x * 2 for x in range(20)]
+
+
+def test_select_concurrent_is_lazy():
+    pulled = []
+
+    def source():
+        for item in range(100):
+            pulled.append(item)
+            yield item
+
+    result = Queryable(source()).select_concurrent(lambda x: x, max_workers=2, buffer=4).take(2)
+    assert result.to_list() == [0, 1]
+    assert len(pulled) <= 6
+
+
+def test_group_by():
+    words = Queryable(['apple', 'banana', 'avocado'])
+    assert words.group_by(lambda word: word[0]).to_list() == [
+        ('a', ['apple', 'avocado']),
+        ('b', ['banana']),
+    ]
+    assert words.group_by(lambda word: word[0], len).to_list() == [('a', [5, 7]), ('b', [6])]
+
+
+def test_field_key_selectors():
+    people = Queryable(
+        [
+            {'name': 'Bob', 'age': 25, 'city': 'Berlin'},
+            {'name': 'Alice', 'age': 30, 'city': 'Athens'},
+            {'name': 'Carol', 'age': 25, 'city': 'Athens'},
+        ]
+    )
+    names = people.order_by('["age"]').then_by('["name"]').select(lambda p: p['name'])
+    assert names.to_list() == ['Bob', 'Carol', 'Alice']
+    names = people.order_by('["age"]').then_by_descending('["name"]').select(lambda p: p['name'])
+    assert names.to_list() == ['Carol', 'Bob', 'Alice']
+    assert people.to_dictionary('["name"]', '["age"]') == {'Bob': 25, 'Alice': 30, 'Carol': 25}
+    assert people.to_lookup('["city"]', '["name"]')['Athens'] == ['Alice', 'Carol']
+    assert people.group_by('["age"]', '["name"]').to_list() == [
+        (25, ['Bob', 'Carol']),
+        (30, ['Alice']),
+    ]
+
+    cities = [('Athens', 'GR'), ('Berlin', 'DE')]
+    result = people.join(cities, '["city"]', '[0]', lambda p, c: (p['name'], c[1])).to_list()
+    assert result == [('Bob', 'DE'), ('Alice', 'GR'), ('Carol', 'GR')]
+    result = people.group_join(cities, '["city"]', '[0]', lambda p, cs: len(cs)).to_list()
+    assert result == [1, 1, 1]
+
+
+def test_cache_replays_one_shot_sources():
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    squares = Queryable(iter(range(4))).select(square).cache()
+    assert squares.sum() == 14
+    assert squares.max() == 9
+    assert squares.where(lambda x: x > 1).to_list() == [4, 9]
+    assert calls == [0, 1, 2, 3]
+
+
+def test_cache_is_lazy_and_shared_between_iterators():
+    pulled = []
+
+    def source():
+        for item in range(5):
+            pulled.append(item)
+            yield item
+
+    cached = Queryable(source()).memoize()
+    first, second = iter(cached), iter(cached)
+    assert next(first) == 0
+    assert next(first) == 1
+    assert next(second) == 0
+    assert pulled == [0, 1]
+    assert list(zip(first, second)) == [(2, 1), (3, 2), (4, 3)]
+    assert pulled == [0, 1, 2, 3, 4]
+
+
+def test_cache_release_recomputes():
+    calls = []
+    cached = Queryable([1, 2]).select(lambda x: calls.append(x) or x).cache()
+    assert cached.to_list() == [1, 2]
+    assert cached.to_list() == [1, 2]
+    cached.release()
+    assert cached.to_list() == [1, 2]
+    assert calls == [1, 2, 1, 2]
+
+
+def test_cache_replays_errors():
+    def source():
+        yield 1
+        yield 2
+        raise RuntimeError('connection lost')
+
+    cached = Queryable(source()).cache()
+    first = iter(cached)
+    assert next(first) == 1
+    with pytest.raises(RuntimeError, match='connection lost'):
+        list(first)
+
+    for _ in range(2):
+        replayed = iter(cached)
+        assert next(replayed) == 1
+        assert next(replayed) == 2
+        with pytest.raises(RuntimeError, match='connection lost'):
+            next(replayed)
+
+
+def test_single_pass_terminals_over_generators():
+    assert Queryable(iter([1, 2, 3, 6])).average() == 3
+    assert Queryable.range(1, 5).average() == 2.5
+    assert Queryable(iter([1, 2])).default_if_empty(0).to_list() == [1, 2]
+    assert Queryable(iter([])).default_if_empty(0).to_list() == [0]
+
+
+def test_aggregate_many():
+    pulled = []
+
+    def source():
+        for item in [3, 1, 4, 1, 5]:
+            pulled.append(item)
+            yield item
+
+    result = Queryable(source()).aggregate_many(
+        n='count',
+        low='min',
+        high='max',
+        head='first',
+        tail='last',
+        product=Fold(1, lambda product, x: product * x),
+        text=('', lambda text, x: text + str(x), len),
+    )
+    assert result == {
+        'n': 5,
+        'low': 1,
+        'high': 5,
+        'head': 3,
+        'tail': 5,
+        'product': 60,
+        'text': 5,
+    }
+    assert pulled == [3, 1, 4, 1, 5]
+
+    with pytest.raises(ValueError, match='Unknown aggregate'):
+        Queryable([1]).aggregate_many(median='median')
+
+
+def test_stats():
+    stats = Queryable(iter([2, 4, 4, 4, 5, 5, 7, 9])).stats()
+    assert stats['count'] == 8
+    assert stats['sum'] == 40
+    assert (stats['min'], stats['max']) == (2, 9)
+    assert stats['mean'] == 5
+    assert stats['variance'] == pytest.approx(32 / 7)
+    assert stats['stddev'] == pytest.approx((32 / 7) ** 0.5)
+
+    empty = Queryable([]).stats()
+    assert empty == {
+        'count': 0,
+        'sum': 0,
+        'min': None,
+        'max': None,
+        'mean': None,
+        'variance': None,
+        'stddev': None,
+    }
+
+
+def test_approx_count_distinct():
+    numbers = Queryable.range(100_000).select(lambda x: x % 20_000)
+    assert numbers.approx_count_distinct() == pytest.approx(20_000, rel=0.05)
+    assert Queryable([]).approx_count_distinct() == 0
+
+
+def test_approx_percentile_and_quantiles():
+    numbers = Queryable.range(1, 10_001)
+    assert numbers.approx_percentile(50) == pytest.approx(5_000, rel=0.01)
+    assert numbers.approx_quantiles([0, 0.9, 1]) == pytest.approx([1, 9_000, 10_000], rel=0.01)
+    with pytest.raises(ValueError):
+        numbers.approx_quantiles([2])
+    with pytest.raises(ValueError):
+        Queryable([]).approx_percentile(50)
+
+
+def test_approx_top_frequent():
+    words = Queryable('the cat and the dog and the bird'.split())
+    assert words.approx_top_frequent(2) == [('the', 3), ('and', 2)]
+
+
+def test_distinct_by_key_with_unhashable_rows():
+    rows = [{'id': 1, 'tags': ['a']}, {'id': 2, 'tags': ['b']}, {'id': 1, 'tags': ['a']}]
+    assert Queryable(rows).distinct().to_list() == rows[:2]
+    assert Queryable(rows).distinct('["id"]').to_list() == rows[:2]
+    words = Queryable(['apple', 'avocado', 'banana'])
+    assert words.distinct_by(lambda word: word[0]).to_list() == ['apple', 'banana']
+
+
+def test_distinct_window():
+    events = Queryable([1, 2, 1, 3, 4, 1, 4])
+    assert events.distinct(window=2).to_list() == [1, 2, 3, 4, 1]
+    with pytest.raises(ValueError):
+        events.distinct(window=0)
+    with pytest.raises(ValueError):
+        events.distinct(window=2, false_positive_rate=0.01)
+
+
+def test_distinct_bloom_filter():
+    numbers = Queryable.range(10_000).select(lambda x: x % 5_000)
+    result = numbers.distinct(false_positive_rate=0.01, capacity=5_000).to_list()
+    assert 4_900 <= len(result) <= 5_000
+    assert len(set(result)) == len(result)
+    with pytest.raises(ValueError):
+        numbers.distinct(false_positive_rate=1.5)
+    with pytest.raises(ValueError):
+        numbers.distinct(false_positive_rate=0.01, capacity=0)
+
+
+def test_set_operators_preserve_order_with_key():
+    left = Queryable([{'id': 3}, {'id': 1}, {'id': 3}, {'id': 2}])
+    right = [{'id': 2}, {'id': 4}]
+    ids = lambda row: row['id']
+    assert left.union(right, key='["id"]').select(ids).to_list() == [3, 1, 2, 4]
+    assert left.intersect(right, key='["id"]').to_list() == [{'id': 2}]
+    assert left.except_for(right, key=ids).select(ids).to_list() == [3, 1]
+
+
+def test_set_operators_are_lazy():
+    consumed = []
+
+    def numbers():
+        for number in range(1_000):
+            consumed.append(number)
+            yield number
+
+    assert Queryable(numbers()).except_for([0, 2]).take(2).to_list() == [1, 3]
+    assert consumed == [0, 1, 2, 3]
+    consumed.clear()
+    assert Queryable(numbers()).intersect([1, 4]).to_list() == [1, 4]
+    assert consumed == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    ('build', 'expected'),
+    [
+        (lambda: Queryable.merge_sorted([1, 3], [2, 4]), [1, 2, 3, 4]),
+        (lambda: Queryable([1, 2]).union([2, 3]), [1, 2, 3]),
+        (lambda: Queryable([1, 2]).intersect([2, 3]), [2]),
+        (lambda: Queryable([1, 2]).except_for([2, 3]), [1]),
+        (lambda: Queryable([1, 2]).assume_sorted().union([2, 3]), [1, 2, 3]),
+        (lambda: Queryable([1, 1, 2]).distinct(), [1, 2]),
+        (lambda: Queryable([1, 1, 2]).distinct(false_positive_rate=0.01), [1, 2]),
+        (lambda: Queryable([1, 2, 3]).chunk(2), [(1, 2), (3,)]),
+        (lambda: Queryable([1, 2, 3]).window(2), [(1, 2), (2, 3)]),
+        (lambda: Queryable([1, 2, 3]).pairwise(), [(1, 2), (2, 3)]),
+        (lambda: Queryable([1, 2]).select_batch(lambda batch: batch[::-1]), [2, 1]),
+        (lambda: Queryable([1, 2]).where_batch(lambda batch: [x > 1 for x in batch]), [2]),
+        (lambda: Queryable([]).default_if_empty(0), [0]),
+        (lambda: Queryable([1, 2, 3]).group_by(lambda x: x % 2), [(1, [1, 3]), (0, [2])]),
+        (lambda: Queryable([1, 2]).join([2], lambda x: x, lambda x: x, max), [2]),
+    ],
+)
+def test_operators_can_be_iterated_twice(build, expected):
+    queryable = build()
+    assert queryable.to_list() == expected
+    assert queryable.to_list() == expected
+
+    assert Queryable(range(7)).chunk(3).to_list() == [(0, 1, 2), (3, 4, 5), (6,)]
+    assert Queryable([]).chunk(3).to_list() == []
+    assert Queryable.range(10**9).chunk(2).take(2).to_list() == [(0, 1), (2, 3)]
+    with pytest.raises(ValueError):
+        Queryable([1]).chunk(0)
+
+
+def test_window():
+    numbers = Queryable(range(6))
+    assert numbers.window(3).to_list() == [(0, 1, 2), (1, 2, 3), (2, 3, 4), (3, 4, 5)]
+    assert numbers.window(2, step=2).to_list() == [(0, 1), (2, 3), (4, 5)]
+    assert numbers.window(2, step=3).to_list() == [(0, 1), (3, 4)]
+    assert numbers.window(7).to_list() == []
+    assert Queryable.range(10**9).window(2).take(2).to_list() == [(0, 1), (1, 2)]
+    with pytest.raises(ValueError):
+        numbers.window(2, step=0)
+
+
+def test_pairwise():
+    assert Queryable([3, 5, 4]).pairwise().to_list() == [(3, 5), (5, 4)]
+    assert Queryable([1]).pairwise().to_list() == []
+    assert Queryable([]).pairwise().to_list() == []
+
+
+def test_select_batch():
+    calls = []
+
+    def double(batch):
+        calls.append(len(batch))
+        return [item * 2 for item in batch]
+
+    assert Queryable(range(10)).select_batch(double, size=4).to_list() == list(range(0, 20, 2))
+    assert calls == [4, 4, 2]
+    calls.clear()
+    numbers = Queryable.range(10**9).select_batch(double, size=4)
+    assert numbers.take(5).to_list() == [0, 2, 4, 6, 8]
+    assert calls == [4, 4]
+    with pytest.raises(ValueError):
+        Queryable([1, 2]).select_batch(lambda batch: batch[:1]).to_list()
+    with pytest.raises(ValueError):
+        Queryable([1]).select_batch(double, size=0)
+
+
+def test_where_batch():
+    numbers = Queryable(range(10))
+    even = numbers.where_batch(lambda batch: [item % 2 == 0 for item in batch], size=3)
+    assert even.to_list() == [0, 2, 4, 6, 8]
+    with pytest.raises(ValueError):
+        numbers.where_batch(lambda batch: []).to_list()
@@ -0,0 +1,75 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from querpyable import Queryable
+
+
+def test_to_lines(tmp_path):
+    path = tmp_path / 'out.txt'
+    assert Queryable(range(5)).to_lines(path) == 5
+    assert path.read_text(encoding='utf-8') == '0\n1\n2\n3\n4\n'
+    assert Queryable.from_lines(path).to_list() == ['0', '1', '2', '3', '4']
+
+
+def test_to_jsonl_gzip(tmp_path):
+    path = tmp_path / 'out.jsonl.gz'
+    records = [{'user': index, 'name': 'é'} for index in range(2_500)]
+    assert Queryable(records).to_jsonl(path) == 2_500
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        assert [json.loads(line) for line in file] == records
+
+
+def test_to_csv(tmp_path):
+    path = tmp_path / 'out.csv'
+    rows = [{'region': 'eu', 'amount': 10}, {'region': 'us', 'note': 'a, b'}]
+    assert Queryable(rows).to_csv(path, columns=['region', 'amount', 'note']) == 2
+    assert Queryable.from_csv(path).to_list() == [
+        {'region': 'eu', 'amount': '10', 'note': ''},
+        {'region': 'us', 'amount': '', 'note': 'a, b'},
+    ]
+    assert Queryable([(1, 2), (3, 4)]).to_csv(path) == 2
+    assert path.read_bytes() == b'1,2\r\n3,4\r\n'
+    assert Queryable([]).to_csv(path, columns=['a']) == 0
+    assert path.read_bytes() == b'a\r\n'
+
+
+def test_write_to():
+    file = io.StringIO()
+    assert Queryable(range(3)).write_to(file, 'jsonl', batch_size=2) == 3
+    assert file.getvalue() == '0\n1\n2\n'
+    with pytest.raises(ValueError):
+        Queryable([]).write_to(file, 'xml')
+    with pytest.raises(ValueError):
+        Queryable([]).write_to(file, 'lines', columns=['a'])
+
+
+@pytest.mark.parametrize('format', ['lines', 'jsonl', 'csv'])
+@pytest.mark.parametrize('batch_size', [0, -1])
+def test_write_to_invalid_batch_size(format, batch_size):
+    with pytest.raises(ValueError, match='batch size'):
+        Queryable([(1,)]).write_to(io.StringIO(), format, batch_size=batch_size)
+
+
+def test_to_csv_writes_a_batch_at_once():
+    class RecordingFile(io.StringIO):
+        writes = 0
+
+        def write(self, text):
+            RecordingFile.writes += 1
+            return super().write(text)
+
+    file = RecordingFile()
+    rows = Queryable([{'a': index} for index in range(10)])
+    assert rows.write_to(file, 'csv', batch_size=4) == 10
+    assert RecordingFile.writes <= 4
+    assert file.getvalue().splitlines()[:3] == ['a', '0', '1']
+
+
+def test_to_lines_gzip_with_buffer_size(tmp_path):
+    path = tmp_path / 'out.txt.gz'
+    assert Queryable(range(1_000)).to_lines(path, buffer_size=64) == 1_000
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        assert file.read().split() == [str(index) for index in range(1_000)]
@@ -0,0 +1,117 @@
+import random
+from collections import Counter
+
+import pytest
+
+from querpyable import (
+    BloomFilter,
+    CountMinSketch,
+    HyperLogLog,
+    Queryable,
+    SpaceSaving,
+    TDigest,
+)
+
+
+def test_hyperloglog_estimate():
+    sketch = HyperLogLog.from_error(0.01)
+    sketch.update(range(100_000))
+    sketch.update(range(50_000))
+    assert sketch.estimate() == pytest.approx(100_000, rel=0.05)
+
+
+def test_hyperloglog_small_cardinality():
+    sketch = HyperLogLog()
+    sketch.update(['a', 'b', 'c', 'a'])
+    assert sketch.estimate() == 3
+
+
+def test_hyperloglog_distinguishes_colliding_builtin_hashes():
+    assert Queryable([-1, -2]).approx_count_distinct() == 2
+    assert Queryable([1, 1.0, True, 'a', b'a']).approx_count_distinct() == 3
+
+
+def test_hyperloglog_merge():
+    left, right = HyperLogLog(), HyperLogLog()
+    left.update(range(10_000))
+    right.update(range(5_000, 15_000))
+    left.merge(right)
+    assert left.estimate() == pytest.approx(15_000, rel=0.05)
+
+
+def test_hyperloglog_merge_precision_mismatch():
+    with pytest.raises(ValueError):
+        HyperLogLog(10).merge(HyperLogLog(12))
+
+
+def test_tdigest_quantiles():
+    digest = TDigest()
+    digest.update(range(100_001))
+    assert digest.quantile(0) == 0
+    assert digest.quantile(1) == 100_000
+    assert digest.quantile(0.5) == pytest.approx(50_000, rel=0.01)
+    assert digest.quantile(0.99) == pytest.approx(99_000, rel=0.001)
+
+
+def test_tdigest_tails():
+    values = list(range(100_000))
+    random.Random(0).shuffle(values)
+    digest = TDigest()
+    digest.update(values)
+    assert digest.quantile(0.00001) == pytest.approx(1, abs=2)
+    assert digest.quantile(0.99999) == pytest.approx(99_999, abs=2)
+    assert digest.quantile(0.0001) == pytest.approx(10, abs=25)
+    assert digest.quantile(0.9999) == pytest.approx(99_990, abs=25)
+
+
+def test_tdigest_merge():
+    left, right = TDigest(), TDigest()
+    left.update(range(0, 10_000, 2))
+    right.update(range(1, 10_000, 2))
+    left.merge(right)
+    assert left.count == 10_000
+    assert left.quantile(0.9) == pytest.approx(9_000, rel=0.01)
+
+
+def test_tdigest_errors():
+    with pytest.raises(ValueError):
+        TDigest().quantile(0.5)
+    digest = TDigest()
+    digest.add(1)
+    with pytest.raises(ValueError):
+        digest.quantile(1.5)
+
+
+def test_space_saving_top():
+    items = [i % 10 for i in range(1_000)] + [3] * 500 + [7] * 200 + list(range(100, 5_000))
+    sketch = SpaceSaving(50)
+    sketch.update(items)
+    assert [item for item, _ in sketch.top(2)] == [3, 7]
+    exact = Counter(items)
+    for item, count in sketch.top(5):
+        assert count >= exact[item]
+
+
+def test_count_min_sketch():
+    sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+    sketch.update(['a'] * 100 + ['b'] * 10 + [str(i) for i in range(1_000)])
+    assert 100 <= sketch.estimate('a') <= 100 + 0.01 * 1_110
+    assert sketch.estimate('b') >= 10
+
+    other = CountMinSketch(epsilon=0.01, delta=0.01)
+    other.add('a', 5)
+    sketch.merge(other)
+    assert sketch.estimate('a') >= 105
+
+    with pytest.raises(ValueError):
+        sketch.merge(CountMinSketch())
+
+
+def test_bloom_filter():
+    seen = BloomFilter(capacity=1_000, false_positive_rate=0.01)
+    added = [seen.add(i) for i in range(0, 2_000, 2)]
+    assert sum(added) > 990
+    assert all(i in seen for i in range(0, 2_000, 2))
+    false_positives = sum(i in seen for i in range(1, 20_000, 2))
+    assert false_positives < 0.03 * 10_000
+    assert not seen.add(0)
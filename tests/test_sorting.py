@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from querpyable import Queryable
+from querpyable.sorting import external_sort
+
+
+@pytest.mark.parametrize('memory_budget', [1, 7, 100, 10_000])
+def test_external_sort_matches_sorted(memory_budget):
+    items = [(random.randrange(50), index) for index in range(1_000)]
+    key = lambda item: item[0]
+    assert list(external_sort(items, key, False, memory_budget)) == sorted(items, key=key)
+    assert list(external_sort(items, key, True, memory_budget)) == sorted(
+        items, key=key, reverse=True
+    )
+
+
+def test_external_sort_merges_in_passes(monkeypatch):
+    monkeypatch.setattr('querpyable.sorting.MERGE_WIDTH', 3)
+    items = list(range(500, 0, -1))
+    assert list(external_sort(items, lambda x: x, False, 10)) == sorted(items)
+
+
+def test_external_sort_invalid_budget():
+    with pytest.raises(ValueError):
+        list(external_sort([1], lambda x: x, False, 0))
+
+
+def test_order_by_with_memory_budget():
+    people = [{'name': f'p{index}', 'age': index % 7} for index in range(200)]
+    result = (
+        Queryable(people)
+        .order_by('["age"]', memory_budget=16)
+        .then_by_descending('["name"]')
+        .to_list()
+    )
+    expected = sorted(sorted(people, key=lambda p: p['name'], reverse=True), key=lambda p: p['age'])
+    assert result == expected
+    descending = Queryable(range(100)).order_by_descending(lambda x: x % 10, memory_budget=8)
+    assert descending.to_list() == sorted(range(100), key=lambda x: x % 10, reverse=True)
+    top = Queryable(range(100)).order_by(lambda x: -x, memory_budget=8).take(3)
+    assert top.to_list() == [99, 98, 97]
+
+
+def test_external_sort_bounds_open_spill_files(monkeypatch):
+    from querpyable.spill import SpillFile
+
+    open_files = set()
+    peak = []
+
+    class CountingSpillFile(SpillFile):
+        def __init__(self):
+            super().__init__()
+            open_files.add(self)
+            peak.append(len(open_files))
+
+        def close(self):
+            open_files.discard(self)
+            super().close()
+
+    monkeypatch.setattr('querpyable.sorting.SpillFile', CountingSpillFile)
+    monkeypatch.setattr('querpyable.sorting.MERGE_WIDTH', 4)
+    items = [random.random() for _ in range(3_000)]
+    assert list(external_sort(items, lambda x: x, False, 10)) == sorted(items)
+    assert max(peak) <= 4 * 4
+    assert not open_files
+
+
+def test_external_sort_respects_budget(monkeypatch):
+    sizes = []
+
+    def recording_sorted(items, **kwargs):
+        items = list(items)
+        sizes.append(len(items))
+        return sorted(items, **kwargs)
+
+    monkeypatch.setattr('querpyable.sorting.sorted', recording_sorted, raising=False)
+    items = list(range(23, 0, -1))
+    assert list(external_sort(items, lambda x: x, False, 5)) == sorted(items)
+    assert sizes == [5, 5, 5, 5, 3]
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from querpyable import Queryable
+
+
+@pytest.fixture(params=['\n', '\r\n', '\r'])
+def log_file(request, tmp_path):
+    path = tmp_path / 'app.log'
+    path.write_bytes(request.param.join(['first', 'second', 'third', '']).encode())
+    return path
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_from_lines(log_file, use_mmap):
+    lines = Queryable.from_lines(log_file, use_mmap=use_mmap)
+    assert lines.to_list() == ['first', 'second', 'third']
+    assert lines.to_list() == ['first', 'second', 'third']
+    assert lines.take(1).to_list() == ['first']
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_from_lines_utf16(tmp_path, use_mmap):
+    path = tmp_path / 'wide.log'
+    path.write_bytes('é\r\nü\rz\n'.encode('utf-16'))
+    lines = Queryable.from_lines(path, encoding='utf-16', use_mmap=use_mmap)
+    assert lines.to_list() == ['é', 'ü', 'z']
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_from_lines_keeps_blank_lines(tmp_path, use_mmap):
+    path = tmp_path / 'blank.log'
+    path.write_bytes(b'first\n\r\nlast\r')
+    lines = Queryable.from_lines(path, use_mmap=use_mmap)
+    assert lines.to_list() == ['first', '', 'last']
+
+
+def test_sources_return_the_calling_class(tmp_path):
+    class Lines(Queryable):
+        pass
+
+    path = tmp_path / 'rows.jsonl'
+    path.write_text('{"a": 1}\n', encoding='utf-8')
+    assert isinstance(Lines.from_lines(path), Lines)
+    assert isinstance(Lines.from_csv(path), Lines)
+    assert isinstance(Lines.from_jsonl(path), Lines)
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_from_lines_empty_file(tmp_path, use_mmap):
+    path = tmp_path / 'empty.log'
+    path.write_bytes(b'')
+    assert Queryable.from_lines(path, use_mmap=use_mmap).to_list() == []
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_from_csv(tmp_path, use_mmap):
+    path = tmp_path / 'sales.csv'
+    path.write_text('region,amount,note\neu,10,"a, b"\nus,20,"multi\nline"\n', encoding='utf-8')
+    rows = Queryable.from_csv(path, use_mmap=use_mmap).to_list()
+    assert rows[1] == {'region': 'us', 'amount': '20', 'note': 'multi\nline'}
+    amounts = Queryable.from_csv(path, columns=['amount'], use_mmap=use_mmap)
+    assert amounts.to_list() == [{'amount': '10'}, {'amount': '20'}]
+    pairs = Queryable.from_csv(path, columns=['note', 'region']).first()
+    assert pairs == {'note': 'a, b', 'region': 'eu'}
+    with pytest.raises(ValueError):
+        Queryable.from_csv(path, columns=['missing']).to_list()
+
+
+@pytest.mark.parametrize('columns', [None, ['b'], ['a', 'c']])
+def test_from_csv_blank_and_short_rows(tmp_path, columns):
+    path = tmp_path / 'rows.csv'
+    path.write_text('a,b,c\n1,2,3\n\n4,5\n', encoding='utf-8')
+    rows = [{'a': '1', 'b': '2', 'c': '3'}, {'a': '4', 'b': '5', 'c': None}]
+    names = columns or ['a', 'b', 'c']
+    expected = [{name: row[name] for name in names} for row in rows]
+    assert Queryable.from_csv(path, columns=columns).to_list() == expected
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_from_jsonl(tmp_path, use_mmap):
+    path = tmp_path / 'clicks.jsonl'
+    records = [{'user': 1, 'page': 'a', 'ts': 3}, {'user': 2, 'page': 'b'}]
+    path.write_text('\n'.join(map(json.dumps, records)) + '\n\n', encoding='utf-8')
+    assert Queryable.from_jsonl(path, use_mmap=use_mmap).to_list() == records
+    projected = Queryable.from_jsonl(path, fields=['user', 'ts'], use_mmap=use_mmap)
+    assert projected.to_list() == [{'user': 1, 'ts': 3}, {'user': 2, 'ts': None}]
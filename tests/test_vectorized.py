@@ -0,0 +1,86 @@
+import pytest
+
+from querpyable import ArrayQueryable
+
+np = pytest.importorskip('numpy')
+
+
+def test_vectorised_operators():
+    numbers = ArrayQueryable(np.arange(10))
+    even = numbers.where(lambda x: x % 2 == 0, vectorized=True)
+    result = even.select(lambda x: x * 10, vectorized=True).skip(1).take(3)
+    assert isinstance(result.to_array(), np.ndarray)
+    assert result.to_list() == [20, 40, 60]
+    assert list(result.reverse()) == [60, 40, 20]
+
+
+def test_element_wise_by_default():
+    numbers = ArrayQueryable(np.array([1, -2, 3]))
+    assert numbers.select(lambda x: x if x > 0 else 0).to_list() == [1, 0, 3]
+    assert numbers.select(lambda x: str(x)).to_list() == ['1', '-2', '3']
+    assert numbers.select(lambda x: (x, x)).to_list() == [(1, 1), (-2, -2), (3, 3)]
+    assert numbers.where(lambda x: x > 0 and x < 3).to_list() == [1]
+
+
+def test_element_wise_callables_are_called_once_per_element():
+    calls = []
+
+    def record(x):
+        calls.append(x)
+        return x > 1
+
+    assert ArrayQueryable(np.array([1, 2, 3])).where(record).to_list() == [2, 3]
+    assert calls == [1, 2, 3]
+
+
+def test_element_wise_results_are_not_mistaken_for_arrays():
+    numbers = ArrayQueryable(np.array([1, 2]))
+    pairs = numbers.select(lambda x: np.array([x, -x])).to_list()
+    assert [pair.tolist() for pair in pairs] == [[1, -1], [2, -2]]
+
+
+def test_ufuncs_are_vectorised():
+    numbers = ArrayQueryable(np.array([1.0, 4.0, 9.0]))
+    assert numbers.select(np.sqrt).to_list() == [1.0, 2.0, 3.0]
+    assert numbers.where(np.vectorize(lambda x: x > 1)).to_list() == [4.0, 9.0]
+
+
+def test_vectorised_callables_must_return_one_result_per_element():
+    numbers = ArrayQueryable(np.array([1, 2, 3]))
+    with pytest.raises(ValueError, match='3 elements'):
+        numbers.select(np.sum, vectorized=True).to_list()
+
+
+def test_non_boolean_mask_is_truthiness():
+    numbers = ArrayQueryable(np.arange(5))
+    assert numbers.where(lambda x: x % 2).to_list() == [1, 3]
+    assert numbers.where(lambda x: x % 2, vectorized=True).to_list() == [1, 3]
+
+
+def test_reductions():
+    readings = ArrayQueryable(np.array([0.5, 2.0, 3.5, 1.0]))
+    assert readings.sum() == 7.0
+    assert readings.min() == 0.5
+    assert readings.max() == 3.5
+    assert readings.average() == 1.75
+    assert readings.count(lambda x: x > 1) == 2
+    assert readings.count(lambda x: x > 1, vectorized=True) == 2
+    assert readings.contains(2.0)
+    assert readings.any(lambda x: x > 3, vectorized=True)
+    assert not readings.all(lambda x: x > 1, vectorized=True)
+    assert type(readings.sum()) is float
+
+
+def test_queryable_operators_fall_back_to_python_objects():
+    numbers = ArrayQueryable(np.array([3, 1, 2]))
+    assert numbers.order_by(lambda x: x).to_list() == [1, 2, 3]
+    assert numbers.first() == 3
+    assert type(numbers.first()) is int
+    assert numbers.distinct().to_list() == [3, 1, 2]
+
+
+def test_query_is_deferred():
+    array = np.array([1, 2, 3])
+    query = ArrayQueryable(array).where(lambda x: x > 1)
+    array[0] = 5
+    assert query.to_list() == [5, 2, 3]